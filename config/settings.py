@@ -5,64 +5,148 @@ This module loads configuration from environment variables and provides
 a centralized settings object with validation and defaults.
 """
 
+import functools
 import os
-from dataclasses import dataclass, field
+import re
 from pathlib import Path
 from typing import List, Optional
 
 from dotenv import load_dotenv
 
-# Load environment variables from .env file if it exists
-load_dotenv()
+# Separator for ADDONS_PATHS, stripping surrounding whitespace in the split
+_PATH_SEPARATOR_RE = re.compile(r"\s*,\s*")
+
+# Cypher runtimes accepted by CYPHER_RUNTIME ("" keeps the server default)
+_CYPHER_RUNTIMES = ("", "pipelined", "slotted", "interpreted", "parallel")
+
+# Whether the .env file has already been loaded into the environment
+_dotenv_loaded = False
 
 
-@dataclass
 class Settings:
     """
     Application settings loaded from environment variables.
 
     All settings have sensible defaults for development and can be
-    overridden via environment variables or .env file.
+    overridden via environment variables or .env file (see ``from_env``).
     """
 
-    # Neo4j Configuration
-    neo4j_uri: str = field(default_factory=lambda: os.getenv("NEO4J_URI", "bolt://localhost:7687"))
-    neo4j_user: str = field(default_factory=lambda: os.getenv("NEO4J_USER", "neo4j"))
-    neo4j_password: str = field(default_factory=lambda: os.getenv("NEO4J_PASSWORD", "password"))
-
-    # Odoo Addons Paths
-    addons_paths: List[str] = field(default_factory=lambda: _parse_paths(
-        os.getenv("ADDONS_PATHS", "")
-    ))
-
-    # Performance Settings
-    batch_size: int = field(default_factory=lambda: int(os.getenv("BATCH_SIZE", "50")))
-    max_memory_percent: float = field(default_factory=lambda: float(os.getenv("MAX_MEMORY_PERCENT", "70.0")))
-    enable_cache: bool = field(default_factory=lambda: os.getenv("ENABLE_CACHE", "true").lower() == "true")
-    cache_dir: Path = field(default_factory=lambda: Path(os.getenv("CACHE_DIR", ".cache")))
-    enable_parallel: bool = field(default_factory=lambda: os.getenv("ENABLE_PARALLEL", "false").lower() == "true")
-    max_workers: int = field(default_factory=lambda: int(os.getenv("MAX_WORKERS", "4")))
-    enable_incremental: bool = field(default_factory=lambda: os.getenv("ENABLE_INCREMENTAL", "true").lower() == "true")
-
-    # Logging
-    log_level: str = field(default_factory=lambda: os.getenv("LOG_LEVEL", "INFO"))
-    log_file: Optional[str] = field(default_factory=lambda: os.getenv("LOG_FILE", "odoo_tracker.log"))
-
-    def __post_init__(self):
-        """Validate settings after initialization."""
+    __slots__ = (
+        "neo4j_uri",
+        "neo4j_user",
+        "neo4j_password",
+        "addons_paths",
+        "batch_size",
+        "megabatch_size",
+        "max_memory_percent",
+        "enable_cache",
+        "cache_dir",
+        "enable_parallel",
+        "max_workers",
+        "enable_incremental",
+        "auto_create_indexes",
+        "cypher_runtime",
+        "log_level",
+        "log_file",
+    )
+
+    def __init__(
+        self,
+        neo4j_uri: str = "bolt://localhost:7687",
+        neo4j_user: str = "neo4j",
+        neo4j_password: str = "password",
+        addons_paths: Optional[List[str]] = None,
+        batch_size: int = 50,
+        megabatch_size: int = 20000,
+        max_memory_percent: float = 70.0,
+        enable_cache: bool = True,
+        cache_dir: Path = Path(".cache"),
+        enable_parallel: bool = False,
+        max_workers: int = 4,
+        enable_incremental: bool = True,
+        auto_create_indexes: bool = True,
+        cypher_runtime: str = "",
+        log_level: str = "INFO",
+        log_file: Optional[str] = "odoo_tracker.log",
+    ):
+        """Initialize and validate settings."""
+        # Neo4j Configuration
+        self.neo4j_uri = neo4j_uri
+        self.neo4j_user = neo4j_user
+        self.neo4j_password = neo4j_password
+
+        # Odoo Addons Paths
+        self.addons_paths = addons_paths if addons_paths is not None else []
+
+        # Performance Settings
+        self.batch_size = batch_size
+        self.megabatch_size = megabatch_size
+        self.max_memory_percent = max_memory_percent
+        self.enable_cache = enable_cache
+        self.cache_dir = cache_dir
+        self.enable_parallel = enable_parallel
+        self.max_workers = max_workers
+        self.enable_incremental = enable_incremental
+
+        # Query Settings
+        self.auto_create_indexes = auto_create_indexes
+        self.cypher_runtime = cypher_runtime
+
+        # Logging
+        self.log_level = log_level
+        self.log_file = log_file
+
         self._validate()
 
+    @classmethod
+    def from_env(cls) -> "Settings":
+        """
+        Build settings from environment variables.
+
+        ``os.environ`` is bound once and every value is read from it in a
+        single pass.
+
+        Returns:
+            Settings instance
+        """
+        env = os.environ
+
+        return cls(
+            neo4j_uri=env.get("NEO4J_URI", "bolt://localhost:7687"),
+            neo4j_user=env.get("NEO4J_USER", "neo4j"),
+            neo4j_password=env.get("NEO4J_PASSWORD", "password"),
+            addons_paths=_parse_paths(env.get("ADDONS_PATHS", "")),
+            batch_size=int(env.get("BATCH_SIZE", "50")),
+            megabatch_size=int(env.get("MEGABATCH_SIZE", "20000")),
+            max_memory_percent=float(env.get("MAX_MEMORY_PERCENT", "70.0")),
+            enable_cache=env.get("ENABLE_CACHE", "true").lower() == "true",
+            cache_dir=Path(env.get("CACHE_DIR", ".cache")),
+            enable_parallel=env.get("ENABLE_PARALLEL", "false").lower() == "true",
+            max_workers=int(env.get("MAX_WORKERS", "4")),
+            enable_incremental=env.get("ENABLE_INCREMENTAL", "true").lower() == "true",
+            auto_create_indexes=env.get("AUTO_CREATE_INDEXES", "true").lower() == "true",
+            cypher_runtime=env.get("CYPHER_RUNTIME", "").lower(),
+            log_level=env.get("LOG_LEVEL", "INFO"),
+            log_file=env.get("LOG_FILE", "odoo_tracker.log"),
+        )
+
     def _validate(self):
         """Validate critical settings."""
         if self.batch_size <= 0:
             raise ValueError("BATCH_SIZE must be greater than 0")
 
+        if self.megabatch_size < self.batch_size:
+            raise ValueError("MEGABATCH_SIZE must be greater than or equal to BATCH_SIZE")
+
         if not (0 < self.max_memory_percent <= 100):
             raise ValueError("MAX_MEMORY_PERCENT must be between 0 and 100")
 
         if self.max_workers <= 0:
             raise ValueError("MAX_WORKERS must be greater than 0")
 
+        if self.cypher_runtime not in _CYPHER_RUNTIMES:
+            raise ValueError(f"Invalid CYPHER_RUNTIME: {self.cypher_runtime}")
+
         if self.log_level not in ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]:
             raise ValueError(f"Invalid LOG_LEVEL: {self.log_level}")
 
@@ -77,12 +161,15 @@ class Settings:
             "neo4j_user": self.neo4j_user,
             "addons_paths": self.addons_paths,
             "batch_size": self.batch_size,
+            "megabatch_size": self.megabatch_size,
             "max_memory_percent": self.max_memory_percent,
             "enable_cache": self.enable_cache,
             "cache_dir": str(self.cache_dir),
             "enable_parallel": self.enable_parallel,
             "max_workers": self.max_workers,
             "enable_incremental": self.enable_incremental,
+            "auto_create_indexes": self.auto_create_indexes,
+            "cypher_runtime": self.cypher_runtime,
             "log_level": self.log_level,
             "log_file": self.log_file,
         }
@@ -100,26 +187,28 @@ def _parse_paths(paths_str: str) -> List[str]:
     """
     if not paths_str:
         return []
-    return [p.strip() for p in paths_str.split(",") if p.strip()]
+    return [p for p in _PATH_SEPARATOR_RE.split(paths_str.strip()) if p]
+
 
+def _load_dotenv_once() -> None:
+    """Load environment variables from .env file (if it exists) on first use only."""
+    global _dotenv_loaded
 
-# Global settings instance
-_settings: Optional[Settings] = None
+    if not _dotenv_loaded:
+        load_dotenv()
+        _dotenv_loaded = True
 
 
-def get_settings(reload: bool = False) -> Settings:
+@functools.lru_cache(maxsize=1)
+def get_settings() -> Settings:
     """
     Get the global settings instance (singleton pattern).
 
-    Args:
-        reload: If True, reload settings from environment
+    The instance is cached; call ``get_settings.cache_clear()`` to reload
+    settings from the environment on the next call.
 
     Returns:
         Settings instance
     """
-    global _settings
-
-    if _settings is None or reload:
-        _settings = Settings()
-
-    return _settings
+    _load_dotenv_once()
+    return Settings.from_env()
@@ -9,12 +9,13 @@ This module handles all Neo4j interactions:
 
 Exports:
 - Neo4jConnection: Connection manager
+- NullConnection: Connection that discards all queries (dry runs)
 - OdooIndexer: Main indexing orchestrator
 - Schema components: Node labels, relationship types, properties
-- Functions: initialize_schema, verify_schema, get_database_stats
+- Functions: initialize_schema, verify_schema, get_database_stats, warm_cache
 """
 
-from graph.connection import Neo4jConnection
+from graph.connection import Neo4jConnection, NullConnection
 from graph.indexer import OdooIndexer
 from graph.schema import (
     NodeLabel,
@@ -24,11 +25,13 @@ from graph.schema import (
     FieldProperty,
     initialize_schema,
     verify_schema,
-    get_database_stats
+    get_database_stats,
+    warm_cache
 )
 
 __all__ = [
     "Neo4jConnection",
+    "NullConnection",
     "OdooIndexer",
     "NodeLabel",
     "RelationType",
@@ -37,5 +40,6 @@ __all__ = [
     "FieldProperty",
     "initialize_schema",
     "verify_schema",
-    "get_database_stats"
+    "get_database_stats",
+    "warm_cache"
 ]
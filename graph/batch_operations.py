@@ -5,8 +5,13 @@ This module provides functions to insert nodes and relationships in batches,
 minimizing network round-trips and transaction overhead.
 """
 
+import itertools
 import json
-from typing import List, Dict, Any
+import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from typing import Any, Dict, Final, Iterable, Iterator, List, Tuple
 from utils.logger import get_logger
 from graph.schema import (
     NodeLabel,
@@ -18,16 +23,69 @@ from graph.schema import (
 
 logger = get_logger(__name__)
 
+# Note: orjson is an optional, faster serializer for nested collections
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Exact value types handled by _serialize_for_neo4j (looked up via type())
+_JSON_TYPES = frozenset({list, dict})
+_PASSTHROUGH_TYPES = frozenset({bool, int, float, str, type(None)})
+
+# Field parameters whose parsed values can be collections (lists, tuples,
+# dicts). Every other field property is a scalar or None as produced by the
+# model parser, so it can be sent to Neo4j untouched.
+_COLLECTION_FIELD_KEYS = (
+    FieldProperty.DEFAULT,
+    FieldProperty.RELATED,
+    FieldProperty.DEPENDS,
+    FieldProperty.DOMAIN,
+    FieldProperty.SELECTION,
+    FieldProperty.STATES,
+    FieldProperty.DIGITS,
+)
+
+# Sort keys grouping field rows by model so MERGE/MATCH on the
+# (name, model_name) key walks its index in order
+_FIELD_SORT_KEY = itemgetter("model_name", "name")
+_FIELD_REL_SORT_KEY = itemgetter("model_name", "field_name")
+
 
 # ============================================================================
 # Helper Functions
 # ============================================================================
 
+def _to_json(value: Any) -> str:
+    """
+    Serialize a list or dict to a compact JSON string.
+
+    Uses orjson when available and falls back to the stdlib encoder (with the
+    same compact separators) for values orjson rejects or when it's missing.
+
+    Args:
+        value: List or dict to serialize
+
+    Returns:
+        JSON string
+    """
+    if not value:
+        return "[]" if type(value) is list else "{}"
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(value).decode()
+        except TypeError:
+            pass
+    return json.dumps(value, separators=(",", ":"))
+
+
 def _serialize_for_neo4j(value: Any) -> Any:
     """
     Convert Python values to Neo4j-compatible types.
 
     Neo4j cannot store nested collections, so we convert them to JSON strings.
+    Scalars (the common case) are returned untouched.
 
     Args:
         value: Python value to convert
@@ -35,86 +93,210 @@ def _serialize_for_neo4j(value: Any) -> Any:
     Returns:
         Neo4j-compatible value
     """
-    if value is None:
-        return None
-    elif isinstance(value, (list, dict)):
+    value_type = type(value)
+    if value_type in _JSON_TYPES:
         # Convert nested collections to JSON string
-        return json.dumps(value)
-    elif isinstance(value, bool):
+        return _to_json(value)
+    if value_type in _PASSTHROUGH_TYPES:
         return value
-    elif isinstance(value, (int, float, str)):
-        return value
-    else:
-        # Convert other types to string
-        return str(value)
+    # Convert other types to string
+    return str(value)
 
 
-def _prepare_fields_for_neo4j(fields: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+def _prepare_field(field: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Prepare field dictionaries for Neo4j insertion.
+    Prepare a single field dictionary for Neo4j insertion.
 
-    Converts nested collections to JSON strings.
+    Only the parameters that may hold collections are serialized; all-scalar
+    fields are just copied.
 
     Args:
-        fields: List of field dictionaries
+        field: Field dictionary
 
     Returns:
-        List of Neo4j-compatible field dictionaries
-    """
-    prepared = []
-    for field in fields:
-        prepared_field = {}
-        for key, value in field.items():
-            prepared_field[key] = _serialize_for_neo4j(value)
-        prepared.append(prepared_field)
+        Neo4j-compatible field dictionary
+    """
+    prepared = dict(field)
+    for key in _COLLECTION_FIELD_KEYS:
+        value = prepared.get(key)
+        if value is not None:
+            prepared[key] = _serialize_for_neo4j(value)
     return prepared
 
 
 # ============================================================================
-# Module Operations
+# Cypher Queries (built once at import time, never per batch)
 # ============================================================================
 
-def create_modules_batch(connection, modules: List[Dict[str, Any]]) -> Dict[str, int]:
+# Node payload dictionaries are keyed by property name (see graph.schema), so
+# node properties are assigned in one map assignment (SET n += row). Field
+# rows leave unset parameters out, so they replace the node's properties
+# (SET f = row) and a parameter removed from the code is cleared on
+# re-index. Query text is invariant and all data travels as parameters, so
+# the server plan cache hits.
+
+_MODULE_DEPENDENCIES_QUERY: Final[str] = f"""
+    UNWIND $batch AS dep
+    MATCH (from:{NodeLabel.MODULE} {{{ModuleProperty.NAME}: dep.from}})
+    MATCH (to:{NodeLabel.MODULE} {{{ModuleProperty.NAME}: dep.to}})
+    MERGE (from)-[r:{RelationType.DEPENDS_ON}]->(to)
+    RETURN count(r) as created
+"""
+
+_MODEL_INHERITANCE_QUERY: Final[str] = f"""
+    UNWIND $batch AS inh
+    MATCH (from:{NodeLabel.MODEL} {{{ModelProperty.NAME}: inh.from}})
+    MATCH (to:{NodeLabel.MODEL} {{{ModelProperty.NAME}: inh.to}})
+    MERGE (from)-[r:{RelationType.INHERITS_FROM}]->(to)
+    RETURN count(r) as created
+"""
+
+_MODEL_DELEGATION_QUERY: Final[str] = f"""
+    UNWIND $batch AS del
+    MATCH (from:{NodeLabel.MODEL} {{{ModelProperty.NAME}: del.from}})
+    MATCH (to:{NodeLabel.MODEL} {{{ModelProperty.NAME}: del.to}})
+    MERGE (from)-[r:{RelationType.DELEGATES_TO} {{field: del.field}}]->(to)
+    RETURN count(r) as created
+"""
+
+_FIELD_REFERENCES_QUERY: Final[str] = f"""
+    UNWIND $batch AS ref
+    MATCH (field:{NodeLabel.FIELD} {{
+        {FieldProperty.NAME}: ref.field_name,
+        {FieldProperty.MODEL_NAME}: ref.model_name
+    }})
+    MATCH (target:{NodeLabel.MODEL} {{{ModelProperty.NAME}: ref.comodel}})
+    MERGE (field)-[r:{RelationType.REFERENCES}]->(target)
+    RETURN count(r) as created
+"""
+
+# Modules, models, fields and their DEFINED_IN / BELONGS_TO relationships in
+# one statement. Subqueries run in order, so relationships see the new nodes.
+# A field is keyed by (name, model_name), so it is created even if its model
+# is missing; such fields are counted instead of getting a BELONGS_TO.
+_MODELS_WITH_RELATIONS_QUERY: Final[str] = f"""
+    CALL {{
+        UNWIND $modules AS module
+        MERGE (m:{NodeLabel.MODULE} {{{ModuleProperty.NAME}: module.name}})
+        SET m += module
+    }}
+    CALL {{
+        UNWIND $models AS model
+        MERGE (m:{NodeLabel.MODEL} {{{ModelProperty.NAME}: model.name}})
+        SET m += model
+    }}
+    CALL {{
+        UNWIND $model_module_rels AS rel
+        MATCH (model:{NodeLabel.MODEL} {{{ModelProperty.NAME}: rel.model}})
+        MATCH (module:{NodeLabel.MODULE} {{{ModuleProperty.NAME}: rel.module}})
+        MERGE (model)-[:{RelationType.DEFINED_IN}]->(module)
+    }}
+    CALL {{
+        UNWIND $fields AS field
+        MERGE (f:{NodeLabel.FIELD} {{
+            {FieldProperty.NAME}: field.{FieldProperty.NAME},
+            {FieldProperty.MODEL_NAME}: field.{FieldProperty.MODEL_NAME}
+        }})
+        SET f = field
+        WITH f, field
+        OPTIONAL MATCH (model:{NodeLabel.MODEL} {{{ModelProperty.NAME}: field.{FieldProperty.MODEL_NAME}}})
+        FOREACH (target IN CASE WHEN model IS NULL THEN [] ELSE [model] END |
+            MERGE (f)-[:{RelationType.BELONGS_TO}]->(target)
+        )
+        RETURN count(*) - count(model) as unmatched_fields
+    }}
+    RETURN unmatched_fields
+"""
+
+# Relationship phases that only need their endpoint nodes to exist:
+# name -> (query, optional sort key)
+_RELATIONSHIP_PHASES = {
+    "module_dependencies": (_MODULE_DEPENDENCIES_QUERY, None),
+    "model_inheritance": (_MODEL_INHERITANCE_QUERY, None),
+    "model_delegation": (_MODEL_DELEGATION_QUERY, None),
+    "field_references": (_FIELD_REFERENCES_QUERY, _FIELD_REL_SORT_KEY),
+}
+
+
+# ============================================================================
+# Load Operations
+# ============================================================================
+
+def create_models_with_relations_batch(
+    connection,
+    payload: Dict[str, List[Dict[str, Any]]]
+) -> Dict[str, int]:
     """
-    Create Module nodes in batch.
+    Create Module, Model and Field nodes with their relationships in one round-trip.
+
+    Runs the modules, models, DEFINED_IN, fields and BELONGS_TO operations as
+    a single Cypher statement so they share one transaction.
 
     Args:
         connection: Neo4jConnection instance
-        modules: List of module dictionaries
+        payload: Dictionary with "modules", "models" (property dicts keyed
+            by ModuleProperty/ModelProperty names), "model_module_rels"
+            ({"model": ..., "module": ...}) and "fields" (FieldProperty
+            dicts plus model_name) lists
 
     Returns:
         Dictionary with operation results
     """
-    if not modules:
+    modules = payload.get("modules", [])
+    models = payload.get("models", [])
+    model_module_rels = payload.get("model_module_rels", [])
+    fields = payload.get("fields", [])
+
+    total = len(modules) + len(models) + len(model_module_rels) + len(fields)
+    if not total:
         return {"created": 0, "errors": 0}
 
-    query = f"""
-        UNWIND $batch AS module
-        MERGE (m:{NodeLabel.MODULE} {{{ModuleProperty.NAME}: module.name}})
-        SET m.{ModuleProperty.DISPLAY_NAME} = module.display_name,
-            m.{ModuleProperty.VERSION} = module.version,
-            m.{ModuleProperty.CATEGORY} = module.category,
-            m.{ModuleProperty.SUMMARY} = module.summary,
-            m.{ModuleProperty.DESCRIPTION} = module.description,
-            m.{ModuleProperty.AUTHOR} = module.author,
-            m.{ModuleProperty.WEBSITE} = module.website,
-            m.{ModuleProperty.LICENSE} = module.license,
-            m.{ModuleProperty.INSTALLABLE} = module.installable,
-            m.{ModuleProperty.AUTO_INSTALL} = module.auto_install,
-            m.{ModuleProperty.APPLICATION} = module.application,
-            m.{ModuleProperty.FILE_PATH} = module.file_path,
-            m.{ModuleProperty.FILE_HASH} = module.file_hash
-        RETURN count(m) as created
-    """
+    parameters = {
+        "modules": modules,
+        "models": models,
+        "model_module_rels": model_module_rels,
+        "fields": sorted(map(_prepare_field, fields), key=_FIELD_SORT_KEY),
+    }
 
     try:
-        result = connection.execute_batch(query, modules)
-        created = result.get("nodes_created", 0) + result.get("properties_set", 0) // 13  # Approximate (13 properties now)
-        logger.info(f"Created/updated {created} Module nodes")
-        return {"created": created, "errors": 0}
+        result = connection.execute_write(_MODELS_WITH_RELATIONS_QUERY, parameters)
+        created = result.get("nodes_created", 0) + result.get("relationships_created", 0)
+        logger.debug(
+            "Created %d Module/Model/Field nodes and %d DEFINED_IN/BELONGS_TO relationships",
+            result.get("nodes_created", 0),
+            result.get("relationships_created", 0)
+        )
+
+        records = result.get("records") or [{}]
+        unmatched = records[0].get("unmatched_fields", 0)
+        if unmatched:
+            logger.warning("%d fields have no Model node to belong to", unmatched)
+        return {"created": created, "errors": unmatched}
     except Exception as e:
-        logger.error(f"Failed to create modules batch: {str(e)}")
-        return {"created": 0, "errors": len(modules)}
+        logger.error("Failed to create models with relations batch: %s", e)
+        return {"created": 0, "errors": total}
+
+
+# ============================================================================
+# Per-Operation Wrappers
+# ============================================================================
+
+# Thin wrappers kept for callers loading one kind of row at a time. Each call
+# is one statement in one transaction through the same queries as the
+# megabatch path above; the indexer itself uses that path directly.
+
+def create_modules_batch(connection, modules: List[Dict[str, Any]]) -> Dict[str, int]:
+    """
+    Create Module nodes in batch.
+
+    Args:
+        connection: Neo4jConnection instance
+        modules: List of module dictionaries
+
+    Returns:
+        Dictionary with operation results
+    """
+    return create_models_with_relations_batch(connection, {"modules": modules})
 
 
 def create_module_dependencies_batch(
@@ -126,36 +308,14 @@ def create_module_dependencies_batch(
 
     Args:
         connection: Neo4jConnection instance
-        dependencies: List of {"from": "module1", "to": "module2"} dictionaries
+        dependencies: List of {"from": "module1", "to": "module2"} dicts
 
     Returns:
         Dictionary with operation results
     """
-    if not dependencies:
-        return {"created": 0, "errors": 0}
-
-    query = f"""
-        UNWIND $batch AS dep
-        MATCH (from:{NodeLabel.MODULE} {{{ModuleProperty.NAME}: dep.from}})
-        MATCH (to:{NodeLabel.MODULE} {{{ModuleProperty.NAME}: dep.to}})
-        MERGE (from)-[r:{RelationType.DEPENDS_ON}]->(to)
-        RETURN count(r) as created
-    """
-
-    try:
-        result = connection.execute_batch(query, dependencies)
-        created = result.get("relationships_created", 0)
-        logger.info(f"Created {created} DEPENDS_ON relationships")
-        return {"created": created, "errors": 0}
-    except Exception as e:
-        logger.error(f"Failed to create module dependencies: {str(e)}")
-        return {"created": 0, "errors": len(dependencies)}
+    return _create_relationships_batch(connection, "module_dependencies", dependencies)
 
 
-# ============================================================================
-# Model Operations
-# ============================================================================
-
 def create_models_batch(connection, models: List[Dict[str, Any]]) -> Dict[str, int]:
     """
     Create Model nodes in batch.
@@ -167,29 +327,7 @@ def create_models_batch(connection, models: List[Dict[str, Any]]) -> Dict[str, i
     Returns:
         Dictionary with operation results
     """
-    if not models:
-        return {"created": 0, "errors": 0}
-
-    query = f"""
-        UNWIND $batch AS model
-        MERGE (m:{NodeLabel.MODEL} {{{ModelProperty.NAME}: model.name}})
-        SET m.{ModelProperty.DESCRIPTION} = model.description,
-            m.{ModelProperty.MODULE} = model.module,
-            m.{ModelProperty.FILE_PATH} = model.file_path,
-            m.{ModelProperty.LINE_NUMBER} = model.line_number,
-            m.{ModelProperty.CLASS_NAME} = model.class_name,
-            m.{ModelProperty.FILE_HASH} = model.file_hash
-        RETURN count(m) as created
-    """
-
-    try:
-        result = connection.execute_batch(query, models)
-        created = result.get("nodes_created", 0) + result.get("properties_set", 0) // 6  # Approximate
-        logger.info(f"Created/updated {created} Model nodes")
-        return {"created": created, "errors": 0}
-    except Exception as e:
-        logger.error(f"Failed to create models batch: {str(e)}")
-        return {"created": 0, "errors": len(models)}
+    return create_models_with_relations_batch(connection, {"models": models})
 
 
 def create_model_module_relationships_batch(
@@ -201,30 +339,12 @@ def create_model_module_relationships_batch(
 
     Args:
         connection: Neo4jConnection instance
-        relationships: List of {"model": "model_name", "module": "module_name"} dicts
+        relationships: List of {"model": "model.name", "module": "module_name"} dicts
 
     Returns:
         Dictionary with operation results
     """
-    if not relationships:
-        return {"created": 0, "errors": 0}
-
-    query = f"""
-        UNWIND $batch AS rel
-        MATCH (model:{NodeLabel.MODEL} {{{ModelProperty.NAME}: rel.model}})
-        MATCH (module:{NodeLabel.MODULE} {{{ModuleProperty.NAME}: rel.module}})
-        MERGE (model)-[r:{RelationType.DEFINED_IN}]->(module)
-        RETURN count(r) as created
-    """
-
-    try:
-        result = connection.execute_batch(query, relationships)
-        created = result.get("relationships_created", 0)
-        logger.info(f"Created {created} DEFINED_IN relationships")
-        return {"created": created, "errors": 0}
-    except Exception as e:
-        logger.error(f"Failed to create model-module relationships: {str(e)}")
-        return {"created": 0, "errors": len(relationships)}
+    return create_models_with_relations_batch(connection, {"model_module_rels": relationships})
 
 
 def create_model_inheritance_batch(
@@ -236,30 +356,12 @@ def create_model_inheritance_batch(
 
     Args:
         connection: Neo4jConnection instance
-        inheritances: List of {"from": "child_model", "to": "parent_model"} dicts
+        inheritances: List of {"from": "model1", "to": "model2"} dicts
 
     Returns:
         Dictionary with operation results
     """
-    if not inheritances:
-        return {"created": 0, "errors": 0}
-
-    query = f"""
-        UNWIND $batch AS inh
-        MATCH (from:{NodeLabel.MODEL} {{{ModelProperty.NAME}: inh.from}})
-        MATCH (to:{NodeLabel.MODEL} {{{ModelProperty.NAME}: inh.to}})
-        MERGE (from)-[r:{RelationType.INHERITS_FROM}]->(to)
-        RETURN count(r) as created
-    """
-
-    try:
-        result = connection.execute_batch(query, inheritances)
-        created = result.get("relationships_created", 0)
-        logger.info(f"Created {created} INHERITS_FROM relationships")
-        return {"created": created, "errors": 0}
-    except Exception as e:
-        logger.error(f"Failed to create model inheritance: {str(e)}")
-        return {"created": 0, "errors": len(inheritances)}
+    return _create_relationships_batch(connection, "model_inheritance", inheritances)
 
 
 def create_model_delegation_batch(
@@ -271,220 +373,282 @@ def create_model_delegation_batch(
 
     Args:
         connection: Neo4jConnection instance
-        delegations: List of {"from": "model", "to": "delegated_model", "field": "field_name"}
+        delegations: List of {"from": "model1", "to": "model2", "field": "field_name"} dicts
 
     Returns:
         Dictionary with operation results
     """
-    if not delegations:
-        return {"created": 0, "errors": 0}
-
-    query = f"""
-        UNWIND $batch AS del
-        MATCH (from:{NodeLabel.MODEL} {{{ModelProperty.NAME}: del.from}})
-        MATCH (to:{NodeLabel.MODEL} {{{ModelProperty.NAME}: del.to}})
-        MERGE (from)-[r:{RelationType.DELEGATES_TO} {{field: del.field}}]->(to)
-        RETURN count(r) as created
-    """
-
-    try:
-        result = connection.execute_batch(query, delegations)
-        created = result.get("relationships_created", 0)
-        logger.info(f"Created {created} DELEGATES_TO relationships")
-        return {"created": created, "errors": 0}
-    except Exception as e:
-        logger.error(f"Failed to create model delegation: {str(e)}")
-        return {"created": 0, "errors": len(delegations)}
-
+    return _create_relationships_batch(connection, "model_delegation", delegations)
 
-# ============================================================================
-# Field Operations
-# ============================================================================
 
 def create_fields_batch(connection, fields: List[Dict[str, Any]]) -> Dict[str, int]:
     """
-    Create Field nodes in batch.
+    Create Field nodes and their BELONGS_TO relationships in batch.
 
     Args:
         connection: Neo4jConnection instance
-        fields: List of field dictionaries with all parameters
+        fields: List of field dictionaries with all parameters and model_name
 
     Returns:
         Dictionary with operation results
     """
-    if not fields:
-        return {"created": 0, "errors": 0}
+    return create_models_with_relations_batch(connection, {"fields": fields})
 
-    # Prepare fields for Neo4j (convert nested collections to JSON)
-    prepared_fields = _prepare_fields_for_neo4j(fields)
 
-    # Build SET clause dynamically for all field properties
-    query = f"""
-        UNWIND $batch AS field
-        MERGE (f:{NodeLabel.FIELD} {{
-            {FieldProperty.NAME}: field.name,
-            model_name: field.model_name
-        }})
-        SET f.{FieldProperty.NAME} = field.name,
-            f.model_name = field.model_name,
-            f.{FieldProperty.FIELD_TYPE} = field.field_type,
-            f.{FieldProperty.STRING} = field.string,
-            f.{FieldProperty.REQUIRED} = field.required,
-            f.{FieldProperty.READONLY} = field.readonly,
-            f.{FieldProperty.HELP} = field.help,
-            f.{FieldProperty.DEFAULT} = field.default,
-            f.{FieldProperty.COMPUTE} = field.compute,
-            f.{FieldProperty.STORE} = field.store,
-            f.{FieldProperty.RELATED} = field.related,
-            f.{FieldProperty.DEPENDS} = field.depends,
-            f.{FieldProperty.INVERSE_NAME} = field.inverse_name,
-            f.{FieldProperty.COMODEL_NAME} = field.comodel_name,
-            f.{FieldProperty.DOMAIN} = field.domain,
-            f.{FieldProperty.SELECTION} = field.selection,
-            f.{FieldProperty.STATES} = field.states,
-            f.{FieldProperty.COPY} = field.copy,
-            f.{FieldProperty.INDEX} = field.index,
-            f.{FieldProperty.TRANSLATE} = field.translate,
-            f.{FieldProperty.DIGITS} = field.digits,
-            f.{FieldProperty.SANITIZE} = field.sanitize,
-            f.{FieldProperty.STRIP_STYLE} = field.strip_style
-        RETURN count(f) as created
+def create_field_references_batch(
+    connection,
+    references: List[Dict[str, str]]
+) -> Dict[str, int]:
     """
+    Create REFERENCES relationships between fields and models in batch.
+    Used for relational fields (Many2one, One2many, Many2many).
 
-    try:
-        result = connection.execute_batch(query, prepared_fields)
-        created = result.get("nodes_created", 0)
-        logger.info(f"Created {created} Field nodes")
-        return {"created": created, "errors": 0}
-    except Exception as e:
-        logger.error(f"Failed to create fields batch: {str(e)}")
-        return {"created": 0, "errors": len(fields)}
+    Args:
+        connection: Neo4jConnection instance
+        references: List of {"field_name": "name", "model_name": "model", "comodel": "target"}
+
+    Returns:
+        Dictionary with operation results
+    """
+    return _create_relationships_batch(connection, "field_references", references)
 
 
-def create_field_model_relationships_batch(
+def _create_relationships_batch(
     connection,
-    relationships: List[Dict[str, str]]
+    phase: str,
+    rows: List[Dict[str, Any]]
 ) -> Dict[str, int]:
     """
-    Create BELONGS_TO relationships between fields and models in batch.
+    Create the relationships of one phase as a single statement.
 
     Args:
         connection: Neo4jConnection instance
-        relationships: List of {"field_name": "name", "model_name": "model"} dicts
+        phase: Phase name (see _RELATIONSHIP_PHASES)
+        rows: Distinct relationship rows
 
     Returns:
         Dictionary with operation results
     """
-    if not relationships:
+    if not rows:
         return {"created": 0, "errors": 0}
 
-    query = f"""
-        UNWIND $batch AS rel
-        MATCH (field:{NodeLabel.FIELD} {{
-            {FieldProperty.NAME}: rel.field_name,
-            model_name: rel.model_name
-        }})
-        MATCH (model:{NodeLabel.MODEL} {{{ModelProperty.NAME}: rel.model_name}})
-        MERGE (field)-[r:{RelationType.BELONGS_TO}]->(model)
-        RETURN count(r) as created
+    pipeline = list(_iter_relationship_statements({phase: rows}, len(rows)))
+    return _run_relationship_pipeline(connection, pipeline)
+
+
+def _iter_relationship_statements(
+    relationships: Dict[str, Iterable[Dict[str, Any]]],
+    batch_size: int
+) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Turn relationship rows into ``UNWIND $batch`` statements.
+
+    Args:
+        relationships: Rows per phase name (see _RELATIONSHIP_PHASES)
+        batch_size: Number of rows per statement
+
+    Yields:
+        (query, parameters) tuples
     """
+    for phase, rows in relationships.items():
+        query, sort_key = _RELATIONSHIP_PHASES[phase]
+        iterator = iter(rows)
+        while True:
+            batch = list(itertools.islice(iterator, batch_size))
+            if not batch:
+                break
+            if sort_key is not None:
+                batch.sort(key=sort_key)
+            yield query, {"batch": batch}
+
+
+def _run_relationship_pipeline(
+    connection,
+    pipeline: List[Tuple[str, Dict[str, Any]]]
+) -> Dict[str, int]:
+    """
+    Run one pipeline of relationship statements as a single transaction.
+
+    Args:
+        connection: Neo4jConnection instance
+        pipeline: List of (query, parameters) tuples
 
+    Returns:
+        Dictionary with operation results
+    """
     try:
-        result = connection.execute_batch(query, relationships)
-        created = result.get("relationships_created", 0)
-        logger.info(f"Created {created} BELONGS_TO relationships")
-        return {"created": created, "errors": 0}
+        result = connection.execute_pipeline(pipeline)
+        return {"created": result.get("relationships_created", 0), "errors": 0}
     except Exception as e:
-        logger.error(f"Failed to create field-model relationships: {str(e)}")
-        return {"created": 0, "errors": len(relationships)}
+        logger.error("Failed to create relationships pipeline: %s", e)
+        return {
+            "created": 0,
+            "errors": sum(len(parameters["batch"]) for _, parameters in pipeline)
+        }
 
 
-def create_field_references_batch(
+def create_relationships_pipelined(
     connection,
-    references: List[Dict[str, str]]
+    relationships: Dict[str, Iterable[Dict[str, Any]]],
+    batch_size: int,
+    megabatch_size: int = 20000,
+    max_workers: int = 1
 ) -> Dict[str, int]:
     """
-    Create REFERENCES relationships between fields and models in batch.
-    Used for relational fields (Many2one, One2many, Many2many).
+    Create relationships of several phases with pipelined transactions.
+
+    Rows of each phase ("module_dependencies", "model_inheritance",
+    "model_delegation", "field_references") must be distinct (the indexer
+    drops duplicates while buffering them). They are split into
+    ``UNWIND $batch`` statements of ``batch_size`` rows. Statements are sent
+    through Neo4jConnection.execute_pipeline and committed once per
+    ``megabatch_size`` rows, so the commit cost is paid per megabatch instead
+    of per batch. All endpoint nodes must already exist.
+
+    With ``max_workers > 1`` several transactions are in flight at once, so
+    their commits overlap on the server. Since rows are distinct, every
+    relationship is merged by exactly one transaction and concurrent
+    transactions never create the same relationship twice; they only share
+    endpoint nodes, and the driver retries transactions that fail on lock
+    contention between them.
 
     Args:
         connection: Neo4jConnection instance
-        references: List of {"field_name": "name", "model_name": "model", "comodel": "target"}
+        relationships: Rows per phase: {"from", "to"} for module
+            dependencies and inheritance, {"from", "to", "field"} for
+            delegation, {"field_name", "model_name", "comodel"} for field
+            references
+        batch_size: Number of rows per statement
+        megabatch_size: Number of rows per transaction
+        max_workers: Number of concurrent transactions (1 = sequential)
 
     Returns:
         Dictionary with operation results
     """
-    if not references:
-        return {"created": 0, "errors": 0}
+    total_created = 0
+    total_errors = 0
+    pipelines = 0
 
-    query = f"""
-        UNWIND $batch AS ref
-        MATCH (field:{NodeLabel.FIELD} {{
-            {FieldProperty.NAME}: ref.field_name,
-            model_name: ref.model_name
-        }})
-        MATCH (target:{NodeLabel.MODEL} {{{ModelProperty.NAME}: ref.comodel}})
-        MERGE (field)-[r:{RelationType.REFERENCES}]->(target)
-        RETURN count(r) as created
-    """
+    pipeline_size = max(1, megabatch_size // batch_size)
+    statements = _iter_relationship_statements(relationships, batch_size)
+    batches = iter(lambda: list(itertools.islice(statements, pipeline_size)), [])
 
-    try:
-        result = connection.execute_batch(query, references)
-        created = result.get("relationships_created", 0)
-        logger.info(f"Created {created} REFERENCES relationships")
-        return {"created": created, "errors": 0}
-    except Exception as e:
-        logger.error(f"Failed to create field references: {str(e)}")
-        return {"created": 0, "errors": len(references)}
+    for _, result in run_batches(connection, batches, _run_relationship_pipeline, max_workers):
+        pipelines += 1
+        total_created += result["created"]
+        total_errors += result["errors"]
+
+    logger.info(
+        "Completed relationships: %d transactions, %d created, %d errors",
+        pipelines, total_created, total_errors
+    )
+
+    return {"created": total_created, "errors": total_errors}
 
 
 # ============================================================================
 # Utility Functions
 # ============================================================================
 
+def run_batches(
+    connection,
+    batches: Iterable[Any],
+    operation_func,
+    max_workers: int = 1
+) -> Iterator[Tuple[Any, Dict[str, int]]]:
+    """
+    Run an operation function over batches, optionally in parallel.
+
+    Sequential runs share one session (Neo4jConnection.writer_session). With
+    ``max_workers > 1`` batches are submitted to a thread pool (the Neo4j
+    driver is thread-safe and worker threads open their own sessions). Only
+    a bounded number of batches is in flight at once, so a lazy input is
+    never fully materialized. Use parallel execution only for batches that
+    never MERGE the same keys (e.g. distinct relationship rows): concurrent
+    MERGEs of one key can create duplicates or race on SET.
+
+    Args:
+        connection: Neo4jConnection instance
+        batches: Iterable of batches to pass to operation_func
+        operation_func: Function to call for each batch
+        max_workers: Number of concurrent workers (1 = sequential)
+
+    Yields:
+        Tuples of (batch, operation result) in input order
+    """
+    if max_workers <= 1:
+        with connection.writer_session():
+            for batch in batches:
+                yield batch, operation_func(connection, batch)
+        return
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque()
+        for batch in batches:
+            pending.append((batch, executor.submit(operation_func, connection, batch)))
+            if len(pending) >= max_workers * 2:
+                done_batch, future = pending.popleft()
+                yield done_batch, future.result()
+
+        while pending:
+            done_batch, future = pending.popleft()
+            yield done_batch, future.result()
+
+
 def process_in_batches(
     connection,
-    items: List[Any],
+    items: Iterable[Any],
     batch_size: int,
     operation_func,
-    operation_name: str
+    operation_name: str,
+    max_workers: int = 1
 ) -> Dict[str, int]:
     """
     Process items in batches using a specified operation function.
 
+    Items are pulled lazily from the iterable, so callers can pass a
+    generator and stream data without buffering the full input.
+
     Args:
         connection: Neo4jConnection instance
-        items: List of items to process
+        items: Iterable of items to process
         batch_size: Number of items per batch
-        operation_func: Function to call for each batch
+        operation_func: Function to call for each batch (e.g. one of the
+            create_*_batch wrappers)
         operation_name: Name for logging
+        max_workers: Number of batches to run concurrently (1 = sequential,
+            see run_batches)
 
     Returns:
         Dictionary with aggregated results
     """
-    if not items:
-        logger.info(f"No items to process for {operation_name}")
-        return {"created": 0, "errors": 0}
-
+    total_items = 0
     total_created = 0
     total_errors = 0
-    total_batches = (len(items) + batch_size - 1) // batch_size
+    batch_num = 0
+
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
 
-    logger.info(f"Processing {len(items)} items in {total_batches} batches for {operation_name}")
+    iterator = iter(items)
+    batches = iter(lambda: list(itertools.islice(iterator, batch_size)), [])
 
-    for i in range(0, len(items), batch_size):
-        batch = items[i:i + batch_size]
-        batch_num = i // batch_size + 1
+    for batch, result in run_batches(connection, batches, operation_func, max_workers):
+        batch_num += 1
+        total_items += len(batch)
 
-        logger.debug(f"Processing batch {batch_num}/{total_batches} ({len(batch)} items)")
+        if debug_enabled:
+            logger.debug("Processed batch %d (%d items)", batch_num, len(batch))
 
-        result = operation_func(connection, batch)
         total_created += result.get("created", 0)
         total_errors += result.get("errors", 0)
 
+    if not total_items:
+        logger.info("No items to process for %s", operation_name)
+        return {"created": 0, "errors": 0}
+
     logger.info(
-        f"Completed {operation_name}: "
-        f"{total_created} created, {total_errors} errors"
+        "Completed %s: %d items in %d batches, %d created, %d errors",
+        operation_name, total_items, batch_num, total_created, total_errors
     )
 
     return {"created": total_created, "errors": total_errors}
@@ -6,11 +6,14 @@ automatic retry, error handling, and context manager support.
 """
 
 import logging
+import random
+import threading
 import time
-from typing import Any, Dict, List, Optional
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from neo4j import GraphDatabase, Session
-from neo4j.exceptions import ServiceUnavailable, AuthError
+from neo4j.exceptions import AuthError, ClientError, ServiceUnavailable
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +26,7 @@ class Neo4jConnection:
     - Automatic retry on connection failures
     - Context manager support for safe resource handling
     - Transaction management
+    - Session reuse across consecutive calls (see writer_session)
     - Connection verification
 
     Example:
@@ -37,6 +41,11 @@ class Neo4jConnection:
         password: str,
         max_retries: int = 3,
         retry_delay: float = 1.0,
+        max_retry_delay: float = 30.0,
+        max_connection_pool_size: int = 100,
+        connection_acquisition_timeout: float = 60.0,
+        max_connection_lifetime: float = 3600.0,
+        keep_alive: bool = True,
     ):
         """
         Initialize Neo4j connection.
@@ -46,20 +55,45 @@ class Neo4jConnection:
             user: Username for authentication
             password: Password for authentication
             max_retries: Maximum number of connection retry attempts
-            retry_delay: Delay between retries in seconds
+            retry_delay: Base delay between retries in seconds, doubled
+                after every failed attempt
+            max_retry_delay: Upper bound for the delay between retries
+            max_connection_pool_size: Maximum number of pooled Bolt
+                connections; size it to at least twice the number of
+                concurrent writers
+            connection_acquisition_timeout: Seconds to wait for a free
+                pooled connection before failing
+            max_connection_lifetime: Seconds after which pooled connections
+                are recycled, avoiding stalls on connections dropped by
+                firewalls during long indexing runs
+            keep_alive: Enable TCP keep-alive on driver connections
         """
         self.uri = uri
         self.user = user
         self.password = password
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self.max_connection_pool_size = max_connection_pool_size
+        self.connection_acquisition_timeout = connection_acquisition_timeout
+        self.max_connection_lifetime = max_connection_lifetime
+        self.keep_alive = keep_alive
         self.driver = None
         self._connected = False
 
+        # Session bound to the current thread by writer_session()
+        self._local = threading.local()
+
+        # Whether the server has APOC; probed on first use
+        self._apoc_available: Optional[bool] = None
+
     def connect(self) -> bool:
         """
         Establish connection to Neo4j with retry logic.
 
+        Retries back off exponentially with up to 50% random jitter, so
+        clients reconnecting after a restart do not retry in lockstep.
+
         Returns:
             True if connection successful, False otherwise
 
@@ -74,6 +108,10 @@ class Neo4jConnection:
                 self.driver = GraphDatabase.driver(
                     self.uri,
                     auth=(self.user, self.password),
+                    max_connection_pool_size=self.max_connection_pool_size,
+                    connection_acquisition_timeout=self.connection_acquisition_timeout,
+                    max_connection_lifetime=self.max_connection_lifetime,
+                    keep_alive=self.keep_alive,
                 )
 
                 # Verify connectivity
@@ -91,7 +129,12 @@ class Neo4jConnection:
                 logger.warning(f"Neo4j unavailable (attempt {attempt + 1}/{self.max_retries}): {e}")
 
                 if attempt < self.max_retries - 1:
-                    time.sleep(self.retry_delay)
+                    delay = min(
+                        self.max_retry_delay,
+                        self.retry_delay * (2 ** attempt) * (1 + random.random() * 0.5)
+                    )
+                    logger.info(f"Retrying in {delay:.1f}s")
+                    time.sleep(delay)
                 else:
                     logger.error("Max retries reached. Neo4j is not available.")
                     raise
@@ -113,6 +156,60 @@ class Neo4jConnection:
         """Check if connection is active."""
         return self._connected and self.driver is not None
 
+    @contextmanager
+    def writer_session(self, database: str = "neo4j") -> Iterator[Session]:
+        """
+        Bind one session to the current thread for a series of calls.
+
+        While the context is open, execute_query, execute_write,
+        execute_batch and execute_pipeline called from this thread on the
+        same database reuse this session instead of checking a new one out
+        of the pool per call. Sessions are not thread-safe, so other threads
+        keep opening their own. Nested use reuses the outer session.
+
+        Args:
+            database: Database name (default: 'neo4j')
+
+        Yields:
+            The bound Neo4j session
+
+        Raises:
+            RuntimeError: If not connected to Neo4j
+        """
+        if not self.is_connected():
+            raise RuntimeError("Not connected to Neo4j. Call connect() first.")
+
+        previous = getattr(self._local, "bound", None)
+        if previous is not None and previous[0] == database:
+            yield previous[1]
+            return
+
+        with self.driver.session(database=database) as session:
+            self._local.bound = (database, session)
+            try:
+                yield session
+            finally:
+                self._local.bound = previous
+
+    @contextmanager
+    def _session(self, database: str) -> Iterator[Session]:
+        """
+        Yield the session bound by writer_session, or a new short-lived one.
+
+        Args:
+            database: Database name
+
+        Yields:
+            Neo4j session
+        """
+        bound = getattr(self._local, "bound", None)
+        if bound is not None and bound[0] == database:
+            yield bound[1]
+            return
+
+        with self.driver.session(database=database) as session:
+            yield session
+
     def execute_query(
         self,
         query: str,
@@ -138,9 +235,8 @@ class Neo4jConnection:
 
         parameters = parameters or {}
 
-        with self.driver.session(database=database) as session:
-            result = session.run(query, parameters)
-            return [dict(record) for record in result]
+        with self._session(database) as session:
+            return session.run(query, parameters).data()
 
     def execute_write(
         self,
@@ -157,7 +253,7 @@ class Neo4jConnection:
             database: Database name (default: 'neo4j')
 
         Returns:
-            Query summary statistics
+            Query summary statistics, plus the returned rows under "records"
 
         Raises:
             RuntimeError: If not connected to Neo4j
@@ -169,8 +265,10 @@ class Neo4jConnection:
 
         def transaction_function(tx):
             result = tx.run(query, parameters)
+            records = result.data()
             summary = result.consume()
             return {
+                "records": records,
                 "nodes_created": summary.counters.nodes_created,
                 "relationships_created": summary.counters.relationships_created,
                 "properties_set": summary.counters.properties_set,
@@ -178,7 +276,7 @@ class Neo4jConnection:
                 "relationships_deleted": summary.counters.relationships_deleted,
             }
 
-        with self.driver.session(database=database) as session:
+        with self._session(database) as session:
             return session.execute_write(transaction_function)
 
     def execute_batch(
@@ -196,10 +294,57 @@ class Neo4jConnection:
             database: Database name (default: 'neo4j')
 
         Returns:
-            Query summary statistics
+            Query summary statistics, plus the returned rows under "records"
         """
         return self.execute_write(query, {"batch": batch}, database)
 
+    def execute_pipeline(
+        self,
+        statements: Iterable[Tuple[str, Dict[str, Any]]],
+        database: str = "neo4j",
+    ) -> Dict[str, Any]:
+        """
+        Execute several write queries in a single transaction.
+
+        All statements are sent before any result is consumed, so Bolt
+        pipelines them instead of waiting for a round-trip per statement.
+
+        Args:
+            statements: Iterable of (query, parameters) tuples
+            database: Database name (default: 'neo4j')
+
+        Returns:
+            Query summary statistics summed over all statements
+
+        Raises:
+            RuntimeError: If not connected to Neo4j
+        """
+        if not self.is_connected():
+            raise RuntimeError("Not connected to Neo4j. Call connect() first.")
+
+        statements = list(statements)
+
+        def transaction_function(tx):
+            results = [tx.run(query, parameters or {}) for query, parameters in statements]
+            totals = {
+                "nodes_created": 0,
+                "relationships_created": 0,
+                "properties_set": 0,
+                "nodes_deleted": 0,
+                "relationships_deleted": 0,
+            }
+            for result in results:
+                counters = result.consume().counters
+                totals["nodes_created"] += counters.nodes_created
+                totals["relationships_created"] += counters.relationships_created
+                totals["properties_set"] += counters.properties_set
+                totals["nodes_deleted"] += counters.nodes_deleted
+                totals["relationships_deleted"] += counters.relationships_deleted
+            return totals
+
+        with self._session(database) as session:
+            return session.execute_write(transaction_function)
+
     def clear_database(self, database: str = "neo4j") -> Dict[str, Any]:
         """
         Clear all nodes and relationships from the database.
@@ -222,6 +367,29 @@ class Neo4jConnection:
 
         return self.execute_write(query, database=database)
 
+    def _has_apoc(self, database: str = "neo4j") -> bool:
+        """
+        Check once whether APOC procedures are installed.
+
+        Args:
+            database: Database name (default: 'neo4j')
+
+        Returns:
+            True if APOC is available
+        """
+        if self._apoc_available is None:
+            query = """
+            CALL apoc.help('apoc') YIELD name
+            RETURN count(name) > 0 as ok
+            """
+            try:
+                self._apoc_available = bool(self.execute_query(query, database=database)[0]["ok"])
+            except ClientError:
+                self._apoc_available = False
+            logger.debug("APOC available: %s", self._apoc_available)
+
+        return self._apoc_available
+
     def get_statistics(self, database: str = "neo4j") -> Dict[str, Any]:
         """
         Get database statistics.
@@ -234,38 +402,45 @@ class Neo4jConnection:
         """
         stats = {}
 
-        # Count nodes by label
-        query = """
-        CALL db.labels() YIELD label
-        CALL apoc.cypher.run('MATCH (n:' + label + ') RETURN count(n) as count', {})
-        YIELD value
-        RETURN label, value.count as count
+        # Read precomputed counters when APOC is installed (O(1))
+        apoc_query = """
+        CALL apoc.meta.stats() YIELD labels, relTypesCount
+        RETURN labels, relTypesCount
         """
 
-        # Fallback if APOC is not available
+        # Fallback if APOC is not available: both counts in one round-trip
         simple_query = """
         MATCH (n)
-        RETURN labels(n)[0] as label, count(n) as count
-        ORDER BY label
+        RETURN 'node' as kind, labels(n)[0] as name, count(n) as count
+        UNION ALL
+        MATCH ()-[r]->()
+        RETURN 'relationship' as kind, type(r) as name, count(r) as count
         """
 
-        try:
-            results = self.execute_query(query, database=database)
-        except:
+        record = None
+        if self._has_apoc(database):
+            try:
+                record = self.execute_query(apoc_query, database=database)[0]
+            except ClientError as e:
+                # Installed but not usable (e.g. not in the procedure
+                # allowlist): count with plain Cypher from now on
+                logger.debug("apoc.meta.stats() failed, falling back to Cypher: %s", e)
+                self._apoc_available = False
+
+        if record is not None:
+            stats["nodes"] = {label: count for label, count in record["labels"].items() if count}
+            stats["relationships"] = {
+                rel_type: count for rel_type, count in record["relTypesCount"].items() if count
+            }
+        else:
             # APOC not available, use simple query
             results = self.execute_query(simple_query, database=database)
-
-        stats["nodes"] = {r["label"]: r["count"] for r in results if r["label"]}
-
-        # Count relationships by type
-        rel_query = """
-        MATCH ()-[r]->()
-        RETURN type(r) as rel_type, count(r) as count
-        ORDER BY rel_type
-        """
-
-        rel_results = self.execute_query(rel_query, database=database)
-        stats["relationships"] = {r["rel_type"]: r["count"] for r in rel_results}
+            stats["nodes"] = {
+                r["name"]: r["count"] for r in results if r["kind"] == "node" and r["name"]
+            }
+            stats["relationships"] = {
+                r["name"]: r["count"] for r in results if r["kind"] == "relationship"
+            }
 
         # Total counts
         stats["total_nodes"] = sum(stats["nodes"].values())
@@ -282,3 +457,88 @@ class Neo4jConnection:
         """Context manager exit."""
         self.close()
         return False
+
+
+class NullConnection:
+    """
+    Stand-in for Neo4jConnection that discards every query.
+
+    Used by ``index --dry-run`` to run discovery and parsing without a
+    database, so extraction throughput can be measured on its own. Reads
+    return no rows and writes report zero changes.
+    """
+
+    _EMPTY_SUMMARY = {
+        "nodes_created": 0,
+        "relationships_created": 0,
+        "properties_set": 0,
+        "nodes_deleted": 0,
+        "relationships_deleted": 0,
+    }
+
+    def connect(self) -> bool:
+        """Nothing to connect to; always succeeds."""
+        return True
+
+    def close(self):
+        """Nothing to close."""
+
+    def is_connected(self) -> bool:
+        """Always connected."""
+        return True
+
+    @contextmanager
+    def writer_session(self, database: str = "neo4j") -> Iterator[None]:
+        """No session to bind; yields None."""
+        yield None
+
+    def execute_query(
+        self,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        database: str = "neo4j",
+    ) -> List[Dict[str, Any]]:
+        """Discard a read query; returns no rows."""
+        return []
+
+    def execute_write(
+        self,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        database: str = "neo4j",
+    ) -> Dict[str, Any]:
+        """Discard a write query; returns an all-zero summary."""
+        return {"records": [], **self._EMPTY_SUMMARY}
+
+    def execute_batch(
+        self,
+        query: str,
+        batch: List[Dict[str, Any]],
+        database: str = "neo4j",
+    ) -> Dict[str, Any]:
+        """Discard a batch query; returns an all-zero summary."""
+        return self.execute_write(query, {"batch": batch}, database)
+
+    def execute_pipeline(
+        self,
+        statements: Iterable[Tuple[str, Dict[str, Any]]],
+        database: str = "neo4j",
+    ) -> Dict[str, Any]:
+        """Discard pipelined queries; returns an all-zero summary."""
+        return dict(self._EMPTY_SUMMARY)
+
+    def clear_database(self, database: str = "neo4j") -> Dict[str, Any]:
+        """Nothing to clear; returns an all-zero summary."""
+        return self.execute_write("", database=database)
+
+    def get_statistics(self, database: str = "neo4j") -> Dict[str, Any]:
+        """No data; returns empty statistics."""
+        return {"nodes": {}, "relationships": {}, "total_nodes": 0, "total_relationships": 0}
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        return False
@@ -7,35 +7,85 @@ This module coordinates the entire ETL process:
 3. Load: Insert into Neo4j in batches
 """
 
+from bisect import bisect_left
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, Iterable, Iterator, List, Any, Optional, Tuple
+import os
+import queue
+import threading
 import time
 
 from utils.logger import get_logger
 from utils.monitoring import MemoryMonitor
-from utils.hashing import compute_file_hash
+from utils.hashing import (
+    HashCacheEntry,
+    check_file_hash,
+    load_hash_cache,
+    save_hash_cache
+)
 from config.settings import get_settings
 
-from parsers.manifest_parser import find_modules, parse_manifest, get_manifest_dependencies
+from parsers.manifest_parser import (
+    find_module_manifests,
+    find_module_manifests_parallel,
+    parse_manifest,
+    get_manifest_dependencies
+)
 from parsers.model_parser import find_model_files, parse_model_file
+from parsers.parse_cache import prune_cache
 
-from graph.connection import Neo4jConnection
+from graph.connection import Neo4jConnection, NullConnection
 from graph.schema import initialize_schema, verify_schema, get_database_stats
+from graph.queries import get_file_hashes
 from graph.batch_operations import (
-    create_modules_batch,
-    create_module_dependencies_batch,
-    create_models_batch,
-    create_model_module_relationships_batch,
-    create_model_inheritance_batch,
-    create_model_delegation_batch,
-    create_fields_batch,
-    create_field_model_relationships_batch,
-    create_field_references_batch,
-    process_in_batches
+    create_models_with_relations_batch,
+    create_relationships_pipelined,
+    run_batches
 )
 
 logger = get_logger(__name__)
 
+# Base definitions of core models live in these addons (/addons/<name>/)
+_CORE_ADDON_MODULES = frozenset({"stock", "sale", "account", "purchase", "mrp", "project"})
+
+# Number of modules processed between memory usage checks
+_MEMORY_CHECK_INTERVAL = 32
+
+# Field parameters copied verbatim from the parser output when set
+_FIELD_PARAM_KEYS = (
+    "string",
+    "required",
+    "readonly",
+    "help",
+    "default",
+    "compute",
+    "store",
+    "related",
+    "depends",
+    "inverse_name",
+    "comodel_name",
+    "domain",
+    "selection",
+    "states",
+    "copy",
+    "index",
+    "translate",
+    "digits",
+    "sanitize",
+    "strip_style",
+)
+
+# Buffered relationship phases: phase -> (module data key, row identity)
+_RELATIONSHIP_SOURCES = {
+    "module_dependencies": ("dependencies", itemgetter("from", "to")),
+    "model_inheritance": ("model_inheritance", itemgetter("from", "to")),
+    "model_delegation": ("model_delegation", itemgetter("from", "to", "field")),
+    "field_references": ("field_references", itemgetter("field_name", "model_name", "comodel")),
+}
+
 
 class OdooIndexer:
     """
@@ -47,7 +97,9 @@ class OdooIndexer:
         odoo_path: Path,
         connection: Neo4jConnection,
         batch_size: Optional[int] = None,
-        max_memory_percent: Optional[float] = None
+        max_memory_percent: Optional[float] = None,
+        max_workers: Optional[int] = None,
+        scan_workers: Optional[int] = None
     ):
         """
         Initialize the indexer.
@@ -57,6 +109,11 @@ class OdooIndexer:
             connection: Neo4jConnection instance
             batch_size: Batch size for database operations (default from settings)
             max_memory_percent: Maximum memory usage percent (default from settings)
+            max_workers: Extraction processes and concurrent relationship
+                transactions (default: MAX_WORKERS if ENABLE_PARALLEL is
+                set, else 1)
+            scan_workers: Threads walking the addons tree for modules
+                (default: 1, a single sequential walk)
         """
         self.odoo_path = Path(odoo_path)
         self.connection = connection
@@ -65,6 +122,21 @@ class OdooIndexer:
         self.batch_size = batch_size or self.settings.batch_size
         self.max_memory_percent = max_memory_percent or self.settings.max_memory_percent
 
+        # Rows committed per transaction; never smaller than one batch
+        self.megabatch_size = max(self.settings.megabatch_size, self.batch_size)
+
+        # mtime/size-keyed file hash cache, persisted between runs
+        self.hash_cache_path = (
+            self.settings.cache_dir / "file_hashes.json" if self.settings.enable_cache else None
+        )
+        self.file_hashes = {}
+
+        # Extraction processes and concurrent relationship transactions
+        if max_workers is None:
+            max_workers = self.settings.max_workers if self.settings.enable_parallel else 1
+        self.max_workers = max(1, max_workers)
+        self.scan_workers = max(1, scan_workers or 1)
+
         self.memory_monitor = MemoryMonitor(
             max_percent=self.max_memory_percent
         )
@@ -80,7 +152,9 @@ class OdooIndexer:
             "errors": 0,
             "start_time": None,
             "end_time": None,
-            "duration_seconds": 0
+            "duration_seconds": 0,
+            # Wall-clock seconds per indexing phase, in execution order
+            "phase_seconds": {}
         }
 
     def index_all(self, clear_existing: bool = False, incremental: bool = False) -> Dict[str, Any]:
@@ -94,14 +168,23 @@ class OdooIndexer:
         Returns:
             Dictionary with indexing statistics
         """
-        logger.info("=" * 80)
-        logger.info("Starting Odoo indexing process")
-        logger.info(f"Path: {self.odoo_path}")
-        logger.info(f"Batch size: {self.batch_size}")
-        logger.info(f"Max memory: {self.max_memory_percent}%")
-        logger.info(f"Clear existing: {clear_existing}")
-        logger.info(f"Incremental: {incremental}")
-        logger.info("=" * 80)
+        logger.info(
+            "\n".join([
+                "=" * 80,
+                "Starting Odoo indexing process",
+                "Path: %s",
+                "Batch size: %d",
+                "Max memory: %s%%",
+                "Clear existing: %s",
+                "Incremental: %s",
+                "=" * 80,
+            ]),
+            self.odoo_path,
+            self.batch_size,
+            self.max_memory_percent,
+            clear_existing,
+            incremental
+        )
 
         self.stats["start_time"] = time.time()
 
@@ -109,158 +192,454 @@ class OdooIndexer:
             # Step 1: Clear database if requested
             if clear_existing:
                 logger.info("Clearing existing database...")
+                phase_start = time.perf_counter()
                 self.connection.clear_database()
-
-            # Step 2: Initialize schema
-            logger.info("Initializing schema...")
-            schema_result = initialize_schema(self.connection)
-            logger.info(f"Schema initialized: {schema_result}")
-
-            # Step 3: Extract data
-            logger.info("Extracting data from Odoo codebase...")
-            extracted_data = self._extract_all_data(incremental)
-
-            # Step 4: Load into Neo4j
-            logger.info("Loading data into Neo4j...")
-            self._load_all_data(extracted_data)
-
-            # Step 5: Get final statistics
+                self._record_phase("clear", phase_start)
+
+            # Step 2: Initialize schema, so every MERGE below is an index
+            # lookup rather than a label scan
+            if self.settings.auto_create_indexes:
+                logger.info("Initializing schema...")
+                phase_start = time.perf_counter()
+                schema_result = initialize_schema(self.connection)
+                self._record_phase("schema", phase_start)
+                logger.info("Schema initialized: %s", schema_result)
+            else:
+                logger.info("Skipping schema initialization (AUTO_CREATE_INDEXES is off)")
+
+            # Step 3: Extract data and load it into Neo4j as it is parsed
+            logger.info("Extracting data from Odoo codebase and loading it into Neo4j...")
+            self._extract_and_load(incremental)
+
+            # A dry run wrote nothing to Neo4j, so its hashes must not mark
+            # files as indexed for the next run
+            if self.hash_cache_path is not None and not isinstance(self.connection, NullConnection):
+                self._save_hash_cache()
+
+            # Every file under the root was parsed, so its parse cache entries
+            # this run did not use belong to files that changed or were removed
+            if not incremental:
+                prune_cache(self.stats["start_time"], self.odoo_path)
+
+            # Step 4: Get final statistics
             self.stats["end_time"] = time.time()
             self.stats["duration_seconds"] = self.stats["end_time"] - self.stats["start_time"]
 
+            phase_start = time.perf_counter()
             db_stats = get_database_stats(self.connection)
+            self._record_phase("statistics", phase_start)
             self.stats["db_stats"] = db_stats
 
-            logger.info("=" * 80)
-            logger.info("Indexing completed successfully!")
-            logger.info(f"Duration: {self.stats['duration_seconds']:.2f} seconds")
-            logger.info(f"Modules indexed: {self.stats['modules_indexed']}")
-            logger.info(f"Models indexed: {self.stats['models_indexed']}")
-            logger.info(f"Fields indexed: {self.stats['fields_indexed']}")
-            logger.info(f"Relationships created: {self.stats['relationships_created']}")
-            logger.info(f"Errors: {self.stats['errors']}")
-            logger.info("=" * 80)
+            logger.info(
+                "\n".join([
+                    "=" * 80,
+                    "Indexing completed successfully!",
+                    "Duration: %.2f seconds",
+                    "Modules indexed: %d",
+                    "Models indexed: %d",
+                    "Fields indexed: %d",
+                    "Relationships created: %d",
+                    "Errors: %d",
+                    "=" * 80,
+                ]),
+                self.stats["duration_seconds"],
+                self.stats["modules_indexed"],
+                self.stats["models_indexed"],
+                self.stats["fields_indexed"],
+                self.stats["relationships_created"],
+                self.stats["errors"]
+            )
 
             return self.stats
 
         except Exception as e:
-            logger.error(f"Indexing failed: {str(e)}", exc_info=True)
+            logger.error("Indexing failed: %s", e, exc_info=True)
             self.stats["errors"] += 1
             raise
 
-    def _extract_all_data(self, incremental: bool) -> Dict[str, Any]:
+    def _iter_module_data(self, incremental: bool) -> Iterator[Dict[str, Any]]:
         """
-        Extract all data from Odoo codebase.
+        Extract data from the Odoo codebase, one module at a time.
+
+        Modules are extracted as the directory walk discovers them. They
+        share no state, so when parallel processing is enabled they are
+        parsed in a pool of worker processes. Statistics are updated here,
+        in the main process, in module order.
 
         Args:
             incremental: If True, check file hashes to skip unchanged files
 
-        Returns:
-            Dictionary with extracted data
+        Yields:
+            Module data dictionaries as returned by _extract_module_data
         """
-        data = {
-            "modules": [],
-            "module_dependencies": [],
-            "models": [],
-            "model_module_rels": [],
-            "model_inheritance": [],
-            "model_delegation": [],
-            "fields": [],
-            "field_model_rels": [],
-            "field_references": []
-        }
-
         # Get existing hashes for incremental indexing
         existing_hashes = {}
         if incremental:
             existing_hashes = self._get_existing_file_hashes()
-            logger.info(f"Found {len(existing_hashes)} existing file hashes")
+            logger.info("Found %d existing file hashes", len(existing_hashes))
+
+        previous_cache = {}
+        if self.hash_cache_path is not None:
+            previous_cache = load_hash_cache(self.hash_cache_path)
+
+        # Sorted paths let each module's hashes be sliced out by prefix
+        hash_paths = sorted(existing_hashes)
+        cache_paths = sorted(previous_cache)
+
+        def iter_tasks() -> Iterator[Tuple[Path, str, Dict[str, str], Dict[str, HashCacheEntry]]]:
+            # Modules are handed out as they are discovered; each worker only
+            # receives the hashes of its own module's files
+            if self.scan_workers > 1:
+                modules = find_module_manifests_parallel(self.odoo_path, self.scan_workers)
+            else:
+                modules = find_module_manifests(self.odoo_path)
+
+            for module_path, manifest_file in modules:
+                self.stats["modules_found"] += 1
+                yield (
+                    module_path,
+                    manifest_file,
+                    _slice_by_path_prefix(hash_paths, existing_hashes, module_path),
+                    _slice_by_path_prefix(cache_paths, previous_cache, module_path)
+                )
 
-        # Find all modules
         logger.info("Discovering modules...")
-        module_paths = list(find_modules(self.odoo_path))
-        self.stats["modules_found"] = len(module_paths)
-        logger.info(f"Found {len(module_paths)} modules")
+        self.stats["modules_found"] = 0
+
+        executor = None
+        if self.max_workers > 1:
+            executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            results = _map_bounded(
+                executor,
+                _extract_module_data_worker,
+                iter_tasks(),
+                self.max_workers * 2
+            )
+        else:
+            results = map(_extract_module_data_worker, iter_tasks())
 
-        # Process each module
-        for idx, module_path in enumerate(module_paths, 1):
-            try:
-                self._check_memory()
+        try:
+            # Process each module
+            for idx, (module_path, module_data, error, file_hashes) in enumerate(results, 1):
+                # Reading memory usage costs /proc reads; sample it
+                if idx % _MEMORY_CHECK_INTERVAL == 0:
+                    self._check_memory()
+
+                logger.debug("Processed module %d: %s", idx, module_path.name)
 
-                logger.debug(f"Processing module {idx}/{len(module_paths)}: {module_path.name}")
+                self.file_hashes.update(file_hashes)
 
-                # Extract module data
-                module_data = self._extract_module_data(module_path, existing_hashes)
+                if error:
+                    logger.error("Failed to process module %s: %s", module_path, error)
+                    self.stats["errors"] += 1
+                    continue
 
                 if module_data:
-                    data["modules"].append(module_data["module"])
-                    data["module_dependencies"].extend(module_data["dependencies"])
-                    data["models"].extend(module_data["models"])
-                    data["model_module_rels"].extend(module_data["model_module_rels"])
-                    data["model_inheritance"].extend(module_data["model_inheritance"])
-                    data["model_delegation"].extend(module_data["model_delegation"])
-                    data["fields"].extend(module_data["fields"])
-                    data["field_model_rels"].extend(module_data["field_model_rels"])
-                    data["field_references"].extend(module_data["field_references"])
+                    if module_data["module"] is not None:
+                        self.stats["modules_indexed"] += 1
+                    self.stats["models_found"] += len(module_data["models"])
+                    self.stats["models_indexed"] += len(module_data["models"])
+                    self.stats["fields_found"] += len(module_data["fields"])
+                    self.stats["fields_indexed"] += len(module_data["fields"])
+                    self.stats["errors"] += module_data["errors"]
+
+                    yield module_data
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+
+        logger.info("Found %d modules", self.stats["modules_found"])
+        logger.info("Extraction complete: %d modules processed", self.stats["modules_indexed"])
+        logger.info(
+            "Extracted %d models and %d fields",
+            self.stats["models_indexed"],
+            self.stats["fields_indexed"]
+        )
 
-                    self.stats["modules_indexed"] += 1
+    def _extract_and_load(self, incremental: bool) -> None:
+        """
+        Extract the Odoo codebase and load it into Neo4j as it is parsed.
 
-            except Exception as e:
-                logger.error(f"Failed to process module {module_path}: {str(e)}")
-                self.stats["errors"] += 1
+        Module, model and field nodes are grouped into payloads of up to
+        ``megabatch_size`` rows and handed to a loader thread through a
+        bounded queue, so parsing overlaps with database writes and only a
+        few payloads are held in memory at a time. The loader writes
+        payloads one after the other: payloads of different modules MERGE
+        the same Model (and Field) keys, so they must not run concurrently.
 
-        logger.info(f"Extraction complete: {self.stats['modules_indexed']} modules processed")
-        logger.info(f"Extracted {len(data['models'])} models and {len(data['fields'])} fields")
+        Relationships between modules and models can point to nodes from any
+        module; their rows are buffered, deduplicated by identity, and
+        created once every node has been loaded.
 
-        return data
+        Args:
+            incremental: If True, check file hashes to skip unchanged files
+        """
+        phase_start = time.perf_counter()
+
+        # Rows keyed by identity tuple: the same pair is emitted once per
+        # appearance in the code but only needs one MERGE
+        relationships = {phase: {} for phase in _RELATIONSHIP_SOURCES}
+
+        # A full queue blocks extraction until the loader catches up
+        payloads = queue.Queue(maxsize=self.max_workers * 2)
+        load_result = {"created": 0, "errors": 0, "exception": None}
+        # Set by the loader when it fails, so extraction stops right away
+        load_failed = threading.Event()
+        loader = threading.Thread(
+            target=self._load_payloads,
+            args=(payloads, load_result, load_failed),
+            name="neo4j-loader",
+            daemon=True
+        )
+        loader.start()
 
-    def _extract_module_data(
+        module_datas = self._iter_module_data(incremental)
+        try:
+            payload = self._new_model_payload()
+            rows = 0
+
+            for module_data in module_datas:
+                if load_failed.is_set():
+                    break
+
+                # A module travels with its models and fields, so DEFINED_IN
+                # and BELONGS_TO never reference nodes from a later payload
+                if module_data["module"] is not None:
+                    payload["modules"].append(module_data["module"])
+                    rows += 1
+                payload["models"].extend(module_data["models"])
+                payload["model_module_rels"].extend(module_data["model_module_rels"])
+                payload["fields"].extend(module_data["fields"])
+                rows += len(module_data["models"]) + len(module_data["fields"])
+
+                for phase, (source, identity) in _RELATIONSHIP_SOURCES.items():
+                    rows_by_key = relationships[phase]
+                    for rel in module_data[source]:
+                        rows_by_key.setdefault(identity(rel), rel)
+
+                if rows >= self.megabatch_size:
+                    payloads.put(payload)
+                    payload = self._new_model_payload()
+                    rows = 0
+
+            if rows and not load_failed.is_set():
+                payloads.put(payload)
+        finally:
+            # Stops the extraction workers if the loop was left early
+            module_datas.close()
+            payloads.put(None)
+            loader.join()
+
+        if load_result["exception"] is not None:
+            raise load_result["exception"]
+
+        self.stats["relationships_created"] += load_result["created"]
+        self.stats["errors"] += load_result["errors"]
+        self._record_phase("extract_and_load_nodes", phase_start)
+        logger.info(
+            "Completed modules, models and fields: %d created, %d errors",
+            load_result["created"],
+            load_result["errors"]
+        )
+
+        # Load relationships between existing nodes: module dependencies,
+        # model inheritance/delegation and field references. Batches of all
+        # four phases are pipelined and committed once per megabatch, with
+        # several transactions in flight when parallel loading is enabled;
+        # rows are distinct by identity, so no two transactions MERGE the
+        # same relationship.
+        phase_start = time.perf_counter()
+        logger.info(
+            "Loading %d module dependencies, %d inheritance, %d delegation and "
+            "%d field reference relationships...",
+            len(relationships["module_dependencies"]),
+            len(relationships["model_inheritance"]),
+            len(relationships["model_delegation"]),
+            len(relationships["field_references"])
+        )
+        result = create_relationships_pipelined(
+            self.connection,
+            {phase: list(rows_by_key.values()) for phase, rows_by_key in relationships.items()},
+            self.batch_size,
+            self.megabatch_size,
+            self.max_workers
+        )
+        self.stats["relationships_created"] += result["created"]
+        self.stats["errors"] += result["errors"]
+        self._record_phase("load_relationships", phase_start)
+
+    def _record_phase(self, phase: str, start: float) -> None:
+        """
+        Record the duration of an indexing phase in the statistics.
+
+        Args:
+            phase: Phase name, used as key of stats["phase_seconds"]
+            start: time.perf_counter() value taken when the phase started
+        """
+        elapsed = time.perf_counter() - start
+        self.stats["phase_seconds"][phase] = elapsed
+        logger.debug("Phase %s took %.2fs", phase, elapsed)
+
+    def _load_payloads(
         self,
-        module_path: Path,
-        existing_hashes: Dict[str, str]
-    ) -> Optional[Dict[str, Any]]:
+        payloads: queue.Queue,
+        load_result: Dict[str, Any],
+        load_failed: threading.Event
+    ) -> None:
         """
-        Extract all data from a single module.
+        Loader thread: write node payloads until the ``None`` sentinel.
+
+        Payloads are written sequentially on one session, in module order,
+        so the last module defining a model sets its properties. If loading
+        fails ``load_failed`` is set so the producer stops extracting, and
+        the queue is still drained, so it is never left blocked on a full
+        queue.
 
         Args:
-            module_path: Path to module directory
-            existing_hashes: Dictionary of existing file hashes
+            payloads: Queue of payloads for create_models_with_relations_batch
+            load_result: Dictionary receiving created/errors counts and any
+                exception raised while loading
+            load_failed: Event set when loading fails
+        """
+        try:
+            for _, result in run_batches(
+                self.connection,
+                iter(payloads.get, None),
+                create_models_with_relations_batch
+            ):
+                load_result["created"] += result["created"]
+                load_result["errors"] += result["errors"]
+        except Exception as e:
+            logger.error("Loader thread failed: %s", e)
+            load_result["exception"] = e
+            load_failed.set()
+            for _ in iter(payloads.get, None):
+                pass
+
+    @staticmethod
+    def _new_model_payload() -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Create an empty payload for create_models_with_relations_batch.
 
         Returns:
-            Dictionary with module data or None if skipped
+            Dictionary with an empty list per query parameter
         """
-        data = {
-            "module": None,
-            "dependencies": [],
+        return {
+            "modules": [],
             "models": [],
             "model_module_rels": [],
-            "model_inheritance": [],
-            "model_delegation": [],
-            "fields": [],
-            "field_model_rels": [],
-            "field_references": []
+            "fields": []
         }
 
-        # Parse manifest
-        manifest_path = module_path / "__manifest__.py"
-        if not manifest_path.exists():
-            logger.warning(f"No manifest found for {module_path.name}")
-            return None
+    def _save_hash_cache(self) -> None:
+        """
+        Save the hash cache entries of this run's files.
 
-        # Check if manifest has changed
-        manifest_hash = compute_file_hash(manifest_path)
-        if existing_hashes.get(str(manifest_path)) == manifest_hash:
-            logger.debug(f"Skipping unchanged module: {module_path.name}")
-            return None
+        The cache file is shared by every addons root indexed with the same
+        CACHE_DIR: entries outside ``odoo_path`` are kept as they are on
+        disk, and only this root's entries are replaced.
+        """
+        root_prefix = os.path.join(str(self.odoo_path), "")
+        cache = {
+            path: entry
+            for path, entry in load_hash_cache(self.hash_cache_path).items()
+            if not path.startswith(root_prefix)
+        }
+        cache.update(self.file_hashes)
+        save_hash_cache(self.hash_cache_path, cache)
+
+    def _get_existing_file_hashes(self) -> Dict[str, str]:
+        """
+        Get file hashes of already indexed files.
+
+        Returns:
+            Dictionary mapping file path to hash
+        """
+        query, parameters = get_file_hashes()
+        records = self.connection.execute_query(query, parameters)
+        return {record["file_path"]: record["file_hash"] for record in records}
+
+    def _check_memory(self) -> None:
+        """Check memory usage and warn if threshold exceeded."""
+        usage = self.memory_monitor.get_current_usage()
+        if usage["percent"] > self.max_memory_percent:
+            logger.warning(
+                "Memory usage high: %.1f%% (%.0fMB / %.0fMB)",
+                usage["percent"],
+                usage["used_mb"],
+                usage["total_mb"]
+            )
+
+
+# ============================================================================
+# Extraction Workers
+# ============================================================================
 
-        manifest = parse_manifest(module_path)
+def _extract_module_data(
+    module_path: Path,
+    manifest_file: str,
+    existing_hashes: Dict[str, str],
+    hash_cache: Dict[str, HashCacheEntry]
+) -> Optional[Dict[str, Any]]:
+    """
+    Extract all data from a single module.
+
+    Pure function of its arguments so it can run in a worker process; the
+    number of model files that failed to parse is returned under "errors"
+    and the updated hash cache entries of its files under "file_hashes".
+    When the manifest is unchanged, "module" is None and no dependencies
+    are returned, but changed model files are still extracted.
+
+    Args:
+        module_path: Path to module directory
+        manifest_file: Name of the manifest file found in the module
+        existing_hashes: Dictionary of existing file hashes
+        hash_cache: Hash cache entries of this module's files from the
+            previous run
+
+    Returns:
+        Dictionary with module data, or None if the module has no usable
+        manifest
+    """
+    data = {
+        "module": None,
+        "dependencies": [],
+        "models": [],
+        "model_module_rels": [],
+        "model_inheritance": [],
+        "model_delegation": [],
+        "fields": [],
+        "field_references": [],
+        "errors": 0,
+        "file_hashes": {}
+    }
+
+    # Parse manifest
+    # Discovery already saw the manifest; only __manifest__.py modules are indexed
+    if manifest_file != "__manifest__.py":
+        logger.warning("No manifest found for %s", module_path.name)
+        return None
+    manifest_path = module_path / manifest_file
+
+    # An unchanged manifest only means the module node and its dependencies
+    # are up to date: its model files are still checked one by one below
+    manifest_hash, manifest_changed = check_file_hash(
+        manifest_path,
+        existing_hashes.get(str(manifest_path)),
+        hash_cache,
+        data["file_hashes"]
+    )
+
+    # Use technical module name (directory name) as unique identifier
+    technical_name = module_path.name
+
+    if manifest_changed:
+        manifest = parse_manifest(module_path, manifest_file)
         if not manifest:
-            logger.warning(f"Failed to parse manifest for {module_path.name}")
+            logger.warning("Failed to parse manifest for %s", technical_name)
             return None
 
-        # Use technical module name (directory name) as unique identifier
         # Store display name separately
-        technical_name = manifest.get("module_name", module_path.name)  # From manifest parser
         display_name = manifest.get("name", technical_name)  # Human-readable name
 
         data["module"] = {
@@ -287,252 +666,223 @@ class OdooIndexer:
                 "from": technical_name,
                 "to": dep
             })
+    else:
+        logger.debug("Manifest unchanged, checking model files only: %s", technical_name)
+
+    # Parse models
+    model_files = list(find_model_files(module_path))
+    logger.debug("Found %d model files in %s", len(model_files), technical_name)
+    model_priority = _model_priority(module_path)
+
+    for model_file in model_files:
+        try:
+            # Check if model file has changed
+            model_hash, model_changed = check_file_hash(
+                model_file,
+                existing_hashes.get(str(model_file)),
+                hash_cache,
+                data["file_hashes"]
+            )
+            if not model_changed:
+                logger.debug("Skipping unchanged model file: %s", model_file.name)
+                continue
 
-        # Parse models
-        model_files = list(find_model_files(module_path))
-        logger.debug(f"Found {len(model_files)} model files in {technical_name}")
+            models = parse_model_file(model_file, technical_name)
 
-        for model_file in model_files:
-            try:
-                # Check if model file has changed
-                model_hash = compute_file_hash(model_file)
-                if existing_hashes.get(str(model_file)) == model_hash:
-                    logger.debug(f"Skipping unchanged model file: {model_file.name}")
+            for model in models:
+                model_name = model.get("name")
+                if not model_name:
+                    logger.warning("Model without name in %s", model_file)
                     continue
 
-                models = parse_model_file(model_file, technical_name)
+                # Create model node data
+                data["models"].append({
+                    "name": model_name,
+                    "description": model.get("description", ""),
+                    "module": technical_name,
+                    "file_path": str(model_file),
+                    "line_number": model.get("line_number", 0),
+                    "class_name": model.get("class_name", ""),
+                    "file_hash": model_hash,
+                    "priority": model_priority
+                })
+
+                # Create DEFINED_IN relationship
+                data["model_module_rels"].append({
+                    "model": model_name,
+                    "module": technical_name
+                })
+
+                # Create INHERITS_FROM relationships
+                inherit = model.get("inherit", [])
+                if inherit:
+                    for parent in inherit:
+                        data["model_inheritance"].append({
+                            "from": model_name,
+                            "to": parent
+                        })
 
-                for model in models:
-                    model_name = model.get("name")
-                    if not model_name:
-                        logger.warning(f"Model without name in {model_file}")
+                # Create DELEGATES_TO relationships
+                inherits = model.get("inherits", {})
+                if inherits:
+                    for parent_model, field_name in inherits.items():
+                        data["model_delegation"].append({
+                            "from": model_name,
+                            "to": parent_model,
+                            "field": field_name
+                        })
+
+                # Process fields
+                fields = model.get("fields", [])
+                for field in fields:
+                    # Skip if field is not a dictionary
+                    if not isinstance(field, dict):
+                        logger.warning("Skipping invalid field in %s: %s", model_name, field)
                         continue
 
-                    # Create model node data
-                    data["models"].append({
-                        "name": model_name,
-                        "description": model.get("description", ""),
-                        "module": technical_name,
-                        "file_path": str(model_file),
-                        "line_number": model.get("line_number", 0),
-                        "class_name": model.get("class_name", ""),
-                        "file_hash": model_hash
-                    })
-
-                    self.stats["models_found"] += 1
-                    self.stats["models_indexed"] += 1
-
-                    # Create DEFINED_IN relationship
-                    data["model_module_rels"].append({
-                        "model": model_name,
-                        "module": technical_name
-                    })
-
-                    # Create INHERITS_FROM relationships
-                    inherit = model.get("inherit", [])
-                    if inherit:
-                        for parent in inherit:
-                            data["model_inheritance"].append({
-                                "from": model_name,
-                                "to": parent
-                            })
-
-                    # Create DELEGATES_TO relationships
-                    inherits = model.get("inherits", {})
-                    if inherits:
-                        for parent_model, field_name in inherits.items():
-                            data["model_delegation"].append({
-                                "from": model_name,
-                                "to": parent_model,
-                                "field": field_name
-                            })
-
-                    # Process fields
-                    fields = model.get("fields", [])
-                    for field in fields:
-                        # Skip if field is not a dictionary
-                        if not isinstance(field, dict):
-                            logger.warning(f"Skipping invalid field in {model_name}: {field}")
-                            continue
-
-                        field_name = field.get("name")
-                        if not field_name:
-                            continue
-
-                        # Create field node data with all parameters
-                        field_data = {
-                            "name": field_name,
-                            "model_name": model_name,
-                            "field_type": field.get("type", ""),
-                            "string": field.get("string"),
-                            "required": field.get("required"),
-                            "readonly": field.get("readonly"),
-                            "help": field.get("help"),
-                            "default": field.get("default"),
-                            "compute": field.get("compute"),
-                            "store": field.get("store"),
-                            "related": field.get("related"),
-                            "depends": field.get("depends"),
-                            "inverse_name": field.get("inverse_name"),
-                            "comodel_name": field.get("comodel_name"),
-                            "domain": field.get("domain"),
-                            "selection": field.get("selection"),
-                            "states": field.get("states"),
-                            "copy": field.get("copy"),
-                            "index": field.get("index"),
-                            "translate": field.get("translate"),
-                            "digits": field.get("digits"),
-                            "sanitize": field.get("sanitize"),
-                            "strip_style": field.get("strip_style")
-                        }
-
-                        data["fields"].append(field_data)
-                        self.stats["fields_found"] += 1
-                        self.stats["fields_indexed"] += 1
-
-                        # Create BELONGS_TO relationship
-                        data["field_model_rels"].append({
+                    field_name = field.get("name")
+                    if not field_name:
+                        continue
+
+                    # Create field node data with all parameters
+                    field_data = {
+                        "name": field_name,
+                        "model_name": model_name,
+                        "field_type": field.get("type", ""),
+                        "is_computed": field.get("compute") is not None
+                    }
+                    # Unset parameters are left out: they would only add bytes
+                    # on the wire, and SET f = field removes the properties
+                    # missing from the row (e.g. a compute= that was deleted)
+                    field_data.update(
+                        item
+                        for item in zip(_FIELD_PARAM_KEYS, map(field.get, _FIELD_PARAM_KEYS))
+                        if item[1] is not None
+                    )
+
+                    data["fields"].append(field_data)
+
+                    # Create REFERENCES relationship for relational fields
+                    comodel = field.get("comodel_name")
+                    if comodel:
+                        data["field_references"].append({
                             "field_name": field_name,
-                            "model_name": model_name
+                            "model_name": model_name,
+                            "comodel": comodel
                         })
 
-                        # Create REFERENCES relationship for relational fields
-                        comodel = field.get("comodel_name")
-                        if comodel:
-                            data["field_references"].append({
-                                "field_name": field_name,
-                                "model_name": model_name,
-                                "comodel": comodel
-                            })
+        except Exception as e:
+            logger.error("Failed to parse model file %s: %s", model_file, e)
+            data["errors"] += 1
 
-            except Exception as e:
-                logger.error(f"Failed to parse model file {model_file}: {str(e)}")
-                self.stats["errors"] += 1
+    return data
 
-        return data
 
-    def _load_all_data(self, data: Dict[str, Any]) -> None:
-        """
-        Load all extracted data into Neo4j.
+def _extract_module_data_worker(
+    task: Tuple[Path, str, Dict[str, str], Dict[str, HashCacheEntry]]
+) -> Tuple[Path, Optional[Dict[str, Any]], Optional[str], Dict[str, HashCacheEntry]]:
+    """
+    Run _extract_module_data, capturing failures instead of raising.
 
-        Args:
-            data: Dictionary with extracted data
-        """
-        # Load modules
-        logger.info(f"Loading {len(data['modules'])} modules...")
-        result = process_in_batches(
-            self.connection,
-            data["modules"],
-            self.batch_size,
-            create_modules_batch,
-            "modules"
-        )
-        self.stats["relationships_created"] += result["created"]
+    An exception escaping a pool worker would abort the whole map, so errors
+    are returned to the main process and counted there.
 
-        # Load module dependencies
-        logger.info(f"Loading {len(data['module_dependencies'])} module dependencies...")
-        result = process_in_batches(
-            self.connection,
-            data["module_dependencies"],
-            self.batch_size,
-            create_module_dependencies_batch,
-            "module dependencies"
-        )
-        self.stats["relationships_created"] += result["created"]
+    Args:
+        task: Tuple of (module directory, manifest file name, existing file
+            hashes of this module's files, hash cache entries of this
+            module's files)
 
-        # Load models
-        logger.info(f"Loading {len(data['models'])} models...")
-        result = process_in_batches(
-            self.connection,
-            data["models"],
-            self.batch_size,
-            create_models_batch,
-            "models"
-        )
-        self.stats["relationships_created"] += result["created"]
+    Returns:
+        Tuple of (module path, module data or None, error message or None,
+        hash cache entries to keep for this module). Modules that were not
+        re-hashed keep their previous entries, so they are not hashed
+        again next run.
+    """
+    module_path, manifest_file, existing_hashes, hash_cache = task
+    try:
+        module_data = _extract_module_data(module_path, manifest_file, existing_hashes, hash_cache)
+    except Exception as e:
+        return module_path, None, str(e), hash_cache
+
+    if module_data is None:
+        return module_path, None, None, hash_cache
+    return module_path, module_data, None, module_data["file_hashes"]
+
+
+def _map_bounded(
+    executor: Executor,
+    func: Callable[[Any], Any],
+    items: Iterable[Any],
+    window: int
+) -> Iterator[Any]:
+    """
+    Map a function over items in an executor with a bounded window.
 
-        # Load model-module relationships
-        logger.info(f"Loading {len(data['model_module_rels'])} model-module relationships...")
-        result = process_in_batches(
-            self.connection,
-            data["model_module_rels"],
-            self.batch_size,
-            create_model_module_relationships_batch,
-            "model-module relationships"
-        )
-        self.stats["relationships_created"] += result["created"]
+    Executor.map submits every item up front, which would run the whole
+    directory walk before the first result and let finished results pile
+    up while the loader is busy. Here an item is only submitted once an
+    earlier result has been taken, so at most ``window`` tasks are pending.
 
-        # Load model inheritance
-        logger.info(f"Loading {len(data['model_inheritance'])} model inheritance relationships...")
-        result = process_in_batches(
-            self.connection,
-            data["model_inheritance"],
-            self.batch_size,
-            create_model_inheritance_batch,
-            "model inheritance"
-        )
-        self.stats["relationships_created"] += result["created"]
+    Args:
+        executor: Executor running the tasks
+        func: Function to call for each item
+        items: Iterable of items, consumed lazily
+        window: Maximum number of submitted, not yet consumed tasks
 
-        # Load model delegation
-        logger.info(f"Loading {len(data['model_delegation'])} model delegation relationships...")
-        result = process_in_batches(
-            self.connection,
-            data["model_delegation"],
-            self.batch_size,
-            create_model_delegation_batch,
-            "model delegation"
-        )
-        self.stats["relationships_created"] += result["created"]
+    Yields:
+        Results of func, in input order
+    """
+    pending = deque()
+    for item in items:
+        pending.append(executor.submit(func, item))
+        if len(pending) >= window:
+            yield pending.popleft().result()
 
-        # Load fields
-        logger.info(f"Loading {len(data['fields'])} fields...")
-        result = process_in_batches(
-            self.connection,
-            data["fields"],
-            self.batch_size,
-            create_fields_batch,
-            "fields"
-        )
-        self.stats["relationships_created"] += result["created"]
+    while pending:
+        yield pending.popleft().result()
 
-        # Load field-model relationships
-        logger.info(f"Loading {len(data['field_model_rels'])} field-model relationships...")
-        result = process_in_batches(
-            self.connection,
-            data["field_model_rels"],
-            self.batch_size,
-            create_field_model_relationships_batch,
-            "field-model relationships"
-        )
-        self.stats["relationships_created"] += result["created"]
 
-        # Load field references
-        logger.info(f"Loading {len(data['field_references'])} field reference relationships...")
-        result = process_in_batches(
-            self.connection,
-            data["field_references"],
-            self.batch_size,
-            create_field_references_batch,
-            "field references"
-        )
-        self.stats["relationships_created"] += result["created"]
+def _model_priority(module_path: Path) -> int:
+    """
+    Rank the model definitions of a module for find_model_by_name.
 
-    def _get_existing_file_hashes(self) -> Dict[str, str]:
-        """
-        Get file hashes of already indexed files.
+    All model files of a module share the same rank, so it is derived once
+    from the module directory instead of matching every file path.
 
-        Returns:
-            Dictionary mapping file path to hash
-        """
-        # TODO: Implement query to get existing hashes from database
-        # For now, return empty dict (no incremental support yet)
-        return {}
+    Args:
+        module_path: Path to the module directory
 
-    def _check_memory(self) -> None:
-        """Check memory usage and warn if threshold exceeded."""
-        usage = self.memory_monitor.get_current_usage()
-        if usage["percent"] > self.max_memory_percent:
-            logger.warning(
-                f"Memory usage high: {usage['percent']:.1f}% "
-                f"({usage['used_mb']:.0f}MB / {usage['total_mb']:.0f}MB)"
-            )
+    Returns:
+        1 for core addons, 3 for localization modules, 2 otherwise
+    """
+    module_dir = module_path.name
+    if module_dir in _CORE_ADDON_MODULES and module_path.parent.name == "addons":
+        return 1
+    if module_dir.startswith("l10n_"):
+        return 3
+    return 2
+
+
+def _slice_by_path_prefix(
+    sorted_paths: List[str],
+    hashes: Dict[str, Any],
+    directory: Path
+) -> Dict[str, Any]:
+    """
+    Select the file hashes (or hash cache entries) under a directory.
+
+    Args:
+        sorted_paths: Sorted keys of ``hashes``
+        hashes: Dictionary keyed by file path
+        directory: Directory whose files to select
+
+    Returns:
+        Dictionary with the entries of files below ``directory``
+    """
+    prefix = os.path.join(str(directory), "")
+    # Keys below the directory form one contiguous range of sorted_paths;
+    # it ends before the first key past the prefix's last character
+    upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+    start = bisect_left(sorted_paths, prefix)
+    end = bisect_left(sorted_paths, upper, start)
+    return {path: hashes[path] for path in sorted_paths[start:end]}
@@ -8,36 +8,84 @@ This module provides ready-to-use queries for:
 - Searching fields
 """
 
+import functools
 from typing import Dict, List, Any
+from config.settings import get_settings
 from graph.schema import NodeLabel, RelationType, ModuleProperty, ModelProperty, FieldProperty
 
+# Query strings only depend on schema constants, so they are built once at
+# import time. Functions with optional filters pick one of the precomputed
+# variants; queries with a variable-length path bound are cached per depth
+# bucket and filtered down to the requested depth with a parameter. Read-heavy
+# queries are prefixed with the configured CYPHER_RUNTIME when requested.
 
-# ============================================================================
-# Module Queries
-# ============================================================================
+# Variable-length bounds cannot be parameters, so requested depths are rounded
+# up to one of these to keep the number of distinct query plans small.
+_DEPTH_BUCKETS = (3, 5, 10, 20)
 
-def find_module_by_name(module_name: str) -> tuple[str, Dict[str, str]]:
+
+def _depth_bucket(depth: int) -> int:
+    """Round a requested path depth up to the nearest depth bucket."""
+    depth = int(depth)
+    for bucket in _DEPTH_BUCKETS:
+        if depth <= bucket:
+            return bucket
+    return depth
+
+
+def _limit(limited: bool) -> str:
+    """Render the LIMIT clause of a listing query, or nothing if unlimited."""
+    return "LIMIT $limit" if limited else ""
+
+
+def _count_total(limited: bool, pattern: str) -> str:
     """
-    Find a module by name.
+    Render a subquery counting every match of a limited listing query.
 
-    Returns:
-        Tuple of (query, parameters)
+    The count is carried as a `total` column on each returned row, so the
+    caller can report "showing X of Y" without a second round-trip.
     """
-    query = f"""
+    if not limited:
+        return ""
+
+    return f"""CALL {{
+            MATCH {pattern}
+            RETURN count(*) as total
+        }}"""
+
+
+@functools.lru_cache(maxsize=64)
+def _with_runtime(query: str, runtime: str) -> str:
+    """Prefix a read query with a CYPHER runtime option, if one is set."""
+    return f"CYPHER runtime={runtime}{query}" if runtime else query
+
+
+def _read_query(query: str) -> str:
+    """Apply the CYPHER_RUNTIME setting to a read-heavy query."""
+    return _with_runtime(query, get_settings().cypher_runtime)
+
+
+# ============================================================================
+# Module Queries
+# ============================================================================
+
+_FIND_MODULE_BY_NAME_QUERY = f"""
         MATCH (m:{NodeLabel.MODULE} {{{ModuleProperty.NAME}: $name}})
         RETURN m
     """
-    return query, {"name": module_name}
 
 
-def get_module_dependencies(module_name: str) -> tuple[str, Dict[str, str]]:
+def find_module_by_name(module_name: str) -> tuple[str, Dict[str, str]]:
     """
-    Get all modules that a given module depends on.
+    Find a module by name.
 
     Returns:
         Tuple of (query, parameters)
     """
-    query = f"""
+    return _FIND_MODULE_BY_NAME_QUERY, {"name": module_name}
+
+
+_MODULE_DEPENDENCIES_QUERY = f"""
         MATCH (m:{NodeLabel.MODULE} {{{ModuleProperty.NAME}: $name}})
               -[:{RelationType.DEPENDS_ON}]->(dep:{NodeLabel.MODULE})
         RETURN dep.{ModuleProperty.NAME} as dependency,
@@ -45,17 +93,19 @@ def get_module_dependencies(module_name: str) -> tuple[str, Dict[str, str]]:
                dep.{ModuleProperty.CATEGORY} as category
         ORDER BY dep.{ModuleProperty.NAME}
     """
-    return query, {"name": module_name}
 
 
-def get_module_dependents(module_name: str) -> tuple[str, Dict[str, str]]:
+def get_module_dependencies(module_name: str) -> tuple[str, Dict[str, str]]:
     """
-    Get all modules that depend on a given module.
+    Get all modules that a given module depends on.
 
     Returns:
         Tuple of (query, parameters)
     """
-    query = f"""
+    return _MODULE_DEPENDENCIES_QUERY, {"name": module_name}
+
+
+_MODULE_DEPENDENTS_QUERY = f"""
         MATCH (dependent:{NodeLabel.MODULE})
               -[:{RelationType.DEPENDS_ON}]->(m:{NodeLabel.MODULE} {{{ModuleProperty.NAME}: $name}})
         RETURN dependent.{ModuleProperty.NAME} as dependent,
@@ -63,34 +113,35 @@ def get_module_dependents(module_name: str) -> tuple[str, Dict[str, str]]:
                dependent.{ModuleProperty.CATEGORY} as category
         ORDER BY dependent.{ModuleProperty.NAME}
     """
-    return query, {"name": module_name}
 
 
-def list_all_modules(category: str = None, installable: bool = None) -> tuple[str, Dict[str, Any]]:
+def get_module_dependents(module_name: str) -> tuple[str, Dict[str, str]]:
     """
-    List all modules with optional filters.
-
-    Args:
-        category: Filter by category (optional)
-        installable: Filter by installable flag (optional)
+    Get all modules that depend on a given module.
 
     Returns:
         Tuple of (query, parameters)
     """
-    conditions = []
-    params = {}
+    return _MODULE_DEPENDENTS_QUERY, {"name": module_name}
 
-    if category:
-        conditions.append(f"m.{ModuleProperty.CATEGORY} = $category")
-        params["category"] = category
 
-    if installable is not None:
+def _build_list_all_modules_query(has_category: bool, has_installable: bool) -> str:
+    """Build the list_all_modules query for a combination of filters."""
+    conditions = []
+    if has_category:
+        conditions.append(f"m.{ModuleProperty.CATEGORY} = $category")
+    if has_installable:
         conditions.append(f"m.{ModuleProperty.INSTALLABLE} = $installable")
-        params["installable"] = installable
 
-    where_clause = "WHERE " + " AND ".join(conditions) if conditions else ""
+    if not conditions:
+        # Lets the planner scan the unique name index, which already yields
+        # rows in name order, and drop the Sort. No index hint: Neo4j rejects
+        # it when the schema was not created (AUTO_CREATE_INDEXES=false)
+        conditions.append(f"m.{ModuleProperty.NAME} IS NOT NULL")
+
+    where_clause = "WHERE " + " AND ".join(conditions)
 
-    query = f"""
+    return f"""
         MATCH (m:{NodeLabel.MODULE})
         {where_clause}
         RETURN m.{ModuleProperty.NAME} as name,
@@ -100,138 +151,169 @@ def list_all_modules(category: str = None, installable: bool = None) -> tuple[st
                m.{ModuleProperty.INSTALLABLE} as installable
         ORDER BY m.{ModuleProperty.NAME}
     """
-    return query, params
 
 
-# ============================================================================
-# Model Queries
-# ============================================================================
+# Keyed by (category filter, installable filter)
+_LIST_ALL_MODULES_QUERIES = {
+    (has_category, has_installable): _build_list_all_modules_query(has_category, has_installable)
+    for has_category in (False, True)
+    for has_installable in (False, True)
+}
 
-def find_model_by_name(model_name: str) -> tuple[str, Dict[str, str]]:
+
+def list_all_modules(category: str = None, installable: bool = None) -> tuple[str, Dict[str, Any]]:
     """
-    Find a model by name.
+    List all modules with optional filters.
 
-    Returns all definitions (base + extensions via inheritance).
-    The base definition (from core modules) is prioritized first based on file path.
+    Args:
+        category: Filter by category (optional)
+        installable: Filter by installable flag (optional)
 
     Returns:
         Tuple of (query, parameters)
     """
-    query = f"""
+    params = {}
+
+    if category:
+        params["category"] = category
+
+    if installable is not None:
+        params["installable"] = installable
+
+    query = _LIST_ALL_MODULES_QUERIES[(bool(category), installable is not None)]
+    return _read_query(query), params
+
+
+# ============================================================================
+# Model Queries
+# ============================================================================
+
+_FIND_MODEL_BY_NAME_QUERY = f"""
         MATCH (model:{NodeLabel.MODEL} {{{ModelProperty.NAME}: $name}})
         OPTIONAL MATCH (model)-[:{RelationType.DEFINED_IN}]->(module:{NodeLabel.MODULE})
-        WITH model, module,
-             CASE
-                // Prioritize by file path - base modules are in /addons/<module_name>/
-                WHEN model.{ModelProperty.FILE_PATH} CONTAINS '/addons/stock/' THEN 1
-                WHEN model.{ModelProperty.FILE_PATH} CONTAINS '/addons/sale/' THEN 1
-                WHEN model.{ModelProperty.FILE_PATH} CONTAINS '/addons/account/' THEN 1
-                WHEN model.{ModelProperty.FILE_PATH} CONTAINS '/addons/purchase/' THEN 1
-                WHEN model.{ModelProperty.FILE_PATH} CONTAINS '/addons/mrp/' THEN 1
-                WHEN model.{ModelProperty.FILE_PATH} CONTAINS '/addons/project/' THEN 1
-                // Then modules that don't contain l10n
-                WHEN NOT model.{ModelProperty.FILE_PATH} CONTAINS '/l10n_' THEN 2
-                // Last: localization modules
-                ELSE 3
-             END as priority
-        RETURN DISTINCT model,
+        RETURN DISTINCT model.{ModelProperty.NAME} as name,
+               model.{ModelProperty.DESCRIPTION} as description,
+               model.{ModelProperty.CLASS_NAME} as class_name,
+               model.{ModelProperty.FILE_PATH} as file_path,
+               model.{ModelProperty.LINE_NUMBER} as line_number,
                module.{ModuleProperty.NAME} as module_name,
-               priority
-        ORDER BY priority, model.{ModelProperty.FILE_PATH}
+               model.{ModelProperty.PRIORITY} as priority
+        ORDER BY priority, file_path
         LIMIT 5
     """
-    return query, {"name": model_name}
 
 
-def get_model_inheritance_tree(model_name: str, max_depth: int = 10) -> tuple[str, Dict[str, Any]]:
+def find_model_by_name(model_name: str) -> tuple[str, Dict[str, str]]:
     """
-    Get the inheritance tree for a model.
+    Find a model by name.
 
-    Args:
-        model_name: Model name
-        max_depth: Maximum inheritance depth
+    Returns all definitions (base + extensions via inheritance).
+    The base definition (from core modules) is prioritized first, using the
+    priority stored on each model at indexing time.
 
     Returns:
         Tuple of (query, parameters)
     """
-    query = f"""
+    return _FIND_MODEL_BY_NAME_QUERY, {"name": model_name}
+
+
+@functools.lru_cache(maxsize=32)
+def _model_inheritance_tree_query(max_depth: int) -> str:
+    """Build the get_model_inheritance_tree query for a depth bucket."""
+    return f"""
         MATCH path = (m:{NodeLabel.MODEL} {{{ModelProperty.NAME}: $name}})
                      -[:{RelationType.INHERITS_FROM}*0..{max_depth}]->(parent:{NodeLabel.MODEL})
+        WHERE length(path) <= $max_depth
         RETURN m.{ModelProperty.NAME} as model,
                parent.{ModelProperty.NAME} as parent,
                length(path) as depth
         ORDER BY depth
     """
-    return query, {"name": model_name}
 
 
-def get_model_children(model_name: str) -> tuple[str, Dict[str, str]]:
+def get_model_inheritance_tree(model_name: str, max_depth: int = 10) -> tuple[str, Dict[str, Any]]:
     """
-    Get all models that inherit from a given model.
+    Get the inheritance tree for a model.
+
+    Args:
+        model_name: Model name
+        max_depth: Maximum inheritance depth
 
     Returns:
         Tuple of (query, parameters)
     """
-    query = f"""
+    query = _model_inheritance_tree_query(_depth_bucket(max_depth))
+    return query, {"name": model_name, "max_depth": max_depth}
+
+
+_MODEL_CHILDREN_QUERY = f"""
         MATCH (child:{NodeLabel.MODEL})
               -[:{RelationType.INHERITS_FROM}]->(parent:{NodeLabel.MODEL} {{{ModelProperty.NAME}: $name}})
         RETURN child.{ModelProperty.NAME} as child,
                child.{ModelProperty.DESCRIPTION} as description
         ORDER BY child.{ModelProperty.NAME}
     """
-    return query, {"name": model_name}
 
 
-def get_model_delegation(model_name: str) -> tuple[str, Dict[str, str]]:
+def get_model_children(model_name: str) -> tuple[str, Dict[str, str]]:
     """
-    Get models that a given model delegates to (_inherits).
+    Get all models that inherit from a given model.
 
     Returns:
         Tuple of (query, parameters)
     """
-    query = f"""
+    return _MODEL_CHILDREN_QUERY, {"name": model_name}
+
+
+_MODEL_DELEGATION_QUERY = f"""
         MATCH (m:{NodeLabel.MODEL} {{{ModelProperty.NAME}: $name}})
               -[r:{RelationType.DELEGATES_TO}]->(delegated:{NodeLabel.MODEL})
         RETURN delegated.{ModelProperty.NAME} as delegated_model,
                r.field as field_name
         ORDER BY delegated.{ModelProperty.NAME}
     """
-    return query, {"name": model_name}
 
 
-def list_models_in_module(module_name: str) -> tuple[str, Dict[str, str]]:
+def get_model_delegation(model_name: str) -> tuple[str, Dict[str, str]]:
     """
-    List all models defined in a module.
+    Get models that a given model delegates to (_inherits).
 
     Returns:
         Tuple of (query, parameters)
     """
-    query = f"""
+    return _MODEL_DELEGATION_QUERY, {"name": model_name}
+
+
+_MODELS_IN_MODULE_QUERY = f"""
         MATCH (model:{NodeLabel.MODEL})
               -[:{RelationType.DEFINED_IN}]->(module:{NodeLabel.MODULE} {{{ModuleProperty.NAME}: $name}})
         RETURN model.{ModelProperty.NAME} as name,
                model.{ModelProperty.DESCRIPTION} as description,
-               model.{ModelProperty.FILE_PATH} as file_path
+               last(split(model.{ModelProperty.FILE_PATH}, '/')) as filename
         ORDER BY model.{ModelProperty.NAME}
     """
-    return query, {"name": module_name}
 
 
-def list_all_models(module: str = None) -> tuple[str, Dict[str, Any]]:
+def list_models_in_module(module_name: str) -> tuple[str, Dict[str, str]]:
     """
-    List all models with optional module filter.
+    List all models defined in a module, with the file name (not the full
+    path) of each definition.
 
     Returns:
         Tuple of (query, parameters)
     """
-    params = {}
-    where_clause = ""
+    return _MODELS_IN_MODULE_QUERY, {"name": module_name}
 
-    if module:
+
+def _build_list_all_models_query(has_module: bool) -> str:
+    """Build the list_all_models query with or without the module filter."""
+    if has_module:
         where_clause = f"WHERE model.{ModelProperty.MODULE} = $module"
-        params["module"] = module
+    else:
+        # Ordered scan of the unique name index, as in list_all_modules
+        where_clause = f"WHERE model.{ModelProperty.NAME} IS NOT NULL"
 
-    query = f"""
+    return f"""
         MATCH (model:{NodeLabel.MODEL})
         {where_clause}
         RETURN model.{ModelProperty.NAME} as name,
@@ -239,182 +321,348 @@ def list_all_models(module: str = None) -> tuple[str, Dict[str, Any]]:
                model.{ModelProperty.MODULE} as module
         ORDER BY model.{ModelProperty.NAME}
     """
-    return query, params
 
 
-# ============================================================================
-# Field Queries
-# ============================================================================
+# Keyed by module filter
+_LIST_ALL_MODELS_QUERIES = {
+    has_module: _build_list_all_models_query(has_module) for has_module in (False, True)
+}
+
 
-def get_model_fields(model_name: str) -> tuple[str, Dict[str, str]]:
+def list_all_models(module: str = None) -> tuple[str, Dict[str, Any]]:
     """
-    Get all fields for a model.
+    List all models with optional module filter.
 
     Returns:
         Tuple of (query, parameters)
     """
-    query = f"""
-        MATCH (field:{NodeLabel.FIELD})
-              -[:{RelationType.BELONGS_TO}]->(model:{NodeLabel.MODEL} {{{ModelProperty.NAME}: $name}})
+    params = {}
+
+    if module:
+        params["module"] = module
+
+    return _read_query(_LIST_ALL_MODELS_QUERIES[bool(module)]), params
+
+
+# ============================================================================
+# Field Queries
+# ============================================================================
+
+def _build_model_fields_query(limited: bool) -> str:
+    """Build the get_model_fields query with or without a row limit."""
+    pattern = f"(field:{NodeLabel.FIELD} {{{FieldProperty.MODEL_NAME}: $name}})"
+    total = ", total" if limited else ""
+
+    return f"""
+        {_count_total(limited, pattern)}
+        MATCH {pattern}
         RETURN field.{FieldProperty.NAME} as name,
                field.{FieldProperty.FIELD_TYPE} as type,
                field.{FieldProperty.STRING} as string,
                field.{FieldProperty.REQUIRED} as required,
                field.{FieldProperty.READONLY} as readonly,
                field.{FieldProperty.HELP} as help,
-               field.{FieldProperty.COMODEL_NAME} as comodel_name
+               field.{FieldProperty.COMODEL_NAME} as comodel_name{total}
         ORDER BY field.{FieldProperty.NAME}
+        {_limit(limited)}
     """
-    return query, {"name": model_name}
 
 
-def find_field_by_name(field_name: str, model_name: str = None) -> tuple[str, Dict[str, Any]]:
+# Keyed by row limit
+_MODEL_FIELDS_QUERIES = {limited: _build_model_fields_query(limited) for limited in (False, True)}
+
+
+def get_model_fields(model_name: str, limit: int = None) -> tuple[str, Dict[str, Any]]:
     """
-    Find fields by name across all models or in a specific model.
+    Get all fields for a model.
+
+    Args:
+        model_name: Technical name of the model
+        limit: Maximum number of fields to return (all if None). When
+            set, each row also carries the unlimited match count as `total`.
 
     Returns:
         Tuple of (query, parameters)
     """
-    params = {"field_name": field_name}
-    where_clauses = [f"field.{FieldProperty.NAME} = $field_name"]
+    params = {"name": model_name}
 
-    if model_name:
-        where_clauses.append("field.model_name = $model_name")
-        params["model_name"] = model_name
+    if limit is not None:
+        params["limit"] = int(limit)
 
-    where_clause = "WHERE " + " AND ".join(where_clauses)
+    return _read_query(_MODEL_FIELDS_QUERIES[limit is not None]), params
 
-    query = f"""
-        MATCH (field:{NodeLabel.FIELD})
-              -[:{RelationType.BELONGS_TO}]->(model:{NodeLabel.MODEL})
-        {where_clause}
+
+def _build_find_field_by_name_query(has_model: bool, limited: bool) -> str:
+    """Build the find_field_by_name query with or without the model filter and row limit."""
+    model_filter = f", {FieldProperty.MODEL_NAME}: $model_name" if has_model else ""
+    pattern = f"(field:{NodeLabel.FIELD} {{{FieldProperty.NAME}: $field_name{model_filter}}})"
+    total = ", total" if limited else ""
+
+    return f"""
+        {_count_total(limited, pattern)}
+        MATCH {pattern}
         RETURN field.{FieldProperty.NAME} as name,
-               model.{ModelProperty.NAME} as model,
+               field.{FieldProperty.MODEL_NAME} as model,
                field.{FieldProperty.FIELD_TYPE} as type,
                field.{FieldProperty.STRING} as string,
-               field.{FieldProperty.REQUIRED} as required
-        ORDER BY model.{ModelProperty.NAME}
+               field.{FieldProperty.REQUIRED} as required{total}
+        ORDER BY field.{FieldProperty.MODEL_NAME}
+        {_limit(limited)}
     """
-    return query, params
 
 
-def find_relational_fields(model_name: str = None) -> tuple[str, Dict[str, Any]]:
+# Keyed by (model filter, row limit)
+_FIND_FIELD_BY_NAME_QUERIES = {
+    (has_model, limited): _build_find_field_by_name_query(has_model, limited)
+    for has_model in (False, True)
+    for limited in (False, True)
+}
+
+
+def find_field_by_name(
+    field_name: str,
+    model_name: str = None,
+    limit: int = None,
+) -> tuple[str, Dict[str, Any]]:
     """
-    Find all relational fields (Many2one, One2many, Many2many).
+    Find fields by name across all models or in a specific model.
+
+    Args:
+        field_name: Field name to search for
+        model_name: Only return the field on this model
+        limit: Maximum number of rows to return (all if None). When set,
+            each row also carries the unlimited match count as `total`.
 
     Returns:
         Tuple of (query, parameters)
     """
-    params = {}
-    where_clause = ""
+    params = {"field_name": field_name}
 
     if model_name:
-        where_clause = "WHERE field.model_name = $model_name"
         params["model_name"] = model_name
 
-    query = f"""
-        MATCH (field:{NodeLabel.FIELD})
+    if limit is not None:
+        params["limit"] = int(limit)
+
+    return _read_query(_FIND_FIELD_BY_NAME_QUERIES[(bool(model_name), limit is not None)]), params
+
+
+def _build_find_relational_fields_query(has_model: bool) -> str:
+    """Build the find_relational_fields query with or without the model filter."""
+    model_filter = f" {{{FieldProperty.MODEL_NAME}: $model_name}}" if has_model else ""
+
+    return f"""
+        MATCH (field:{NodeLabel.FIELD}{model_filter})
               -[:{RelationType.REFERENCES}]->(target:{NodeLabel.MODEL})
-        {where_clause}
         RETURN field.{FieldProperty.NAME} as field_name,
-               field.model_name as source_model,
+               field.{FieldProperty.MODEL_NAME} as source_model,
                field.{FieldProperty.FIELD_TYPE} as field_type,
                target.{ModelProperty.NAME} as target_model
-        ORDER BY field.model_name, field.{FieldProperty.NAME}
+        ORDER BY source_model, field_name
     """
-    return query, params
 
 
-def find_computed_fields(model_name: str = None) -> tuple[str, Dict[str, Any]]:
+# Keyed by model filter
+_FIND_RELATIONAL_FIELDS_QUERIES = {
+    has_model: _build_find_relational_fields_query(has_model) for has_model in (False, True)
+}
+
+
+def find_relational_fields(model_name: str = None) -> tuple[str, Dict[str, Any]]:
     """
-    Find all computed fields.
+    Find all relational fields (Many2one, One2many, Many2many).
 
     Returns:
         Tuple of (query, parameters)
     """
     params = {}
-    where_clauses = [f"field.{FieldProperty.COMPUTE} IS NOT NULL"]
 
     if model_name:
-        where_clauses.append("field.model_name = $model_name")
         params["model_name"] = model_name
 
-    where_clause = "WHERE " + " AND ".join(where_clauses)
+    return _read_query(_FIND_RELATIONAL_FIELDS_QUERIES[bool(model_name)]), params
 
-    query = f"""
-        MATCH (field:{NodeLabel.FIELD})
-              -[:{RelationType.BELONGS_TO}]->(model:{NodeLabel.MODEL})
-        {where_clause}
+
+def _build_find_computed_fields_query(has_model: bool) -> str:
+    """Build the find_computed_fields query with or without the model filter."""
+    model_filter = f", {FieldProperty.MODEL_NAME}: $model_name" if has_model else ""
+
+    return f"""
+        MATCH (field:{NodeLabel.FIELD} {{{FieldProperty.IS_COMPUTED}: true{model_filter}}})
         RETURN field.{FieldProperty.NAME} as field_name,
-               model.{ModelProperty.NAME} as model,
+               field.{FieldProperty.MODEL_NAME} as model,
                field.{FieldProperty.FIELD_TYPE} as type,
                field.{FieldProperty.COMPUTE} as compute_method,
                field.{FieldProperty.STORE} as stored
-        ORDER BY model.{ModelProperty.NAME}, field.{FieldProperty.NAME}
+        ORDER BY model, field_name
     """
-    return query, params
 
 
-# ============================================================================
-# Advanced Queries
-# ============================================================================
+# Keyed by model filter
+_FIND_COMPUTED_FIELDS_QUERIES = {
+    has_model: _build_find_computed_fields_query(has_model) for has_model in (False, True)
+}
 
-def detect_circular_dependencies(max_depth: int = 10) -> tuple[str, Dict[str, int]]:
+
+def find_computed_fields(model_name: str = None) -> tuple[str, Dict[str, Any]]:
     """
-    Detect circular dependencies in modules.
+    Find all computed fields.
 
     Returns:
         Tuple of (query, parameters)
     """
-    query = f"""
-        MATCH path = (m:{NodeLabel.MODULE})
-                     -[:{RelationType.DEPENDS_ON}*1..{max_depth}]->(m)
+    params = {}
+
+    if model_name:
+        params["model_name"] = model_name
+
+    return _read_query(_FIND_COMPUTED_FIELDS_QUERIES[bool(model_name)]), params
+
+
+# ============================================================================
+# Advanced Queries
+# ============================================================================
+
+@functools.lru_cache(maxsize=32)
+def _circular_dependencies_query(max_depth: int) -> str:
+    """Build the detect_circular_dependencies query for a depth bucket."""
+    # shortestPath cannot start and end on the same node, so each cycle is
+    # the first hop out of m plus the shortest path from there back to m; a
+    # module depending on itself is its own one-hop branch
+    return f"""
+        MATCH (m:{NodeLabel.MODULE})
+        CALL {{
+            WITH m
+            MATCH (m)-[:{RelationType.DEPENDS_ON}]->(m)
+            RETURN 1 as cycle_length,
+                   [m.{ModuleProperty.NAME}, m.{ModuleProperty.NAME}] as cycle_path
+            UNION
+            WITH m
+            MATCH (m)-[:{RelationType.DEPENDS_ON}]->(next:{NodeLabel.MODULE})
+            WHERE next <> m
+            MATCH path = shortestPath((next)-[:{RelationType.DEPENDS_ON}*1..{max_depth}]->(m))
+            WITH m, path
+            WHERE length(path) < $max_depth
+            RETURN length(path) + 1 as cycle_length,
+                   [m.{ModuleProperty.NAME}] + [node in nodes(path) | node.{ModuleProperty.NAME}] as cycle_path
+        }}
+        WITH m, cycle_length, cycle_path
+        ORDER BY cycle_length
+        WITH m, min(cycle_length) as cycle_length, collect(cycle_path)[0] as cycle_path
         RETURN m.{ModuleProperty.NAME} as module,
-               length(path) as cycle_length,
-               [node in nodes(path) | node.{ModuleProperty.NAME}] as cycle_path
+               cycle_length,
+               cycle_path
         ORDER BY cycle_length
     """
-    return query, {"max_depth": max_depth}
 
 
-def get_dependency_chain(from_module: str, to_module: str, max_depth: int = 10) -> tuple[str, Dict[str, Any]]:
+def detect_circular_dependencies(max_depth: int = 10) -> tuple[str, Dict[str, int]]:
     """
-    Find dependency path between two modules.
+    Detect circular dependencies in modules.
+
+    Returns the shortest cycle through each module that is part of one,
+    instead of enumerating every cycle. A module listing itself in its
+    dependencies is reported as a cycle of length 1.
 
     Returns:
         Tuple of (query, parameters)
     """
-    query = f"""
+    query = _circular_dependencies_query(_depth_bucket(max_depth))
+    return _read_query(query), {"max_depth": max_depth}
+
+
+@functools.lru_cache(maxsize=32)
+def _dependency_chain_query(max_depth: int) -> str:
+    """Build the get_dependency_chain query for a depth bucket."""
+    return f"""
         MATCH path = shortestPath(
             (from:{NodeLabel.MODULE} {{{ModuleProperty.NAME}: $from}})
             -[:{RelationType.DEPENDS_ON}*1..{max_depth}]->
             (to:{NodeLabel.MODULE} {{{ModuleProperty.NAME}: $to}})
         )
+        WITH path
+        WHERE length(path) <= $max_depth
         RETURN [node in nodes(path) | node.{ModuleProperty.NAME}] as path,
                length(path) as depth
     """
-    return query, {"from": from_module, "to": to_module, "max_depth": max_depth}
 
 
-def get_model_relationship_graph(model_name: str, depth: int = 2) -> tuple[str, Dict[str, Any]]:
+def get_dependency_chain(from_module: str, to_module: str, max_depth: int = 10) -> tuple[str, Dict[str, Any]]:
     """
-    Get a subgraph of model relationships.
+    Find dependency path between two modules.
 
     Returns:
         Tuple of (query, parameters)
     """
-    query = f"""
+    query = _dependency_chain_query(_depth_bucket(max_depth))
+    return query, {"from": from_module, "to": to_module, "max_depth": max_depth}
+
+
+@functools.lru_cache(maxsize=32)
+def _model_relationship_graph_query(depth: int) -> str:
+    """Build the get_model_relationship_graph query for a depth bucket."""
+    return f"""
         MATCH path = (m:{NodeLabel.MODEL} {{{ModelProperty.NAME}: $name}})
                      -[:{RelationType.INHERITS_FROM}|{RelationType.DELEGATES_TO}*0..{depth}]-
                      (related:{NodeLabel.MODEL})
+        WHERE length(path) <= $depth
         RETURN DISTINCT
                m.{ModelProperty.NAME} as center_model,
                related.{ModelProperty.NAME} as related_model,
-               type(relationships(path)[0]) as relationship_type,
+               [rel in relationships(path) | type(rel)] as rel_types,
                length(path) as distance
-        ORDER BY distance, related.{ModelProperty.NAME}
+        ORDER BY distance, related_model
+    """
+
+
+# Direct neighbours only: a fixed-length match avoids the variable-length
+# expansion, with the center model added back at distance 0
+_MODEL_NEIGHBOURS_QUERY = f"""
+        CALL {{
+            MATCH (m:{NodeLabel.MODEL} {{{ModelProperty.NAME}: $name}})
+            RETURN m.{ModelProperty.NAME} as center_model,
+                   m.{ModelProperty.NAME} as related_model,
+                   [] as rel_types,
+                   0 as distance
+            UNION
+            MATCH (m:{NodeLabel.MODEL} {{{ModelProperty.NAME}: $name}})
+                  -[rel:{RelationType.INHERITS_FROM}|{RelationType.DELEGATES_TO}]-
+                  (related:{NodeLabel.MODEL})
+            RETURN m.{ModelProperty.NAME} as center_model,
+                   related.{ModelProperty.NAME} as related_model,
+                   [type(rel)] as rel_types,
+                   1 as distance
+        }}
+        RETURN center_model, related_model, rel_types, distance
+        ORDER BY distance, related_model
+    """
+
+
+def get_model_relationship_graph(model_name: str, depth: int = 2) -> tuple[str, Dict[str, Any]]:
+    """
+    Get a subgraph of model relationships.
+
+    Each row carries the relationship types along the path in ``rel_types``;
+    the type of the first hop is ``rel_types[0]`` (empty for the center model).
+
+    Returns:
+        Tuple of (query, parameters)
+    """
+    if depth == 1:
+        return _MODEL_NEIGHBOURS_QUERY, {"name": model_name}
+    return _model_relationship_graph_query(_depth_bucket(depth)), {"name": model_name, "depth": depth}
+
+
+# Each count runs as its own subquery, so the counts resolve from the count
+# store independently and an empty label no longer drops the whole row
+_DATABASE_OVERVIEW_QUERY = f"""
+        CALL {{ MATCH (module:{NodeLabel.MODULE}) RETURN count(module) as module_count }}
+        CALL {{ MATCH (model:{NodeLabel.MODEL}) RETURN count(model) as model_count }}
+        CALL {{ MATCH (field:{NodeLabel.FIELD}) RETURN count(field) as field_count }}
+        CALL {{ MATCH ()-[dep:{RelationType.DEPENDS_ON}]->() RETURN count(dep) as dependency_count }}
+        CALL {{ MATCH ()-[inh:{RelationType.INHERITS_FROM}]->() RETURN count(inh) as inheritance_count }}
+        RETURN module_count, model_count, field_count, dependency_count, inheritance_count
     """
-    return query, {"name": model_name, "depth": depth}
 
 
 def get_database_overview() -> tuple[str, Dict]:
@@ -424,16 +672,34 @@ def get_database_overview() -> tuple[str, Dict]:
     Returns:
         Tuple of (query, parameters)
     """
-    query = f"""
+    return _read_query(_DATABASE_OVERVIEW_QUERY), {}
+
+
+# ============================================================================
+# Incremental Indexing Queries
+# ============================================================================
+
+_FILE_HASHES_QUERY = f"""
         MATCH (module:{NodeLabel.MODULE})
-        WITH count(module) as module_count
+        WHERE module.{ModuleProperty.FILE_PATH} IS NOT NULL
+        RETURN module.{ModuleProperty.FILE_PATH} as file_path,
+               module.{ModuleProperty.FILE_HASH} as file_hash
+        UNION
         MATCH (model:{NodeLabel.MODEL})
-        WITH module_count, count(model) as model_count
-        MATCH (field:{NodeLabel.FIELD})
-        WITH module_count, model_count, count(field) as field_count
-        MATCH ()-[dep:{RelationType.DEPENDS_ON}]->()
-        WITH module_count, model_count, field_count, count(dep) as dependency_count
-        MATCH ()-[inh:{RelationType.INHERITS_FROM}]->()
-        RETURN module_count, model_count, field_count, dependency_count, count(inh) as inheritance_count
-    """
-    return query, {}
+        WHERE model.{ModelProperty.FILE_PATH} IS NOT NULL
+        RETURN model.{ModelProperty.FILE_PATH} as file_path,
+               model.{ModelProperty.FILE_HASH} as file_hash
+    """
+
+
+def get_file_hashes() -> tuple[str, Dict]:
+    """
+    Get the file path and hash of every indexed manifest and model file.
+
+    Both branches are served by the file path indexes, and a model file
+    defining several models is returned once.
+
+    Returns:
+        Tuple of (query, parameters)
+    """
+    return _FILE_HASHES_QUERY, {}
@@ -70,12 +70,14 @@ class ModelProperty:
     LINE_NUMBER = "line_number"
     CLASS_NAME = "class_name"
     FILE_HASH = "file_hash"
+    PRIORITY = "priority"               # 1 core addon, 2 other, 3 l10n
     # Note: _inherit and _inherits are stored as relationships
 
 
 class FieldProperty:
     """Field node property keys."""
     NAME = "name"                       # Field name
+    MODEL_NAME = "model_name"           # _name of the model it belongs to
     FIELD_TYPE = "field_type"           # Char, Integer, Many2one, etc.
     STRING = "string"                   # Human-readable label
     REQUIRED = "required"
@@ -97,6 +99,7 @@ class FieldProperty:
     DIGITS = "digits"
     SANITIZE = "sanitize"
     STRIP_STYLE = "strip_style"
+    IS_COMPUTED = "is_computed"         # Set at indexing time from compute
 
 
 # ============================================================================
@@ -134,7 +137,7 @@ def get_constraint_queries() -> List[Dict[str, str]]:
             "query": f"""
                 CREATE CONSTRAINT field_composite_unique IF NOT EXISTS
                 FOR (f:{NodeLabel.FIELD})
-                REQUIRE (f.{FieldProperty.NAME}, f.model_name) IS UNIQUE
+                REQUIRE (f.{FieldProperty.NAME}, f.{FieldProperty.MODEL_NAME}) IS UNIQUE
             """
         }
     ]
@@ -173,6 +176,14 @@ def get_index_queries() -> List[Dict[str, str]]:
                 ON (m.{ModuleProperty.APPLICATION})
             """
         },
+        {
+            "name": "Module file path index",
+            "query": f"""
+                CREATE INDEX module_file_path_idx IF NOT EXISTS
+                FOR (m:{NodeLabel.MODULE})
+                ON (m.{ModuleProperty.FILE_PATH})
+            """
+        },
 
         # Model indexes
         {
@@ -183,6 +194,22 @@ def get_index_queries() -> List[Dict[str, str]]:
                 ON (m.{ModelProperty.MODULE})
             """
         },
+        {
+            "name": "Model priority index",
+            "query": f"""
+                CREATE INDEX model_priority_idx IF NOT EXISTS
+                FOR (m:{NodeLabel.MODEL})
+                ON (m.{ModelProperty.PRIORITY})
+            """
+        },
+        {
+            "name": "Model file path index",
+            "query": f"""
+                CREATE INDEX model_file_path_idx IF NOT EXISTS
+                FOR (m:{NodeLabel.MODEL})
+                ON (m.{ModelProperty.FILE_PATH})
+            """
+        },
 
         # Field indexes
         {
@@ -194,11 +221,19 @@ def get_index_queries() -> List[Dict[str, str]]:
             """
         },
         {
-            "name": "Field model name index",
+            "name": "Field name index",
+            "query": f"""
+                CREATE INDEX field_name_idx IF NOT EXISTS
+                FOR (f:{NodeLabel.FIELD})
+                ON (f.{FieldProperty.NAME})
+            """
+        },
+        {
+            "name": "Field model index",
             "query": f"""
                 CREATE INDEX field_model_name_idx IF NOT EXISTS
                 FOR (f:{NodeLabel.FIELD})
-                ON (f.model_name)
+                ON (f.{FieldProperty.MODEL_NAME})
             """
         },
         {
@@ -216,6 +251,14 @@ def get_index_queries() -> List[Dict[str, str]]:
                 FOR (f:{NodeLabel.FIELD})
                 ON (f.{FieldProperty.REQUIRED})
             """
+        },
+        {
+            "name": "Field computed index",
+            "query": f"""
+                CREATE INDEX field_is_computed_idx IF NOT EXISTS
+                FOR (f:{NodeLabel.FIELD})
+                ON (f.{FieldProperty.IS_COMPUTED})
+            """
         }
     ]
 
@@ -257,29 +300,25 @@ def initialize_schema(connection) -> Dict[str, any]:
         "errors": []
     }
 
-    # Create constraints
-    logger.info("Creating constraints...")
-    for constraint in get_constraint_queries():
-        try:
-            connection.execute_write(constraint["query"], {})
-            results["constraints_created"] += 1
-            logger.info(f"✓ Created constraint: {constraint['name']}")
-        except Exception as e:
-            error_msg = f"Failed to create constraint '{constraint['name']}': {str(e)}"
-            logger.warning(error_msg)
-            results["errors"].append(error_msg)
+    constraints = get_constraint_queries()
+    indexes = get_index_queries()
 
-    # Create indexes
-    logger.info("Creating indexes...")
-    for index in get_index_queries():
+    # All DDL statements go out in one pipelined transaction; only if that
+    # fails are they retried one by one to report which statement failed.
+    # Either way every statement runs on the same session.
+    logger.info("Creating constraints and indexes...")
+    with connection.writer_session():
         try:
-            connection.execute_write(index["query"], {})
-            results["indexes_created"] += 1
-            logger.info(f"✓ Created index: {index['name']}")
+            connection.execute_pipeline(
+                [(item["query"], {}) for item in constraints + indexes]
+            )
+            results["constraints_created"] = len(constraints)
+            results["indexes_created"] = len(indexes)
+            logger.info(f"✓ Created {len(constraints)} constraints and {len(indexes)} indexes")
         except Exception as e:
-            error_msg = f"Failed to create index '{index['name']}': {str(e)}"
-            logger.warning(error_msg)
-            results["errors"].append(error_msg)
+            logger.warning(f"Batched schema creation failed, retrying one by one: {str(e)}")
+            _create_schema_items(connection, constraints, "constraint", "constraints_created", results)
+            _create_schema_items(connection, indexes, "index", "indexes_created", results)
 
     logger.info(
         f"Schema initialization complete: "
@@ -291,6 +330,34 @@ def initialize_schema(connection) -> Dict[str, any]:
     return results
 
 
+def _create_schema_items(
+    connection,
+    items: List[Dict[str, str]],
+    kind: str,
+    counter: str,
+    results: Dict[str, any]
+) -> None:
+    """
+    Create constraints or indexes one transaction at a time.
+
+    Args:
+        connection: Neo4jConnection instance
+        items: Query dictionaries with 'name' and 'query' keys
+        kind: "constraint" or "index", used in log messages
+        counter: Key of the results counter to increment
+        results: Initialization results, updated in place
+    """
+    for item in items:
+        try:
+            connection.execute_write(item["query"], {})
+            results[counter] += 1
+            logger.info(f"✓ Created {kind}: {item['name']}")
+        except Exception as e:
+            error_msg = f"Failed to create {kind} '{item['name']}': {str(e)}"
+            logger.warning(error_msg)
+            results["errors"].append(error_msg)
+
+
 def verify_schema(connection) -> Dict[str, any]:
     """
     Verify that the schema is properly set up.
@@ -326,6 +393,37 @@ def verify_schema(connection) -> Dict[str, any]:
         }
 
 
+# Touches every node and relationship with a property read, so their store
+# pages are loaded into the page cache. APOC 5 has no apoc.warmup.run, and
+# Neo4j 5 itself only re-warms pages that were cached before a restart
+# (db.memory.pagecache.warmup.enable), so a scan is what warms a new graph.
+_WARMUP_SCAN_QUERY = """
+    MATCH (n)
+    OPTIONAL MATCH (n)-[r]->()
+    RETURN count(n.name) + count(r.field) as touched
+"""
+
+
+def warm_cache(connection) -> bool:
+    """
+    Load the graph into the Neo4j page cache before the first user query.
+
+    Args:
+        connection: Neo4jConnection instance
+
+    Returns:
+        True if the cache was warmed
+    """
+    logger.info("Warming up Neo4j page cache...")
+
+    try:
+        connection.execute_query(_WARMUP_SCAN_QUERY, {})
+        return True
+    except Exception as e:
+        logger.warning(f"Cache warmup failed: {str(e)}")
+        return False
+
+
 # ============================================================================
 # Helper Functions
 # ============================================================================
@@ -356,41 +454,71 @@ def get_relationship_count_query(rel_type: str) -> str:
     return f"MATCH ()-[r:{rel_type}]->() RETURN count(r) as count"
 
 
+# Labels and relationship types counted by get_database_stats
+_STATS_LABELS = (NodeLabel.MODULE, NodeLabel.MODEL, NodeLabel.FIELD)
+_STATS_RELATION_TYPES = (
+    RelationType.DEPENDS_ON,
+    RelationType.INHERITS_FROM,
+    RelationType.DELEGATES_TO,
+    RelationType.DEFINED_IN,
+    RelationType.BELONGS_TO,
+    RelationType.REFERENCES
+)
+_STATS_KEYS = (
+    [f"{label.lower()}_count" for label in _STATS_LABELS]
+    + [f"{rel_type.lower()}_count" for rel_type in _STATS_RELATION_TYPES]
+)
+
+# All counts in one row, one count-store lookup per subquery
+_DATABASE_STATS_QUERY = "\n".join(
+    [
+        f"CALL {{ MATCH (n:{label}) RETURN count(n) as {label.lower()}_count }}"
+        for label in _STATS_LABELS
+    ]
+    + [
+        f"CALL {{ MATCH ()-[r:{rel_type}]->() RETURN count(r) as {rel_type.lower()}_count }}"
+        for rel_type in _STATS_RELATION_TYPES
+    ]
+    + ["RETURN " + ", ".join(_STATS_KEYS)]
+)
+
+# Fallback for servers without CALL subqueries: one tagged row per count
+_DATABASE_STATS_UNION_QUERY = "\nUNION ALL\n".join(
+    [
+        f"MATCH (n:{label}) RETURN '{label.lower()}_count' as key, count(n) as count"
+        for label in _STATS_LABELS
+    ]
+    + [
+        f"MATCH ()-[r:{rel_type}]->() RETURN '{rel_type.lower()}_count' as key, count(r) as count"
+        for rel_type in _STATS_RELATION_TYPES
+    ]
+)
+
+
 def get_database_stats(connection) -> Dict[str, int]:
     """
     Get comprehensive database statistics.
 
+    All node and relationship counts are fetched in a single query.
+
     Args:
         connection: Neo4jConnection instance
 
     Returns:
         Dictionary with node and relationship counts
     """
-    stats = {}
-
-    # Count nodes
-    for label in [NodeLabel.MODULE, NodeLabel.MODEL, NodeLabel.FIELD]:
+    with connection.writer_session():
         try:
-            result = connection.execute_query(get_node_count_query(label), {})
-            stats[f"{label.lower()}_count"] = result[0]["count"] if result else 0
+            result = connection.execute_query(_DATABASE_STATS_QUERY, {})
+            return dict(result[0]) if result else dict.fromkeys(_STATS_KEYS, 0)
         except Exception as e:
-            logger.error(f"Failed to count {label} nodes: {str(e)}")
-            stats[f"{label.lower()}_count"] = 0
-
-    # Count relationships
-    for rel_type in [
-        RelationType.DEPENDS_ON,
-        RelationType.INHERITS_FROM,
-        RelationType.DELEGATES_TO,
-        RelationType.DEFINED_IN,
-        RelationType.BELONGS_TO,
-        RelationType.REFERENCES
-    ]:
+            logger.debug("Subquery statistics failed, using UNION ALL: %s", e)
+
+        stats = dict.fromkeys(_STATS_KEYS, 0)
         try:
-            result = connection.execute_query(get_relationship_count_query(rel_type), {})
-            stats[f"{rel_type.lower()}_count"] = result[0]["count"] if result else 0
+            for row in connection.execute_query(_DATABASE_STATS_UNION_QUERY, {}):
+                stats[row["key"]] = row["count"]
         except Exception as e:
-            logger.error(f"Failed to count {rel_type} relationships: {str(e)}")
-            stats[f"{rel_type.lower()}_count"] = 0
+            logger.error(f"Failed to count nodes and relationships: {str(e)}")
 
     return stats
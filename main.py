@@ -6,7 +6,10 @@ A tool for analyzing, tracking, and visualizing Odoo module dependencies,
 models, and views using a Neo4j graph database.
 """
 
+import os
+import signal
 import sys
+from operator import itemgetter
 
 import click
 from rich.console import Console
@@ -16,6 +19,69 @@ from utils import setup_logger
 
 console = Console()
 
+_BANNER = "[bold cyan]" + "=" * 40 + "[/bold cyan]"
+
+# Column schemas (header, style) of the result tables, shared by commands
+_DEPENDENCY_TABLE_COLUMNS = (("Dependency", "cyan"), ("Version", "yellow"), ("Category", "green"))
+_DEPENDENT_TABLE_COLUMNS = (("Module", "cyan"), ("Version", "yellow"), ("Category", "green"))
+_MODEL_TABLE_COLUMNS = (("Model", "cyan"), ("Description", "green"), ("File", "yellow"))
+_MODEL_FIELD_TABLE_COLUMNS = (
+    ("Field", "cyan"),
+    ("Type", "yellow"),
+    ("Label", "green"),
+    ("Required", "magenta"),
+    ("Comodel", "blue"),
+)
+_FIELD_MATCH_TABLE_COLUMNS = (("Model", "cyan"), ("Type", "yellow"), ("Label", "green"), ("Required", "magenta"))
+_PARENT_TABLE_COLUMNS = (("Parent Model", "cyan"), ("Depth", "yellow"))
+_CHILD_TABLE_COLUMNS = (("Child Model", "green"), ("Description", "yellow"))
+_PHASE_TABLE_COLUMNS = (("Phase", "cyan"), ("Seconds", "yellow"))
+
+# Result keys of rows shown as-is, in column order (None renders as blank)
+_DEPENDENCY_ROW = itemgetter("dependency", "version", "category")
+_DEPENDENT_ROW = itemgetter("dependent", "version", "category")
+
+
+def _print_key_values(rows, style: str = "yellow"):
+    """
+    Print "key: value" status lines with a single console.print.
+
+    The lines are assembled as styled Text, so neither markup parsing nor
+    the highlighter runs over the values (which may contain brackets).
+
+    Args:
+        rows: Iterable of (key, value) pairs
+        style: Style of the keys
+    """
+    from rich.text import Text
+
+    text = Text()
+    for key, value in rows:
+        text.append(f"{key}:", style=style)
+        text.append(f" {value}\n")
+
+    console.print(text, end="", highlight=False)
+
+
+def _make_table(title: str, columns):
+    """
+    Build a result table from one of the column schemas above.
+
+    Args:
+        title: Table title
+        columns: Sequence of (header, style) pairs
+
+    Returns:
+        Empty rich Table with the columns added
+    """
+    from rich.table import Table
+
+    table = Table(title=title)
+    for header, style in columns:
+        table.add_column(header, style=style)
+
+    return table
+
 
 @click.group()
 @click.version_option(version="0.1.0", prog_name="odoo-tracker")
@@ -24,7 +90,13 @@ console = Console()
     type=click.Choice(["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]),
     help="Set logging level",
 )
-def cli(log_level):
+@click.option(
+    "--warm",
+    is_flag=True,
+    help="Warm up the Neo4j page cache before running the command",
+)
+@click.pass_context
+def cli(ctx, log_level, warm):
     """
     Odoo Tracker - Analyze and track Odoo module dependencies.
 
@@ -45,11 +117,69 @@ def cli(log_level):
         log_file=settings.log_file,
     )
 
+    # Shared with the subcommand (and _get_connection) through the context
+    ctx.ensure_object(dict)
+    ctx.obj["settings"] = settings
+    ctx.obj["warm"] = warm
+
+
+def _fast_interrupt(signum, frame):
+    """
+    SIGINT handler for non-interactive bulk loads: exit immediately.
+
+    Skips unwinding the indexer and interpreter teardown; Neo4j rolls back
+    the open transaction when the connection drops.
+    """
+    sys.stderr.write("\nInterrupted by user\n")
+    os._exit(130)
+
+
+def _get_connection(ctx: click.Context, **options):
+    """
+    Get the Neo4j connection shared by the current CLI invocation.
+
+    The connection is opened on first use (and warmed up if --warm was given)
+    and closed when the CLI context is torn down, so commands neither
+    reconnect nor close it themselves.
+
+    Args:
+        ctx: Click context of the running command
+        **options: Extra Neo4jConnection options, used when connecting
+
+    Returns:
+        Connected Neo4jConnection, or None if the connection failed
+    """
+    from graph import Neo4jConnection, warm_cache
+
+    state = ctx.ensure_object(dict)
+    connection = state.get("connection")
+
+    if connection is None:
+        settings = state["settings"]
+        connection = Neo4jConnection(
+            uri=settings.neo4j_uri,
+            user=settings.neo4j_user,
+            password=settings.neo4j_password,
+            **options
+        )
+
+        if not connection.connect():
+            return None
+
+        state["connection"] = connection
+        ctx.find_root().call_on_close(connection.close)
+
+        if state.get("warm"):
+            warm_cache(connection)
+
+    return connection
+
 
 @cli.command()
-def config():
+@click.pass_context
+def config(ctx):
     """Show current configuration."""
-    settings = get_settings()
+    settings = ctx.obj["settings"]
 
     console.print("\n[bold cyan]Odoo Tracker Configuration[/bold cyan]\n")
 
@@ -59,14 +189,13 @@ def config():
     if "neo4j_password" in config_dict:
         config_dict["neo4j_password"] = "***"
 
-    for key, value in config_dict.items():
-        console.print(f"[yellow]{key}[/yellow]: {value}")
+    _print_key_values(config_dict.items())
 
     console.print()
 
 
 @cli.command()
-@click.argument("path", type=click.Path(exists=True))
+@click.argument("path")
 @click.option(
     "--batch-size",
     type=int,
@@ -77,6 +206,16 @@ def config():
     is_flag=True,
     help="Only index files that have changed (based on file hash)",
 )
+@click.option(
+    "--concurrency",
+    type=int,
+    help="Number of concurrent extraction and write workers",
+)
+@click.option(
+    "--scan-workers",
+    type=int,
+    help="Number of threads walking the addons tree for modules",
+)
 @click.option(
     "--clear",
     is_flag=True,
@@ -88,66 +227,91 @@ def config():
     is_flag=True,
     help="Skip confirmation prompt when clearing data",
 )
-def index(path, batch_size, incremental, clear, yes):
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    help="Parse modules without writing to Neo4j (measures extraction alone)",
+)
+@click.pass_context
+def index(ctx, path, batch_size, incremental, concurrency, scan_workers, clear, yes, dry_run):
     """
     Index Odoo modules from a directory.
 
     PATH: Directory containing Odoo modules to index
     """
     from pathlib import Path
-    from graph import Neo4jConnection, OdooIndexer
+    from graph import NullConnection, OdooIndexer
     from utils.logger import get_logger
 
     logger = get_logger(__name__)
 
-    console.print("\n[bold cyan]=" * 40 + "[/bold cyan]")
-    console.print("[bold cyan]Odoo Tracker - Indexing Process[/bold cyan]")
-    console.print("[bold cyan]=" * 40 + "[/bold cyan]\n")
+    # Checked here rather than by click.Path, which stats and access()es the
+    # path on top of the indexer's own check when the walk starts
+    if not os.path.isdir(path):
+        raise click.BadParameter(f"Directory '{path}' does not exist.", param_hint="'PATH'")
 
-    settings = get_settings()
+    console.print(f"\n{_BANNER}\n[bold cyan]Odoo Tracker - Indexing Process[/bold cyan]\n{_BANNER}\n")
+
+    settings = ctx.obj["settings"]
 
     # Override batch size if provided
     if batch_size:
         settings.batch_size = batch_size
 
     # Display configuration
-    console.print(f"[yellow]Source path:[/yellow] {path}")
-    console.print(f"[yellow]Neo4j URI:[/yellow] {settings.neo4j_uri}")
-    console.print(f"[yellow]Batch size:[/yellow] {settings.batch_size}")
-    console.print(f"[yellow]Max memory:[/yellow] {settings.max_memory_percent}%")
-    console.print(f"[yellow]Incremental:[/yellow] {incremental}")
-    console.print(f"[yellow]Clear existing:[/yellow] {clear}\n")
-
-    if clear and not yes:
+    run_config = [
+        ("Source path", path),
+        ("Neo4j URI", settings.neo4j_uri),
+        ("Batch size", settings.batch_size),
+        ("Max memory", f"{settings.max_memory_percent}%"),
+        ("Incremental", incremental),
+    ]
+    if concurrency:
+        run_config.append(("Concurrency", concurrency))
+    run_config += [("Clear existing", clear), ("Dry run", dry_run)]
+    _print_key_values(run_config)
+    console.print()
+
+    if clear and not yes and not dry_run:
         console.print("[bold red]WARNING:[/bold red] This will delete all existing data!")
         if not click.confirm("Are you sure you want to continue?"):
             console.print("[yellow]Aborted[/yellow]\n")
             return
 
+    # Non-interactive runs abort without the slow cleanup of a large load
+    if yes:
+        signal.signal(signal.SIGINT, _fast_interrupt)
+
     try:
-        # Connect to Neo4j
-        console.print("[cyan]Connecting to Neo4j...[/cyan]")
-        connection = Neo4jConnection(
-            uri=settings.neo4j_uri,
-            user=settings.neo4j_user,
-            password=settings.neo4j_password,
-            max_retries=3,
-            retry_delay=1.0
-        )
+        if dry_run:
+            # Parse only: every query is discarded
+            connection = NullConnection()
+            console.print("[yellow]Dry run: nothing will be written to Neo4j[/yellow]\n")
+        else:
+            # Connect to Neo4j
+            console.print("[cyan]Connecting to Neo4j...[/cyan]")
+            connection = _get_connection(
+                ctx,
+                max_retries=3,
+                retry_delay=1.0,
+                max_connection_pool_size=max(32, 2 * (concurrency or settings.max_workers))
+            )
 
-        if not connection.connect():
-            console.print("[bold red]Failed to connect to Neo4j[/bold red]")
-            console.print("Please check your connection settings and ensure Neo4j is running.\n")
-            sys.exit(1)
+            if connection is None:
+                console.print("[bold red]Failed to connect to Neo4j[/bold red]")
+                console.print("Please check your connection settings and ensure Neo4j is running.\n")
+                sys.exit(1)
 
-        console.print("[green]✓ Connected to Neo4j[/green]\n")
+            console.print("[green]✓ Connected to Neo4j[/green]\n")
 
         # Create indexer
         indexer = OdooIndexer(
             odoo_path=Path(path),
             connection=connection,
             batch_size=settings.batch_size,
-            max_memory_percent=settings.max_memory_percent
+            max_memory_percent=settings.max_memory_percent,
+            max_workers=concurrency,
+            scan_workers=scan_workers
         )
 
         # Run indexing
@@ -159,35 +323,42 @@ def index(path, batch_size, incremental, clear, yes):
         )
 
         # Display results
-        console.print("\n[bold cyan]=" * 40 + "[/bold cyan]")
-        console.print("[bold green]Indexing Completed Successfully![/bold green]")
-        console.print("[bold cyan]=" * 40 + "[/bold cyan]\n")
+        console.print(f"\n{_BANNER}\n[bold green]Indexing Completed Successfully![/bold green]\n{_BANNER}\n")
 
-        console.print(f"[yellow]Duration:[/yellow] {stats['duration_seconds']:.2f} seconds")
-        console.print(f"[yellow]Modules found:[/yellow] {stats['modules_found']}")
-        console.print(f"[yellow]Modules indexed:[/yellow] {stats['modules_indexed']}")
-        console.print(f"[yellow]Models indexed:[/yellow] {stats['models_indexed']}")
-        console.print(f"[yellow]Fields indexed:[/yellow] {stats['fields_indexed']}")
-        console.print(f"[yellow]Relationships created:[/yellow] {stats['relationships_created']}")
+        _print_key_values([
+            ("Duration", f"{stats['duration_seconds']:.2f} seconds"),
+            ("Modules found", stats['modules_found']),
+            ("Modules indexed", stats['modules_indexed']),
+            ("Models indexed", stats['models_indexed']),
+            ("Fields indexed", stats['fields_indexed']),
+            ("Relationships created", stats['relationships_created']),
+        ])
 
         if stats['errors'] > 0:
-            console.print(f"[red]Errors:[/red] {stats['errors']}")
+            _print_key_values([("Errors", stats['errors'])], style="red")
 
         # Display database statistics
         if 'db_stats' in stats:
             console.print("\n[bold cyan]Database Statistics:[/bold cyan]")
             db_stats = stats['db_stats']
-            console.print(f"[yellow]Total modules:[/yellow] {db_stats.get('module_count', 0)}")
-            console.print(f"[yellow]Total models:[/yellow] {db_stats.get('model_count', 0)}")
-            console.print(f"[yellow]Total fields:[/yellow] {db_stats.get('field_count', 0)}")
-            console.print(f"[yellow]Dependencies:[/yellow] {db_stats.get('depends_on_count', 0)}")
-            console.print(f"[yellow]Inheritance:[/yellow] {db_stats.get('inherits_from_count', 0)}")
+            _print_key_values([
+                ("Total modules", db_stats.get('module_count', 0)),
+                ("Total models", db_stats.get('model_count', 0)),
+                ("Total fields", db_stats.get('field_count', 0)),
+                ("Dependencies", db_stats.get('depends_on_count', 0)),
+                ("Inheritance", db_stats.get('inherits_from_count', 0)),
+            ])
+
+        # Display per-phase timings
+        if stats.get('phase_seconds'):
+            console.print()
+            table = _make_table("Phase timings", _PHASE_TABLE_COLUMNS)
+            for phase, seconds in stats['phase_seconds'].items():
+                table.add_row(phase.replace('_', ' '), f"{seconds:.2f}")
+            console.print(table)
 
         console.print()
 
-        # Close connection
-        connection.close()
-
     except Exception as e:
         console.print(f"\n[bold red]Error during indexing:[/bold red] {str(e)}\n")
         logger.error(f"Indexing failed: {str(e)}", exc_info=True)
@@ -197,31 +368,25 @@ def index(path, batch_size, incremental, clear, yes):
 @cli.command()
 @click.argument("module_name")
 @click.option("--reverse", is_flag=True, help="Show modules that depend on this module")
-def dependencies(module_name, reverse):
+@click.pass_context
+def dependencies(ctx, module_name, reverse):
     """
     Show dependencies for a module.
 
     MODULE_NAME: Name of the module to analyze
     """
-    from rich.table import Table
-    from graph import Neo4jConnection
     from graph.queries import get_module_dependencies, get_module_dependents
     from utils.logger import get_logger
 
     logger = get_logger(__name__)
-    settings = get_settings()
 
     console.print(f"\n[bold cyan]{'Reverse dependencies' if reverse else 'Dependencies'} for module:[/bold cyan] [yellow]{module_name}[/yellow]\n")
 
     try:
         # Connect to Neo4j
-        connection = Neo4jConnection(
-            uri=settings.neo4j_uri,
-            user=settings.neo4j_user,
-            password=settings.neo4j_password
-        )
+        connection = _get_connection(ctx)
 
-        if not connection.connect():
+        if connection is None:
             console.print("[bold red]Failed to connect to Neo4j[/bold red]")
             console.print("Please check your connection settings.\n")
             sys.exit(1)
@@ -233,46 +398,28 @@ def dependencies(module_name, reverse):
 
             if not results:
                 console.print(f"[yellow]No modules depend on '{module_name}'[/yellow]\n")
-                connection.close()
                 return
 
-            table = Table(title=f"Modules that depend on {module_name}")
-            table.add_column("Module", style="cyan")
-            table.add_column("Version", style="yellow")
-            table.add_column("Category", style="green")
+            table = _make_table(f"Modules that depend on {module_name}", _DEPENDENT_TABLE_COLUMNS)
 
             for dep in results:
-                table.add_row(
-                    dep.get('dependent', ''),
-                    dep.get('version', ''),
-                    dep.get('category', '')
-                )
+                table.add_row(*_DEPENDENT_ROW(dep))
         else:
             query, params = get_module_dependencies(module_name)
             results = connection.execute_query(query, params)
 
             if not results:
                 console.print(f"[yellow]Module '{module_name}' has no dependencies[/yellow]\n")
-                connection.close()
                 return
 
-            table = Table(title=f"Dependencies of {module_name}")
-            table.add_column("Dependency", style="cyan")
-            table.add_column("Version", style="yellow")
-            table.add_column("Category", style="green")
+            table = _make_table(f"Dependencies of {module_name}", _DEPENDENCY_TABLE_COLUMNS)
 
             for dep in results:
-                table.add_row(
-                    dep.get('dependency', ''),
-                    dep.get('version', ''),
-                    dep.get('category', '')
-                )
+                table.add_row(*_DEPENDENCY_ROW(dep))
 
         console.print(table)
         console.print()
 
-        connection.close()
-
     except Exception as e:
         console.print(f"\n[bold red]Error:[/bold red] {str(e)}\n")
         logger.error(f"Dependencies query failed: {str(e)}", exc_info=True)
@@ -283,32 +430,27 @@ def dependencies(module_name, reverse):
 @click.argument("model_name")
 @click.option("--fields", is_flag=True, help="Show model fields")
 @click.option("--limit", default=20, help="Limit number of fields shown")
-def find_model(model_name, fields, limit):
+@click.pass_context
+def find_model(ctx, model_name, fields, limit):
     """
     Find where a model is defined.
 
     MODEL_NAME: Technical name of the model (e.g., 'sale.order')
     """
-    from rich.table import Table
+    from rich.console import Group
     from rich.panel import Panel
-    from graph import Neo4jConnection
     from graph.queries import find_model_by_name, get_model_fields
     from utils.logger import get_logger
 
     logger = get_logger(__name__)
-    settings = get_settings()
 
     console.print(f"\n[bold cyan]Searching for model:[/bold cyan] [yellow]{model_name}[/yellow]\n")
 
     try:
         # Connect to Neo4j
-        connection = Neo4jConnection(
-            uri=settings.neo4j_uri,
-            user=settings.neo4j_user,
-            password=settings.neo4j_password
-        )
+        connection = _get_connection(ctx)
 
-        if not connection.connect():
+        if connection is None:
             console.print("[bold red]Failed to connect to Neo4j[/bold red]")
             console.print("Please check your connection settings.\n")
             sys.exit(1)
@@ -319,48 +461,46 @@ def find_model(model_name, fields, limit):
 
         if not results:
             console.print(f"[yellow]Model '{model_name}' not found[/yellow]\n")
-            connection.close()
             return
 
         # Display all definitions (base + extensions)
         if len(results) > 1:
             console.print(f"[yellow]Found {len(results)} definitions of this model (base + extensions)[/yellow]\n")
 
+        panels = []
         for idx, result in enumerate(results, 1):
-            model = result.get('model', {})
             module_name = result.get('module_name', 'Unknown')
             is_base = idx == 1  # First result is the base/core definition
 
             # Display model info
             title_suffix = " (BASE)" if is_base else f" (Extension {idx-1})"
             info_text = f"""
-[bold]Model:[/bold] {model.get('name', 'N/A')}
-[bold]Description:[/bold] {model.get('description', 'N/A') or 'N/A'}
+[bold]Model:[/bold] {result.get('name', 'N/A')}
+[bold]Description:[/bold] {result.get('description', 'N/A') or 'N/A'}
 [bold]Module:[/bold] {module_name}
-[bold]Class:[/bold] {model.get('class_name', 'N/A')}
-[bold]File:[/bold] {model.get('file_path', 'N/A')}
-[bold]Line:[/bold] {model.get('line_number', 'N/A')}
+[bold]Class:[/bold] {result.get('class_name', 'N/A')}
+[bold]File:[/bold] {result.get('file_path', 'N/A')}
+[bold]Line:[/bold] {result.get('line_number', 'N/A')}
 """
             border_color = "green" if is_base else "yellow"
-            panel = Panel(info_text.strip(), title=f"Model: {model_name}{title_suffix}", border_style=border_color)
-            console.print(panel)
+            panels.append(
+                Panel(info_text.strip(), title=f"Model: {model_name}{title_suffix}", border_style=border_color)
+            )
 
-        console.print()
+        # Render all definitions (and the trailing blank line) in one print
+        console.print(Group(*panels, ""))
 
         # Show fields if requested
         if fields:
-            query, params = get_model_fields(model_name)
+            # LIMIT is applied server-side, so only the shown rows are sent
+            query, params = get_model_fields(model_name, limit)
             field_results = connection.execute_query(query, params)
 
             if field_results:
-                table = Table(title=f"Fields of {model_name} (showing {min(limit, len(field_results))} of {len(field_results)})")
-                table.add_column("Field", style="cyan")
-                table.add_column("Type", style="yellow")
-                table.add_column("Label", style="green")
-                table.add_column("Required", style="magenta")
-                table.add_column("Comodel", style="blue")
-
-                for field in field_results[:limit]:
+                total = field_results[0].get('total', len(field_results))
+                table = _make_table(f"Fields of {model_name} (showing {len(field_results)} of {total})", _MODEL_FIELD_TABLE_COLUMNS)
+
+                for field in field_results:
                     table.add_row(
                         field.get('name', ''),
                         field.get('type', ''),
@@ -372,8 +512,6 @@ def find_model(model_name, fields, limit):
                 console.print(table)
                 console.print()
 
-        connection.close()
-
     except Exception as e:
         console.print(f"\n[bold red]Error:[/bold red] {str(e)}\n")
         logger.error(f"Find model query failed: {str(e)}", exc_info=True)
@@ -382,31 +520,25 @@ def find_model(model_name, fields, limit):
 
 @cli.command()
 @click.argument("module_name")
-def list_models(module_name):
+@click.pass_context
+def list_models(ctx, module_name):
     """
     List all models defined in a module.
 
     MODULE_NAME: Name of the module
     """
-    from rich.table import Table
-    from graph import Neo4jConnection
     from graph.queries import list_models_in_module
     from utils.logger import get_logger
 
     logger = get_logger(__name__)
-    settings = get_settings()
 
     console.print(f"\n[bold cyan]Models in module:[/bold cyan] [yellow]{module_name}[/yellow]\n")
 
     try:
         # Connect to Neo4j
-        connection = Neo4jConnection(
-            uri=settings.neo4j_uri,
-            user=settings.neo4j_user,
-            password=settings.neo4j_password
-        )
+        connection = _get_connection(ctx)
 
-        if not connection.connect():
+        if connection is None:
             console.print("[bold red]Failed to connect to Neo4j[/bold red]")
             console.print("Please check your connection settings.\n")
             sys.exit(1)
@@ -417,30 +549,21 @@ def list_models(module_name):
 
         if not results:
             console.print(f"[yellow]No models found in module '{module_name}'[/yellow]\n")
-            connection.close()
             return
 
-        table = Table(title=f"Models in {module_name} ({len(results)} total)")
-        table.add_column("Model", style="cyan")
-        table.add_column("Description", style="green")
-        table.add_column("File", style="yellow")
+        table = _make_table(f"Models in {module_name} ({len(results)} total)", _MODEL_TABLE_COLUMNS)
 
+        # The query already returns the file name rather than the full path
         for model in results:
-            file_path = model.get('file_path', '')
-            # Show only the filename, not full path
-            filename = file_path.split('/')[-1] if file_path else ''
-
             table.add_row(
                 model.get('name', ''),
                 (model.get('description', '') or '')[:50],
-                filename
+                model.get('filename', '') or ''
             )
 
         console.print(table)
         console.print()
 
-        connection.close()
-
     except Exception as e:
         console.print(f"\n[bold red]Error:[/bold red] {str(e)}\n")
         logger.error(f"List models query failed: {str(e)}", exc_info=True)
@@ -450,32 +573,26 @@ def list_models(module_name):
 @cli.command()
 @click.argument("model_name")
 @click.option("--depth", default=5, help="Maximum inheritance depth to show")
-def inheritance(model_name, depth):
+@click.pass_context
+def inheritance(ctx, model_name, depth):
     """
     Show inheritance tree for a model.
 
     MODEL_NAME: Technical name of the model (e.g., 'sale.order')
     """
-    from rich.table import Table
     from rich.tree import Tree
-    from graph import Neo4jConnection
     from graph.queries import get_model_inheritance_tree, get_model_children
     from utils.logger import get_logger
 
     logger = get_logger(__name__)
-    settings = get_settings()
 
     console.print(f"\n[bold cyan]Inheritance tree for model:[/bold cyan] [yellow]{model_name}[/yellow]\n")
 
     try:
         # Connect to Neo4j
-        connection = Neo4jConnection(
-            uri=settings.neo4j_uri,
-            user=settings.neo4j_user,
-            password=settings.neo4j_password
-        )
+        connection = _get_connection(ctx)
 
-        if not connection.connect():
+        if connection is None:
             console.print("[bold red]Failed to connect to Neo4j[/bold red]")
             console.print("Please check your connection settings.\n")
             sys.exit(1)
@@ -490,9 +607,7 @@ def inheritance(model_name, depth):
 
         # Display parents
         if parent_results:
-            table = Table(title=f"Parents of {model_name}")
-            table.add_column("Parent Model", style="cyan")
-            table.add_column("Depth", style="yellow")
+            table = _make_table(f"Parents of {model_name}", _PARENT_TABLE_COLUMNS)
 
             for result in parent_results:
                 if result.get('parent') and result.get('parent') != model_name:
@@ -507,9 +622,7 @@ def inheritance(model_name, depth):
 
         # Display children
         if children_results:
-            table = Table(title=f"Children of {model_name}")
-            table.add_column("Child Model", style="green")
-            table.add_column("Description", style="yellow")
+            table = _make_table(f"Children of {model_name}", _CHILD_TABLE_COLUMNS)
 
             for result in children_results:
                 table.add_row(
@@ -523,8 +636,6 @@ def inheritance(model_name, depth):
         if not parent_results and not children_results:
             console.print(f"[yellow]No inheritance relationships found for '{model_name}'[/yellow]\n")
 
-        connection.close()
-
     except Exception as e:
         console.print(f"\n[bold red]Error:[/bold red] {str(e)}\n")
         logger.error(f"Inheritance query failed: {str(e)}", exc_info=True)
@@ -535,19 +646,17 @@ def inheritance(model_name, depth):
 @click.argument("field_name")
 @click.option("--model", help="Filter by model name")
 @click.option("--limit", default=20, help="Limit number of results")
-def find_field(field_name, model, limit):
+@click.pass_context
+def find_field(ctx, field_name, model, limit):
     """
     Find fields by name across all models.
 
     FIELD_NAME: Name of the field to search for
     """
-    from rich.table import Table
-    from graph import Neo4jConnection
     from graph.queries import find_field_by_name
     from utils.logger import get_logger
 
     logger = get_logger(__name__)
-    settings = get_settings()
 
     console.print(f"\n[bold cyan]Searching for field:[/bold cyan] [yellow]{field_name}[/yellow]")
     if model:
@@ -556,33 +665,25 @@ def find_field(field_name, model, limit):
 
     try:
         # Connect to Neo4j
-        connection = Neo4jConnection(
-            uri=settings.neo4j_uri,
-            user=settings.neo4j_user,
-            password=settings.neo4j_password
-        )
+        connection = _get_connection(ctx)
 
-        if not connection.connect():
+        if connection is None:
             console.print("[bold red]Failed to connect to Neo4j[/bold red]")
             console.print("Please check your connection settings.\n")
             sys.exit(1)
 
         # Find fields
-        query, params = find_field_by_name(field_name, model)
+        query, params = find_field_by_name(field_name, model, limit)
         results = connection.execute_query(query, params)
 
         if not results:
             console.print(f"[yellow]Field '{field_name}' not found[/yellow]\n")
-            connection.close()
             return
 
-        table = Table(title=f"Field '{field_name}' found in {len(results)} model(s) (showing {min(limit, len(results))})")
-        table.add_column("Model", style="cyan")
-        table.add_column("Type", style="yellow")
-        table.add_column("Label", style="green")
-        table.add_column("Required", style="magenta")
+        total = results[0].get('total', len(results))
+        table = _make_table(f"Field '{field_name}' found in {total} model(s) (showing {len(results)})", _FIELD_MATCH_TABLE_COLUMNS)
 
-        for result in results[:limit]:
+        for result in results:
             table.add_row(
                 result.get('model', ''),
                 result.get('type', ''),
@@ -593,8 +694,6 @@ def find_field(field_name, model, limit):
         console.print(table)
         console.print()
 
-        connection.close()
-
     except Exception as e:
         console.print(f"\n[bold red]Error:[/bold red] {str(e)}\n")
         logger.error(f"Find field query failed: {str(e)}", exc_info=True)
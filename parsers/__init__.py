@@ -10,6 +10,8 @@ This module contains parsers for Odoo source files:
 
 from .manifest_parser import (
     find_modules,
+    find_module_manifests,
+    find_module_manifests_parallel,
     parse_manifest,
     get_manifest_dependencies,
     is_module_installable,
@@ -30,6 +32,8 @@ from .module_discovery import (
 __all__ = [
     # Manifest parser
     "find_modules",
+    "find_module_manifests",
+    "find_module_manifests_parallel",
     "parse_manifest",
     "get_manifest_dependencies",
     "is_module_installable",
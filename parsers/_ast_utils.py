@@ -0,0 +1,112 @@
+"""
+AST helpers shared by the manifest and model parsers.
+
+Parses raw source files and converts their literal parts (manifest
+dictionaries, model attributes, field arguments) into plain Python values
+without executing any code.
+"""
+
+import ast
+import logging
+from typing import Any, Dict
+
+logger = logging.getLogger(__name__)
+
+# Names standing for constants (NameConstant in older Python)
+_NAME_CONSTANTS = {"True": True, "False": False, "None": None}
+
+
+def parse_source(source: bytes, filename: str) -> ast.Module:
+    """
+    Parse raw source bytes, letting ast.parse decode them.
+
+    ast.parse honours a BOM or PEP 263 coding declaration and otherwise
+    assumes UTF-8. Undeclared non-UTF-8 files are parsed as latin-1.
+
+    Args:
+        source: Raw content of the file
+        filename: File name used in error messages
+
+    Returns:
+        Parsed module
+
+    Raises:
+        SyntaxError: If the source cannot be parsed
+    """
+    try:
+        return ast.parse(source, filename=filename)
+    except SyntaxError:
+        try:
+            source.decode("utf-8")
+        except UnicodeDecodeError:
+            return ast.parse(source.decode("latin-1"), filename=filename)
+        raise
+
+
+def ast_dict_to_python(node: ast.Dict) -> Dict[str, Any]:
+    """
+    Convert AST Dict node to Python dictionary.
+
+    Entries whose key is not a string (or that are ``**`` unpackings) are
+    skipped.
+
+    Args:
+        node: AST Dict node
+
+    Returns:
+        Python dictionary with converted values
+    """
+    keys, values = node.keys, node.values
+    result = {}
+
+    for i in range(len(keys)):
+        key_node = keys[i]
+        if key_node is None:
+            continue
+
+        key = ast_node_to_python(key_node)
+        if type(key) is str:
+            result[key] = ast_node_to_python(values[i])
+
+    return result
+
+
+def _ast_name_to_python(node: ast.Name) -> Any:
+    """Convert the True/False/None names (NameConstant in older Python)."""
+    if node.id in _NAME_CONSTANTS:
+        return _NAME_CONSTANTS[node.id]
+
+    logger.debug("Unsupported AST node type: Name")
+    return None
+
+
+# Converter per exact node class: one dict lookup instead of a chain of
+# isinstance checks for every literal
+_NODE_CONVERTERS = {
+    ast.Constant: lambda node: node.value,
+    ast.List: lambda node: [ast_node_to_python(elem) for elem in node.elts],
+    ast.Tuple: lambda node: tuple(ast_node_to_python(elem) for elem in node.elts),
+    ast.Dict: ast_dict_to_python,
+    ast.Name: _ast_name_to_python,
+}
+
+
+def ast_node_to_python(node: ast.AST) -> Any:
+    """
+    Convert an AST node to a Python value.
+
+    Handles: strings, numbers, booleans, None, lists, dicts, tuples.
+
+    Args:
+        node: AST node to convert
+
+    Returns:
+        Python value, or None if conversion not supported
+    """
+    converter = _NODE_CONVERTERS.get(type(node))
+    if converter is not None:
+        return converter(node)
+
+    # Unsupported node type
+    logger.debug("Unsupported AST node type: %s", type(node).__name__)
+    return None
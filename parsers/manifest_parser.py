@@ -7,8 +7,14 @@ their __manifest__.py or __openerp__.py files using AST.
 
 import ast
 import logging
+import os
+import stat
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Generator, List, Optional, Union
+from typing import Any, Dict, Generator, List, Optional, Tuple, Union
+
+from ._ast_utils import ast_dict_to_python, parse_source
+from .parse_cache import load_or_parse
 
 logger = logging.getLogger(__name__)
 
@@ -37,65 +43,193 @@ def find_modules(
         >>> for module_path in find_modules(Path("/odoo/addons")):
         ...     print(module_path.name)
     """
-    if not directory.exists():
-        logger.error(f"Directory does not exist: {directory}")
-        return
+    for module_path, _ in find_module_manifests(directory, max_depth):
+        yield module_path
 
-    if not directory.is_dir():
-        logger.error(f"Path is not a directory: {directory}")
+
+def find_module_manifests(
+    directory: Path,
+    max_depth: int = 3,
+) -> Generator[Tuple[Path, str], None, None]:
+    """
+    Discover Odoo modules along with the manifest file found in each.
+
+    Passing the manifest name on to parse_manifest saves probing the
+    module directory for it again.
+
+    Args:
+        directory: Root directory to search
+        max_depth: Maximum depth to search (default: 3)
+
+    Yields:
+        Tuples of (module directory, manifest file name)
+    """
+    if not _is_search_root(directory):
         return
 
     try:
-        yield from _find_modules_recursive(directory, current_depth=0, max_depth=max_depth)
+        yield from _walk_modules(str(directory), current_depth=0, max_depth=max_depth)
     except PermissionError as e:
         logger.warning(f"Permission denied accessing directory {directory}: {e}")
 
 
-def _find_modules_recursive(
+def find_module_manifests_parallel(
     directory: Path,
+    workers: int,
+    max_depth: int = 3,
+) -> Generator[Tuple[Path, str], None, None]:
+    """
+    Discover Odoo modules and their manifests with several walker threads.
+
+    The top level is listed first, then each subdirectory is walked in a
+    thread pool: listing directories is I/O-bound and releases the GIL, so
+    threads are enough. Modules are yielded in the same order as
+    find_module_manifests.
+
+    Args:
+        directory: Root directory to search
+        workers: Number of walker threads
+        max_depth: Maximum depth to search (default: 3)
+
+    Yields:
+        Tuples of (module directory, manifest file name)
+    """
+    if not _is_search_root(directory):
+        return
+
+    try:
+        manifest_file, subdirectories = _scan_directory(str(directory))
+    except OSError as e:
+        logger.warning(f"OS error accessing {directory}: {e}")
+        return
+
+    # The root itself may be a module, in which case there is nothing to fan out
+    if manifest_file is not None:
+        yield directory, manifest_file
+        return
+
+    def walk(subdirectory: str) -> List[Tuple[Path, str]]:
+        return list(_walk_modules(subdirectory, current_depth=1, max_depth=max_depth))
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        for modules in executor.map(walk, subdirectories):
+            yield from modules
+
+
+def _is_search_root(directory: Path) -> bool:
+    """
+    Check that a module search root is an existing directory.
+
+    Uses a single stat call, logging why the directory is rejected.
+
+    Args:
+        directory: Root directory to search
+
+    Returns:
+        True if the directory can be searched
+    """
+    try:
+        mode = directory.stat().st_mode
+    except OSError:
+        logger.error(f"Directory does not exist: {directory}")
+        return False
+
+    if not stat.S_ISDIR(mode):
+        logger.error(f"Path is not a directory: {directory}")
+        return False
+
+    return True
+
+
+def _scan_directory(directory: str) -> Tuple[Optional[str], List[str]]:
+    """
+    List a directory once, looking for a manifest and subdirectories.
+
+    Uses os.scandir, whose entries carry the file type read with the
+    directory listing, so no entry needs its own stat call (except
+    symlinks, which are followed like before).
+
+    Args:
+        directory: Directory to list
+
+    Returns:
+        Tuple of (name of the manifest file found, or None; paths of the
+        non-hidden subdirectories, in inode order)
+
+    Raises:
+        OSError: If the directory cannot be listed
+    """
+    manifests = set()
+    subdirectories = []
+
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            name = entry.name
+            if name in MANIFEST_FILES:
+                if entry.is_file():
+                    manifests.add(name)
+            elif name[:1] != "." and entry.is_dir():
+                subdirectories.append(entry)
+
+    # Visiting siblings in inode order keeps reads close together on disk.
+    # The inode comes with the listing on POSIX; elsewhere keep listing order.
+    try:
+        subdirectories.sort(key=os.DirEntry.inode)
+    except OSError:
+        pass
+
+    # Honour the preference order of MANIFEST_FILES
+    manifest_file = next((name for name in MANIFEST_FILES if name in manifests), None)
+    return manifest_file, [entry.path for entry in subdirectories]
+
+
+def _walk_modules(
+    directory: str,
     current_depth: int,
     max_depth: int,
-) -> Generator[Path, None, None]:
+) -> Generator[Tuple[Path, str], None, None]:
     """
-    Recursive helper for find_modules.
+    Depth-first walk for find_module_manifests, with an explicit stack.
+
+    Paths stay plain strings while walking; a Path is only built for the
+    module directories that are yielded.
 
     Args:
-        directory: Current directory to search
-        current_depth: Current recursion depth
+        directory: Directory to start from
+        current_depth: Depth of ``directory`` below the search root
         max_depth: Maximum depth to search
 
     Yields:
-        Path objects pointing to module directories
+        Tuples of (module directory, manifest file name)
     """
-    if current_depth > max_depth:
-        return
+    stack = [(directory, current_depth)]
+
+    while stack:
+        directory, depth = stack.pop()
+        if depth > max_depth:
+            continue
+
+        try:
+            manifest_file, subdirectories = _scan_directory(directory)
+        except PermissionError as e:
+            logger.warning(f"Permission denied accessing {directory}: {e}")
+            continue
+        except OSError as e:
+            logger.warning(f"OS error accessing {directory}: {e}")
+            continue
 
-    try:
         # Check if current directory is a module
-        for manifest_file in MANIFEST_FILES:
-            manifest_path = directory / manifest_file
-            if manifest_path.exists() and manifest_path.is_file():
-                logger.debug(f"Found module: {directory}")
-                yield directory
-                # Don't recurse into modules (they might contain submodules)
-                return
-
-        # Recurse into subdirectories
-        for item in directory.iterdir():
-            if item.is_dir() and not item.name.startswith("."):
-                yield from _find_modules_recursive(
-                    item,
-                    current_depth + 1,
-                    max_depth,
-                )
+        if manifest_file is not None:
+            logger.debug("Found module: %s", directory)
+            yield Path(directory), manifest_file
+            # Don't descend into modules (they might contain submodules)
+            continue
 
-    except PermissionError as e:
-        logger.warning(f"Permission denied accessing {directory}: {e}")
-    except OSError as e:
-        logger.warning(f"OS error accessing {directory}: {e}")
+        # Pushed in reverse so the first subdirectory is walked first
+        stack.extend((subdirectory, depth + 1) for subdirectory in reversed(subdirectories))
 
 
-def parse_manifest(module_path: Path) -> Optional[Dict[str, Any]]:
+def parse_manifest(module_path: Path, manifest_file: Optional[str] = None) -> Optional[Dict[str, Any]]:
     """
     Parse Odoo module manifest file.
 
@@ -104,6 +238,9 @@ def parse_manifest(module_path: Path) -> Optional[Dict[str, Any]]:
 
     Args:
         module_path: Path to module directory
+        manifest_file: Name of the manifest file, as found by
+            find_module_manifests. When given, the directory is not probed
+            for it again.
 
     Returns:
         Dictionary with module metadata, or None if parsing failed
@@ -115,21 +252,23 @@ def parse_manifest(module_path: Path) -> Optional[Dict[str, Any]]:
         >>> print(manifest["depends"])
         ['base', 'product']
     """
-    if not module_path.is_dir():
-        logger.error(f"Not a directory: {module_path}")
-        return None
+    if manifest_file is not None:
+        manifest_file = module_path / manifest_file
+    else:
+        if not module_path.is_dir():
+            logger.error(f"Not a directory: {module_path}")
+            return None
 
-    # Find manifest file
-    manifest_file = None
-    for filename in MANIFEST_FILES:
-        candidate = module_path / filename
-        if candidate.exists():
-            manifest_file = candidate
-            break
+        # Find manifest file
+        for filename in MANIFEST_FILES:
+            candidate = module_path / filename
+            if candidate.exists():
+                manifest_file = candidate
+                break
 
-    if not manifest_file:
-        logger.warning(f"No manifest file found in {module_path}")
-        return None
+        if not manifest_file:
+            logger.warning(f"No manifest file found in {module_path}")
+            return None
 
     # Parse manifest file
     try:
@@ -158,34 +297,27 @@ def _parse_manifest_file(manifest_path: Path) -> Optional[Dict[str, Any]]:
     Returns:
         Dictionary with manifest data, or None if parsing failed
     """
-    # Try different encodings
-    encodings = ["utf-8", "latin-1", "iso-8859-1"]
-
-    for encoding in encodings:
-        try:
-            content = manifest_path.read_text(encoding=encoding)
-            break
-        except UnicodeDecodeError:
-            continue
-        except Exception as e:
-            logger.error(f"Error reading {manifest_path}: {e}")
-            return None
-    else:
-        logger.error(f"Could not decode {manifest_path} with any encoding")
+    # Read once; ast.parse decodes the bytes itself
+    try:
+        source = manifest_path.read_bytes()
+    except Exception as e:
+        logger.error(f"Error reading {manifest_path}: {e}")
         return None
 
-    # Parse with AST
+    # Parse with AST, unless this exact content was parsed by an earlier run
+    def parse() -> Optional[Dict[str, Any]]:
+        tree = parse_source(source, str(manifest_path))
+        # Extract the manifest dictionary
+        # Odoo manifests are typically: { 'key': 'value', ... }
+        # We need to find the dictionary assignment or expression
+        return _extract_manifest_dict(tree)
+
     try:
-        tree = ast.parse(content, filename=str(manifest_path))
+        manifest_dict = load_or_parse(parse, source, "manifest", source_path=str(manifest_path))
     except SyntaxError as e:
         logger.warning(f"Syntax error in {manifest_path}: {e}")
         return None
 
-    # Extract the manifest dictionary
-    # Odoo manifests are typically: { 'key': 'value', ... }
-    # We need to find the dictionary assignment or expression
-    manifest_dict = _extract_manifest_dict(tree)
-
     if manifest_dict is None:
         logger.warning(f"Could not extract manifest dict from {manifest_path}")
         return None
@@ -210,94 +342,15 @@ def _extract_manifest_dict(tree: ast.Module) -> Optional[Dict[str, Any]]:
     for node in tree.body:
         # Case 1: Direct expression (just a dict)
         if isinstance(node, ast.Expr) and isinstance(node.value, ast.Dict):
-            return _ast_dict_to_python(node.value)
+            return ast_dict_to_python(node.value)
 
         # Case 2: Assignment like: manifest = {...} or __manifest__ = {...}
         if isinstance(node, ast.Assign):
             for target in node.targets:
                 if isinstance(target, ast.Name):
                     if isinstance(node.value, ast.Dict):
-                        return _ast_dict_to_python(node.value)
-
-    return None
-
-
-def _ast_dict_to_python(node: ast.Dict) -> Dict[str, Any]:
-    """
-    Convert AST Dict node to Python dictionary.
-
-    Args:
-        node: AST Dict node
-
-    Returns:
-        Python dictionary with converted values
-    """
-    result = {}
-
-    for key_node, value_node in zip(node.keys, node.values):
-        # Extract key (usually a string)
-        if key_node is None:
-            continue
-
-        key = _ast_node_to_python(key_node)
-        if not isinstance(key, str):
-            continue
-
-        # Extract value
-        value = _ast_node_to_python(value_node)
-        result[key] = value
-
-    return result
-
-
-def _ast_node_to_python(node: ast.AST) -> Any:
-    """
-    Convert an AST node to a Python value.
-
-    Handles: strings, numbers, booleans, None, lists, dicts.
-
-    Args:
-        node: AST node to convert
-
-    Returns:
-        Python value, or None if conversion not supported
-    """
-    # String (Constant in Python 3.8+, Str in older versions)
-    if isinstance(node, ast.Constant):
-        return node.value
-
-    # For Python < 3.8 compatibility (deprecated but still supported)
-    # These checks will be removed in future versions
-    if hasattr(ast, "Str") and isinstance(node, ast.Str):
-        return node.s
-    if hasattr(ast, "Num") and isinstance(node, ast.Num):
-        return node.n
-    if hasattr(ast, "NameConstant") and isinstance(node, ast.NameConstant):
-        return node.value
-
-    # List
-    if isinstance(node, ast.List):
-        return [_ast_node_to_python(elem) for elem in node.elts]
-
-    # Tuple
-    if isinstance(node, ast.Tuple):
-        return tuple(_ast_node_to_python(elem) for elem in node.elts)
-
-    # Dict
-    if isinstance(node, ast.Dict):
-        return _ast_dict_to_python(node)
-
-    # Boolean and None (NameConstant in older Python)
-    if isinstance(node, ast.Name):
-        if node.id == "True":
-            return True
-        elif node.id == "False":
-            return False
-        elif node.id == "None":
-            return None
+                        return ast_dict_to_python(node.value)
 
-    # Unsupported node type
-    logger.debug(f"Unsupported AST node type: {type(node).__name__}")
     return None
 
 
@@ -7,18 +7,34 @@ extracting model definitions, fields, and inheritance information using AST.
 
 import ast
 import logging
+import os
+import re
 from pathlib import Path
 from typing import Any, Dict, Generator, List, Optional
 
+from ._ast_utils import ast_node_to_python, parse_source
+from .parse_cache import load_or_parse
+
 logger = logging.getLogger(__name__)
 
+# try statements, including try/except* (Python 3.11+)
+_TRY_NODES = (ast.Try, ast.TryStar) if hasattr(ast, "TryStar") else (ast.Try,)
+
 # Odoo field types to detect
-ODOO_FIELD_TYPES = {
+ODOO_FIELD_TYPES = frozenset({
     'Char', 'Text', 'Integer', 'Float', 'Boolean', 'Date', 'Datetime',
     'Binary', 'Selection', 'Html', 'Monetary',
     'Many2one', 'One2many', 'Many2many',
     'Reference', 'Json', 'Properties',
-}
+})
+
+# Base classes of Odoo models (models.Model, ...)
+_BASE_MODEL_NAMES = frozenset({"Model", "TransientModel", "AbstractModel"})
+
+# Cheap byte-level test for a class deriving from one of _BASE_MODEL_NAMES,
+# run before parsing. Bases may span lines; a base list containing a ')'
+# before the model base (e.g. a call) is missed.
+_MODEL_CLASS_RE = re.compile(rb"\bclass\s+\w+\s*\([^)]*\b(?:Transient|Abstract)?Model\b")
 
 
 def find_model_files(module_path: Path) -> Generator[Path, None, None]:
@@ -48,17 +64,24 @@ def find_model_files(module_path: Path) -> Generator[Path, None, None]:
     ]
 
     for models_dir in model_dirs:
-        if not models_dir.exists() or not models_dir.is_dir():
+        if not models_dir.is_dir():
             continue
 
         try:
-            for py_file in models_dir.glob("*.py"):
-                # Skip __init__.py and __manifest__.py
-                if py_file.name.startswith("__"):
-                    continue
-
-                logger.debug(f"Found model file: {py_file}")
-                yield py_file
+            # A plain suffix test on the listing; glob() would fnmatch
+            # every entry
+            with os.scandir(models_dir) as entries:
+                for entry in entries:
+                    name = entry.name
+                    # Skip __init__.py and __manifest__.py
+                    if not name.endswith(".py") or name[:2] == "__":
+                        continue
+                    if not entry.is_file():
+                        continue
+
+                    py_file = Path(entry.path)
+                    logger.debug("Found model file: %s", py_file)
+                    yield py_file
 
         except PermissionError as e:
             logger.warning(f"Permission denied accessing {models_dir}: {e}")
@@ -66,13 +89,19 @@ def find_model_files(module_path: Path) -> Generator[Path, None, None]:
             logger.warning(f"OS error accessing {models_dir}: {e}")
 
 
-def parse_model_file(file_path: Path, module_name: Optional[str] = None) -> List[Dict[str, Any]]:
+def parse_model_file(
+    file_path: Path,
+    module_name: Optional[str] = None,
+    prefilter: bool = True,
+) -> List[Dict[str, Any]]:
     """
     Parse a Python file and extract all Odoo model definitions.
 
     Args:
         file_path: Path to Python file
         module_name: Optional module name (inferred from path if not provided)
+        prefilter: Skip parsing files in which _MODEL_CLASS_RE finds no
+            model class. Pass False to parse every file regardless.
 
     Returns:
         List of dictionaries with model metadata
@@ -96,27 +125,28 @@ def parse_model_file(file_path: Path, module_name: Optional[str] = None) -> List
         else:
             module_name = file_path.parent.name
 
-    # Try different encodings
-    encodings = ["utf-8", "latin-1", "iso-8859-1"]
-    content = None
-
-    for encoding in encodings:
-        try:
-            content = file_path.read_text(encoding=encoding)
-            break
-        except UnicodeDecodeError:
-            continue
-        except Exception as e:
-            logger.error(f"Error reading {file_path}: {e}")
-            return []
+    # Read once; ast.parse decodes the bytes itself
+    try:
+        source = file_path.read_bytes()
+    except Exception as e:
+        logger.error(f"Error reading {file_path}: {e}")
+        return []
 
-    if content is None:
-        logger.error(f"Could not decode {file_path} with any encoding")
+    if prefilter and not _MODEL_CLASS_RE.search(source):
+        logger.debug("No model class in %s, skipping parse", file_path)
         return []
 
-    # Parse with AST
+    # Parse with AST, unless this exact content was parsed by an earlier run.
+    # Failures raise out of load_or_parse, so they are never cached.
     try:
-        tree = ast.parse(content, filename=str(file_path))
+        return load_or_parse(
+            lambda: _extract_models(source, file_path, module_name),
+            source,
+            "models",
+            str(file_path),
+            module_name,
+            source_path=str(file_path),
+        )
     except SyntaxError as e:
         logger.warning(f"Syntax error in {file_path}: {e}")
         return []
@@ -124,19 +154,65 @@ def parse_model_file(file_path: Path, module_name: Optional[str] = None) -> List
         logger.error(f"Error parsing {file_path}: {e}")
         return []
 
+
+def _extract_models(source: bytes, file_path: Path, module_name: str) -> List[Dict[str, Any]]:
+    """
+    Parse source code and extract its Odoo model definitions.
+
+    Args:
+        source: Raw content of the file
+        file_path: Path of the file
+        module_name: Module the file belongs to
+
+    Returns:
+        List of dictionaries with model metadata
+
+    Raises:
+        SyntaxError: If the source cannot be parsed
+    """
+    tree = parse_source(source, str(file_path))
+
     # Extract models from AST
     models = []
 
-    for node in ast.walk(tree):
-        if isinstance(node, ast.ClassDef):
-            if is_odoo_model(node):
-                model_data = extract_model_from_class(node, file_path, module_name)
-                if model_data:
-                    models.append(model_data)
+    for node in _iter_module_classes(tree.body):
+        if is_odoo_model(node):
+            model_data = extract_model_from_class(node, file_path, module_name)
+            if model_data:
+                models.append(model_data)
 
     return models
 
 
+def _iter_module_classes(body: List[ast.stmt]) -> Generator[ast.ClassDef, None, None]:
+    """
+    Yield the classes defined at module level, in source order.
+
+    Odoo models are top-level classes, so instead of visiting every node
+    of the tree only module-level statements are scanned, descending into
+    if/try blocks for conditionally defined classes. Classes nested in
+    functions or other classes are not found.
+
+    Args:
+        body: Statements of the module (or of an if/try block)
+
+    Yields:
+        ClassDef nodes
+    """
+    for node in body:
+        if isinstance(node, ast.ClassDef):
+            yield node
+        elif isinstance(node, ast.If):
+            yield from _iter_module_classes(node.body)
+            yield from _iter_module_classes(node.orelse)
+        elif isinstance(node, _TRY_NODES):
+            yield from _iter_module_classes(node.body)
+            for handler in node.handlers:
+                yield from _iter_module_classes(handler.body)
+            yield from _iter_module_classes(node.orelse)
+            yield from _iter_module_classes(node.finalbody)
+
+
 def is_odoo_model(class_node: ast.ClassDef) -> bool:
     """
     Check if a class is an Odoo model.
@@ -155,12 +231,12 @@ def is_odoo_model(class_node: ast.ClassDef) -> bool:
         if isinstance(base, ast.Attribute):
             if isinstance(base.value, ast.Name):
                 # models.Model pattern
-                if base.value.id == "models" and base.attr in ["Model", "TransientModel", "AbstractModel"]:
+                if base.value.id == "models" and base.attr in _BASE_MODEL_NAMES:
                     return True
 
         # Check for direct class names (less common)
         if isinstance(base, ast.Name):
-            if base.id in ["Model", "TransientModel", "AbstractModel"]:
+            if base.id in _BASE_MODEL_NAMES:
                 return True
 
     return False
@@ -211,7 +287,7 @@ def extract_model_from_class(
 
                     # Extract _inherit
                     elif var_name == "_inherit":
-                        inherit_value = _ast_node_to_python(item.value)
+                        inherit_value = ast_node_to_python(item.value)
                         if isinstance(inherit_value, str):
                             model_data["inherit"] = [inherit_value]
                         elif isinstance(inherit_value, list):
@@ -221,7 +297,7 @@ def extract_model_from_class(
 
                     # Extract _inherits
                     elif var_name == "_inherits":
-                        inherits_value = _ast_node_to_python(item.value)
+                        inherits_value = ast_node_to_python(item.value)
                         if isinstance(inherits_value, dict):
                             model_data["inherits"] = inherits_value
 
@@ -299,7 +375,7 @@ def _extract_field_info(node: ast.Call) -> Optional[Dict[str, Any]]:
     # Extract positional arguments
     if node.args:
         # First arg is usually 'string' for relational fields or selection for Selection
-        first_arg = _ast_node_to_python(node.args[0])
+        first_arg = ast_node_to_python(node.args[0])
         if field_type == "Selection" and isinstance(first_arg, list):
             field_info["selection"] = first_arg
         elif isinstance(first_arg, str):
@@ -308,7 +384,7 @@ def _extract_field_info(node: ast.Call) -> Optional[Dict[str, Any]]:
     # Extract keyword arguments
     for keyword in node.keywords:
         if keyword.arg:
-            value = _ast_node_to_python(keyword.value)
+            value = ast_node_to_python(keyword.value)
             field_info[keyword.arg] = value
 
     return field_info
@@ -324,62 +400,5 @@ def _get_string_value(node: ast.AST) -> Optional[str]:
     Returns:
         String value or None
     """
-    value = _ast_node_to_python(node)
+    value = ast_node_to_python(node)
     return value if isinstance(value, str) else None
-
-
-def _ast_node_to_python(node: ast.AST) -> Any:
-    """
-    Convert an AST node to a Python value.
-
-    Handles: strings, numbers, booleans, None, lists, dicts, tuples.
-
-    Args:
-        node: AST node to convert
-
-    Returns:
-        Python value, or None if conversion not supported
-    """
-    # Constant (Python 3.8+)
-    if isinstance(node, ast.Constant):
-        return node.value
-
-    # For Python < 3.8 compatibility
-    if hasattr(ast, "Str") and isinstance(node, ast.Str):
-        return node.s
-    if hasattr(ast, "Num") and isinstance(node, ast.Num):
-        return node.n
-    if hasattr(ast, "NameConstant") and isinstance(node, ast.NameConstant):
-        return node.value
-
-    # List
-    if isinstance(node, ast.List):
-        return [_ast_node_to_python(elem) for elem in node.elts]
-
-    # Tuple
-    if isinstance(node, ast.Tuple):
-        return tuple(_ast_node_to_python(elem) for elem in node.elts)
-
-    # Dict
-    if isinstance(node, ast.Dict):
-        result = {}
-        for key_node, value_node in zip(node.keys, node.values):
-            if key_node is None:
-                continue
-            key = _ast_node_to_python(key_node)
-            if isinstance(key, str):
-                result[key] = _ast_node_to_python(value_node)
-        return result
-
-    # Boolean and None
-    if isinstance(node, ast.Name):
-        if node.id == "True":
-            return True
-        elif node.id == "False":
-            return False
-        elif node.id == "None":
-            return None
-
-    # Unsupported
-    logger.debug(f"Unsupported AST node type: {type(node).__name__}")
-    return None
@@ -0,0 +1,242 @@
+"""
+Persistent cache of parser results.
+
+Parsing a source file (ast.parse plus walking the tree) dominates the CPU
+time of a cold index run, yet most files are unchanged between runs. This
+module stores what the parsers extracted from a file on disk, keyed by a
+SHA256 of the file's content and everything else the result depends on,
+so an unchanged file is read and hashed but never parsed again.
+
+Results are plain literals, so entries are stored as JSON (tuples tagged
+to survive the round trip): reading an entry never runs code, even from a
+cache directory shared with others. Entries live under CACHE_DIR/parse/
+and are only used when ENABLE_CACHE is on. Each entry records the path of
+the file it was parsed from, and every use refreshes its mtime, so entries
+a full run over an addons root did not use can be pruned without touching
+those of other roots (see prune_cache). Bump _CACHE_VERSION whenever a
+parser's output or the entry layout changes shape.
+"""
+
+import atexit
+import hashlib
+import json
+import logging
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Part of every key: invalidates entries written by older parser code
+_CACHE_VERSION = "4"
+
+# Key of the single-entry JSON object standing for a tuple
+_TUPLE_KEY = "__tuple__"
+
+# Slack for filesystems with coarse modification times (e.g. 2s on FAT)
+_MTIME_SLACK_SECONDS = 2.0
+
+_stats = {"hits": 0, "misses": 0}
+
+# Resolved on first use: Path of the cache directory, or False if disabled
+_cache_dir = None
+
+
+def _get_cache_dir() -> Optional[Path]:
+    """Get the parse cache directory, or None if caching is disabled."""
+    global _cache_dir
+
+    if _cache_dir is None:
+        from config.settings import get_settings
+
+        settings = get_settings()
+        _cache_dir = settings.cache_dir / "parse" if settings.enable_cache else False
+
+    return _cache_dir or None
+
+
+def _cache_key(content: bytes, *context: str) -> str:
+    """Hash file content with the parser context and Python version."""
+    hash_obj = hashlib.sha256()
+    for part in (_CACHE_VERSION, sys.version, *context):
+        hash_obj.update(part.encode("utf-8"))
+        hash_obj.update(b"\0")
+    hash_obj.update(content)
+    return hash_obj.hexdigest()
+
+
+def _encode(value: Any) -> Any:
+    """
+    Make a parse result JSON-representable without losing tuples.
+
+    Args:
+        value: Parse result (literals, lists, tuples, dicts)
+
+    Returns:
+        Value with every tuple replaced by a tagged JSON object
+
+    Raises:
+        TypeError: If a dict could be mistaken for a tagged tuple
+    """
+    value_type = type(value)
+    if value_type is tuple:
+        return {_TUPLE_KEY: [_encode(item) for item in value]}
+    if value_type is list:
+        return [_encode(item) for item in value]
+    if value_type is dict:
+        if len(value) == 1 and _TUPLE_KEY in value:
+            raise TypeError(f"dict with a single {_TUPLE_KEY!r} key")
+        return {key: _encode(item) for key, item in value.items()}
+    return value
+
+
+def _decode_object(obj: Dict[str, Any]) -> Any:
+    """json object_hook turning tagged objects back into tuples."""
+    if len(obj) == 1 and _TUPLE_KEY in obj:
+        return tuple(obj[_TUPLE_KEY])
+    return obj
+
+
+def load_or_parse(
+    parse: Callable[[], Any],
+    content: bytes,
+    *context: str,
+    source_path: Optional[str] = None
+) -> Any:
+    """
+    Return the cached result of parsing ``content``, or parse and store it.
+
+    Entries are written to a temporary file and renamed into place, so
+    concurrent worker processes never read a partial entry. An unreadable
+    entry is treated as a miss; a result JSON cannot represent is returned
+    without being stored.
+
+    Args:
+        parse: Function computing the result from ``content``
+        content: Raw bytes of the file
+        *context: Other inputs the result depends on (kind of parser,
+            file path, module name...)
+        source_path: Path of the parsed file, recorded in the entry so it
+            is only pruned by runs over the root containing it
+
+    Returns:
+        The parse result
+    """
+    cache_dir = _get_cache_dir()
+    if cache_dir is None:
+        return parse()
+
+    key = _cache_key(content, *context)
+    entry_path = cache_dir / key[:2] / f"{key[2:]}.json"
+
+    try:
+        with open(entry_path, "r", encoding="utf-8") as f:
+            result = json.load(f, object_hook=_decode_object)["result"]
+        # Mark the entry as used by this run (see prune_cache)
+        os.utime(entry_path)
+        _stats["hits"] += 1
+        return result
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.debug("Ignoring unreadable parse cache entry %s: %s", entry_path, e)
+
+    _stats["misses"] += 1
+    result = parse()
+
+    try:
+        entry = {
+            "source": os.path.abspath(source_path) if source_path else None,
+            "result": _encode(result),
+        }
+        data = json.dumps(entry, separators=(",", ":"))
+        entry_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=entry_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(data)
+            os.replace(tmp_path, entry_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except Exception as e:
+        logger.debug("Could not write parse cache entry %s: %s", entry_path, e)
+
+    return result
+
+
+def prune_cache(since: float, root: Optional[Path] = None) -> int:
+    """
+    Delete cache entries that were not used since a point in time.
+
+    Call it after a run that parsed every file under ``root`` (not an
+    incremental run, which skips unchanged files without touching their
+    entries), with the time the run started: what is left untouched under
+    that root belongs to files that were edited or removed since. Entries
+    recorded for files outside ``root`` are kept, since the cache directory
+    is shared by every addons root indexed with the same CACHE_DIR.
+    Unreadable entries and leftovers of older cache formats go too.
+
+    Args:
+        since: time.time() value taken when the run started
+        root: Addons root the run covered (None prunes every stale entry)
+
+    Returns:
+        Number of files removed
+    """
+    cache_dir = _get_cache_dir()
+    if cache_dir is None or not cache_dir.is_dir():
+        return 0
+
+    cutoff = since - _MTIME_SLACK_SECONDS
+    root_prefix = os.path.join(os.path.abspath(root), "") if root is not None else None
+    removed = 0
+
+    with os.scandir(cache_dir) as buckets:
+        bucket_paths = [bucket.path for bucket in buckets if bucket.is_dir(follow_symlinks=False)]
+
+    for bucket_path in bucket_paths:
+        with os.scandir(bucket_path) as entries:
+            for entry in entries:
+                try:
+                    if not entry.is_file(follow_symlinks=False) or entry.stat().st_mtime >= cutoff:
+                        continue
+                    if root_prefix is not None and not _is_under(entry.path, root_prefix):
+                        continue
+                    os.unlink(entry.path)
+                    removed += 1
+                except OSError as e:
+                    logger.debug("Could not prune parse cache entry %s: %s", entry.path, e)
+
+    if removed:
+        logger.info("Pruned %d unused parse cache entries", removed)
+    return removed
+
+
+def _is_under(entry_path: str, root_prefix: str) -> bool:
+    """
+    Check whether a cache entry was parsed from a file under a root.
+
+    Args:
+        entry_path: Path of the cache entry
+        root_prefix: Absolute root path ending with a separator
+
+    Returns:
+        True if the entry's source is under the root, or if the entry has
+        no readable source (unusable, so safe to delete)
+    """
+    try:
+        with open(entry_path, "r", encoding="utf-8") as f:
+            source = json.load(f).get("source")
+    except Exception:
+        return True
+    return not isinstance(source, str) or source.startswith(root_prefix)
+
+
+@atexit.register
+def _log_stats() -> None:
+    """Log cache hit/miss counts of this process at shutdown."""
+    if _stats["hits"] or _stats["misses"]:
+        logger.debug("Parse cache: %d hits, %d misses", _stats["hits"], _stats["misses"])
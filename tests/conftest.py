@@ -0,0 +1,55 @@
+"""
+Shared fixtures for the Odoo Tracker test suite.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from config.settings import get_settings
+from parsers import parse_cache
+
+
+@pytest.fixture(autouse=True)
+def isolated_environment(tmp_path, monkeypatch):
+    """Keep settings, caches and logs of every test inside its tmp_path."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("CACHE_DIR", str(tmp_path / ".cache"))
+    monkeypatch.setenv("LOG_FILE", str(tmp_path / "odoo_tracker.log"))
+
+    # Parse cache off unless a test asks for it (see parse_cache_dir)
+    monkeypatch.setattr(parse_cache, "_cache_dir", False)
+    monkeypatch.setattr(parse_cache, "_stats", {"hits": 0, "misses": 0})
+
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
+
+
+@pytest.fixture
+def parse_cache_dir(tmp_path, monkeypatch) -> Path:
+    """Enable the parse cache in a temporary directory."""
+    cache_dir = tmp_path / "parse"
+    monkeypatch.setattr(parse_cache, "_cache_dir", cache_dir)
+    return cache_dir
+
+
+@pytest.fixture
+def make_addon(tmp_path):
+    """
+    Create an Odoo addon on disk.
+
+    Returns a function taking the module name, the manifest source and a
+    dictionary of model file name -> source, and returning the module path.
+    """
+    def _make_addon(name, manifest, model_files=None):
+        module_path = tmp_path / "addons" / name
+        (module_path / "models").mkdir(parents=True)
+        (module_path / "__init__.py").write_text("from . import models\n")
+        (module_path / "__manifest__.py").write_text(manifest)
+        (module_path / "models" / "__init__.py").write_text("")
+        for file_name, source in (model_files or {}).items():
+            (module_path / "models" / file_name).write_text(source)
+        return module_path
+
+    return _make_addon
@@ -0,0 +1,112 @@
+"""
+Tests for file hashing and change detection.
+"""
+
+import hashlib
+
+import pytest
+
+from utils import hashing
+from utils.hashing import (
+    SHA256,
+    XXH3,
+    check_file_hash,
+    compute_file_hash,
+    compute_file_hash_cached,
+    has_file_changed,
+    hash_algorithm,
+)
+
+CONTENT = b"from odoo import models\n"
+SHA256_HEX = hashlib.sha256(CONTENT).hexdigest()
+
+requires_xxhash = pytest.mark.skipif(not hashing.XXHASH_AVAILABLE, reason="xxhash not installed")
+
+
+@pytest.fixture
+def source_file(tmp_path):
+    path = tmp_path / "model.py"
+    path.write_bytes(CONTENT)
+    return path
+
+
+@pytest.fixture
+def without_xxhash(monkeypatch):
+    monkeypatch.setattr(hashing, "XXHASH_AVAILABLE", False)
+    monkeypatch.setattr(hashing, "DEFAULT_HASH_ALGORITHM", SHA256)
+
+
+def test_hashes_are_prefixed_with_their_algorithm(source_file):
+    assert compute_file_hash(source_file, SHA256) == f"sha256:{SHA256_HEX}"
+    assert hash_algorithm(compute_file_hash(source_file)) == hashing.DEFAULT_HASH_ALGORITHM
+
+
+@requires_xxhash
+def test_empty_file_xxh3(tmp_path):
+    path = tmp_path / "empty.py"
+    path.write_bytes(b"")
+
+    assert hash_algorithm(compute_file_hash(path, XXH3)) == XXH3
+
+
+@pytest.mark.parametrize("stored, algorithm", [
+    (SHA256_HEX, SHA256),
+    (f"sha256:{SHA256_HEX}", SHA256),
+    ("0123456789abcdef", XXH3),
+    ("xxh3:0123456789abcdef", XXH3),
+])
+def test_hash_algorithm(stored, algorithm):
+    assert hash_algorithm(stored) == algorithm
+
+
+@pytest.mark.parametrize("stored", [SHA256_HEX, f"sha256:{SHA256_HEX}"])
+def test_sha256_hash_matches_unchanged_file(source_file, stored):
+    file_hash, changed = check_file_hash(source_file, stored, {}, {})
+
+    assert not changed
+    assert file_hash == f"sha256:{SHA256_HEX}"
+    assert not has_file_changed(source_file, stored)
+
+
+@requires_xxhash
+def test_xxh3_hash_matches_unchanged_file(source_file):
+    stored = compute_file_hash(source_file, XXH3)
+
+    assert check_file_hash(source_file, stored, {}, {}) == (stored, False)
+    # Older values were stored without the prefix
+    assert check_file_hash(source_file, stored.partition(":")[2], {}, {})[1] is False
+
+
+def test_changed_file_gets_default_algorithm(source_file):
+    stored = f"sha256:{SHA256_HEX}"
+    source_file.write_bytes(CONTENT + b"# edited\n")
+
+    file_hash, changed = check_file_hash(source_file, stored, {}, {})
+
+    assert changed
+    assert hash_algorithm(file_hash) == hashing.DEFAULT_HASH_ALGORITHM
+    assert has_file_changed(source_file, stored)
+
+
+def test_new_file_is_changed(source_file):
+    assert check_file_hash(source_file, None, {}, {})[1] is True
+
+
+def test_xxh3_hash_without_xxhash_counts_as_changed(source_file, without_xxhash):
+    file_hash, changed = check_file_hash(source_file, "xxh3:0123456789abcdef", {}, {})
+
+    assert changed
+    assert file_hash == f"sha256:{SHA256_HEX}"
+    with pytest.raises(ValueError):
+        compute_file_hash(source_file, XXH3)
+
+
+def test_cache_entry_reused_only_for_same_algorithm(source_file):
+    stat = source_file.stat()
+    previous = {str(source_file): [stat.st_mtime_ns, stat.st_size, "sha256:cached"]}
+
+    assert compute_file_hash_cached(source_file, previous, {}, SHA256) == "sha256:cached"
+
+    if hashing.XXHASH_AVAILABLE:
+        file_hash = compute_file_hash_cached(source_file, previous, {}, XXH3)
+        assert file_hash == compute_file_hash(source_file, XXH3)
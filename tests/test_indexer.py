@@ -0,0 +1,223 @@
+"""
+Tests for module extraction and the indexing pipeline (without Neo4j).
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from graph import indexer
+from graph.connection import NullConnection
+from graph.indexer import OdooIndexer, _extract_module_data, _map_bounded
+from utils.hashing import load_hash_cache, save_hash_cache
+
+MANIFEST = '{"name": "Sale", "version": "18.0.1.0", "depends": ["base", "mail"]}'
+
+MODEL_SOURCE = '''
+from odoo import fields, models
+
+
+class SaleOrder(models.Model):
+    _name = "sale.order"
+    _inherit = ["mail.thread"]
+    _inherits = {"res.partner": "partner_id"}
+
+    name = fields.Char(required=True)
+    partner_id = fields.Many2one(comodel_name="res.partner")
+    total = fields.Float(compute="_compute_total")
+'''
+
+EXTENSION_SOURCE = '''
+from odoo import models
+
+
+class ResPartner(models.Model):
+    _name = "x.partner"
+    _inherit = "res.partner"
+'''
+
+
+@pytest.fixture
+def sale_module(make_addon):
+    return make_addon("sale", MANIFEST, {"sale_order.py": MODEL_SOURCE})
+
+
+def test_extract_module_data(sale_module):
+    data = _extract_module_data(sale_module, "__manifest__.py", {}, {})
+
+    assert data["module"]["name"] == "sale"
+    assert data["module"]["display_name"] == "Sale"
+    assert data["dependencies"] == [
+        {"from": "sale", "to": "base"},
+        {"from": "sale", "to": "mail"},
+    ]
+
+    (model,) = data["models"]
+    assert model["name"] == "sale.order"
+    assert model["module"] == "sale"
+    assert data["model_module_rels"] == [{"model": "sale.order", "module": "sale"}]
+    assert data["model_inheritance"] == [{"from": "sale.order", "to": "mail.thread"}]
+    assert data["model_delegation"] == [
+        {"from": "sale.order", "to": "res.partner", "field": "partner_id"}
+    ]
+
+    fields = {field["name"]: field for field in data["fields"]}
+    assert set(fields) == {"name", "partner_id", "total"}
+    assert all(field["model_name"] == "sale.order" for field in fields.values())
+    assert fields["name"]["required"] is True
+    assert fields["total"]["is_computed"] is True
+    assert fields["partner_id"]["field_type"] == "Many2one"
+    # Unset parameters are left out
+    assert "help" not in fields["name"]
+
+    assert data["field_references"] == [
+        {"field_name": "partner_id", "model_name": "sale.order", "comodel": "res.partner"}
+    ]
+    assert set(data["file_hashes"]) == {
+        str(sale_module / "__manifest__.py"),
+        str(sale_module / "models" / "sale_order.py"),
+    }
+    assert data["errors"] == 0
+
+
+def test_extract_module_data_skips_openerp_manifest(sale_module):
+    assert _extract_module_data(sale_module, "__openerp__.py", {}, {}) is None
+
+
+def test_extract_module_data_checks_model_files_of_unchanged_module(sale_module):
+    data = _extract_module_data(sale_module, "__manifest__.py", {}, {})
+    existing_hashes = {data["module"]["file_path"]: data["module"]["file_hash"]}
+    existing_hashes.update((model["file_path"], model["file_hash"]) for model in data["models"])
+
+    model_file = sale_module / "models" / "sale_order.py"
+    model_file.write_text(MODEL_SOURCE + "    note = fields.Text()\n")
+
+    data = _extract_module_data(sale_module, "__manifest__.py", existing_hashes, {})
+
+    # Only the module node and its dependencies are skipped
+    assert data["module"] is None
+    assert data["dependencies"] == []
+    assert [model["name"] for model in data["models"]] == ["sale.order"]
+    assert "note" in {field["name"] for field in data["fields"]}
+
+
+def test_extract_module_data_skips_unchanged_model_files(sale_module):
+    data = _extract_module_data(sale_module, "__manifest__.py", {}, {})
+    model_file = data["models"][0]["file_path"]
+    existing_hashes = {model_file: data["models"][0]["file_hash"]}
+
+    data = _extract_module_data(sale_module, "__manifest__.py", existing_hashes, {})
+
+    assert data["module"]["name"] == "sale"
+    assert data["models"] == []
+    assert data["fields"] == []
+
+
+def test_map_bounded_keeps_order_and_window():
+    pulled = []
+    lock = threading.Lock()
+
+    def items():
+        for item in range(10):
+            with lock:
+                pulled.append(item)
+            yield item
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = _map_bounded(executor, lambda item: item * item, items(), 2)
+
+        assert next(results) == 0
+        # Only the window was submitted before the first result was taken
+        assert pulled == [0, 1]
+        assert list(results) == [item * item for item in range(1, 10)]
+
+
+def test_relationship_rows_are_deduplicated(tmp_path, make_addon, monkeypatch):
+    # Both modules define x.partner extending res.partner, and one lists
+    # its dependency twice
+    make_addon("first", '{"name": "First", "depends": ["base", "base"]}',
+               {"partner.py": EXTENSION_SOURCE})
+    make_addon("second", '{"name": "Second", "depends": ["base"]}',
+               {"partner.py": EXTENSION_SOURCE})
+
+    captured = {}
+
+    def fake_create_relationships(connection, rows_by_phase, *args):
+        captured.update(rows_by_phase)
+        return {"created": 0, "errors": 0}
+
+    monkeypatch.setattr(indexer, "create_relationships_pipelined", fake_create_relationships)
+
+    stats = OdooIndexer(tmp_path / "addons", NullConnection(), max_workers=1).index_all()
+
+    assert stats["modules_indexed"] == 2
+    assert sorted(captured["module_dependencies"], key=lambda row: row["from"]) == [
+        {"from": "first", "to": "base"},
+        {"from": "second", "to": "base"},
+    ]
+    assert captured["model_inheritance"] == [{"from": "x.partner", "to": "res.partner"}]
+
+
+def test_load_errors_are_counted(tmp_path, sale_module, monkeypatch):
+    monkeypatch.setattr(
+        indexer, "create_models_with_relations_batch",
+        lambda connection, payload: {"created": 0, "errors": 4}
+    )
+    monkeypatch.setattr(
+        indexer, "create_relationships_pipelined",
+        lambda connection, rows_by_phase, *args: {"created": 0, "errors": 3}
+    )
+
+    stats = OdooIndexer(tmp_path / "addons", NullConnection(), max_workers=1).index_all()
+
+    assert stats["errors"] == 7
+
+
+def test_extraction_stops_when_loading_fails(tmp_path, make_addon, monkeypatch):
+    for name in ("a", "b", "c", "d", "e"):
+        make_addon(name, '{"name": "%s"}' % name, {"partner.py": EXTENSION_SOURCE})
+    monkeypatch.setenv("BATCH_SIZE", "1")
+    monkeypatch.setenv("MEGABATCH_SIZE", "1")
+
+    load_called = threading.Event()
+
+    def failing_load(connection, payload):
+        load_called.set()
+        raise RuntimeError("database unavailable")
+
+    extracted = []
+    extract = indexer._extract_module_data_worker
+
+    def counting_extract(task):
+        if extracted:
+            # Give the loader time to fail on the first payload
+            load_called.wait(5)
+            time.sleep(0.1)
+        extracted.append(task[0].name)
+        return extract(task)
+
+    monkeypatch.setattr(indexer, "create_models_with_relations_batch", failing_load)
+    monkeypatch.setattr(indexer, "_extract_module_data_worker", counting_extract)
+
+    with pytest.raises(RuntimeError, match="database unavailable"):
+        OdooIndexer(tmp_path / "addons", NullConnection(), max_workers=1).index_all()
+
+    assert len(extracted) < 5
+
+
+def test_hash_cache_keeps_entries_of_other_roots(tmp_path, sale_module):
+    other_file = str(tmp_path / "enterprise" / "sale" / "__manifest__.py")
+    removed_file = str(sale_module / "models" / "removed.py")
+    cache_path = tmp_path / ".cache" / "file_hashes.json"
+    save_hash_cache(cache_path, {other_file: [1, 2, "other"], removed_file: [1, 2, "removed"]})
+
+    odoo_indexer = OdooIndexer(tmp_path / "addons", NullConnection(), max_workers=1)
+    odoo_indexer.index_all()
+    odoo_indexer._save_hash_cache()
+
+    cache = load_hash_cache(cache_path)
+    assert cache[other_file] == [1, 2, "other"]
+    assert removed_file not in cache
+    assert str(sale_module / "models" / "sale_order.py") in cache
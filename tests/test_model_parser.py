@@ -0,0 +1,104 @@
+"""
+Tests for the Odoo model parser.
+"""
+
+import pytest
+
+from parsers import model_parser
+from parsers.model_parser import find_model_files, parse_model_file
+
+MODEL_SOURCE = '''
+from odoo import api, fields, models
+
+
+class SaleOrder(models.Model):
+    _name = "sale.order"
+    _description = "Sales Order"
+    _inherit = ["mail.thread"]
+
+    partner_id = fields.Many2one(comodel_name="res.partner", string="Customer", required=True)
+    amount = fields.Float(digits=(16, 2))
+
+
+class SaleWizard(models.TransientModel):
+    _name = "sale.wizard"
+'''
+
+HELPER_SOURCE = '''
+def compute_total(lines):
+    return sum(line.amount for line in lines)
+
+
+class Helper:
+    pass
+'''
+
+
+@pytest.fixture
+def model_file(tmp_path):
+    path = tmp_path / "sale" / "models" / "sale_order.py"
+    path.parent.mkdir(parents=True)
+    path.write_text(MODEL_SOURCE)
+    return path
+
+
+@pytest.fixture
+def helper_file(tmp_path):
+    path = tmp_path / "sale" / "models" / "tools.py"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(HELPER_SOURCE)
+    return path
+
+
+@pytest.mark.parametrize("prefilter", [True, False])
+def test_parse_model_file(model_file, prefilter):
+    models = parse_model_file(model_file, "sale", prefilter=prefilter)
+
+    assert [model["name"] for model in models] == ["sale.order", "sale.wizard"]
+    sale_order = models[0]
+    assert sale_order["inherit"] == ["mail.thread"]
+    fields = {field["name"]: field for field in sale_order["fields"]}
+    assert fields["partner_id"]["comodel_name"] == "res.partner"
+    assert fields["partner_id"]["required"] is True
+    assert fields["amount"]["digits"] == (16, 2)
+
+
+def test_prefilter_does_not_change_results(model_file):
+    assert parse_model_file(model_file, "sale") == parse_model_file(model_file, "sale", prefilter=False)
+
+
+def test_module_name_is_inferred_from_path(model_file):
+    (model, _) = parse_model_file(model_file)
+
+    assert model["module_name"] == "sale"
+
+
+@pytest.mark.parametrize("prefilter", [True, False])
+def test_file_without_models(helper_file, prefilter):
+    assert parse_model_file(helper_file, "sale", prefilter=prefilter) == []
+
+
+def test_prefilter_skips_parsing(helper_file, monkeypatch):
+    def fail(*args):
+        raise AssertionError("file without model class was parsed")
+
+    monkeypatch.setattr(model_parser, "_extract_models", fail)
+
+    assert parse_model_file(helper_file, "sale") == []
+
+
+def test_syntax_error_returns_no_models(tmp_path):
+    path = tmp_path / "broken.py"
+    path.write_text("class Broken(models.Model):\n    _name = 'x'\n  oops\n")
+
+    assert parse_model_file(path, "sale") == []
+
+
+def test_find_model_files(model_file, helper_file):
+    (model_file.parent / "__init__.py").write_text("")
+    (model_file.parent / "data.xml").write_text("<odoo/>")
+    (model_file.parent / "sub.py").mkdir()
+
+    found = sorted(path.name for path in find_model_files(model_file.parent.parent))
+
+    assert found == ["sale_order.py", "tools.py"]
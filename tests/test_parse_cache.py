@@ -0,0 +1,154 @@
+"""
+Tests for the on-disk parse result cache.
+"""
+
+import os
+import time
+
+import pytest
+
+from parsers import parse_cache
+from parsers.parse_cache import load_or_parse, prune_cache
+
+
+class CountingParser:
+    """Parse function returning a fixed result and counting its calls."""
+
+    def __init__(self, result):
+        self.result = result
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.result
+
+
+RESULT = {
+    "name": "sale.order",
+    "fields": [{"name": "amount", "digits": (16, 2), "selection": [("a", "A")]}],
+    "flags": (True, None, 1.5),
+}
+
+
+def _entries(cache_dir):
+    return sorted(cache_dir.rglob("*.json"))
+
+
+def test_result_is_parsed_once_and_round_trips(parse_cache_dir):
+    parse = CountingParser(RESULT)
+
+    first = load_or_parse(parse, b"source", "models")
+    second = load_or_parse(parse, b"source", "models")
+
+    assert parse.calls == 1
+    assert first == second == RESULT
+    # Tuples stay tuples: downstream serialization treats them differently
+    assert second["fields"][0]["digits"] == (16, 2)
+    assert type(second["fields"][0]["selection"][0]) is tuple
+    assert len(_entries(parse_cache_dir)) == 1
+
+
+def test_content_and_context_are_part_of_the_key(parse_cache_dir):
+    parse = CountingParser(RESULT)
+
+    load_or_parse(parse, b"source", "models", "a.py")
+    load_or_parse(parse, b"other source", "models", "a.py")
+    load_or_parse(parse, b"source", "models", "b.py")
+
+    assert parse.calls == 3
+
+
+def test_disabled_cache_always_parses():
+    parse = CountingParser(RESULT)
+
+    load_or_parse(parse, b"source", "models")
+    load_or_parse(parse, b"source", "models")
+
+    assert parse.calls == 2
+
+
+def test_entries_are_json(parse_cache_dir):
+    load_or_parse(CountingParser(RESULT), b"source", "models")
+
+    (entry,) = _entries(parse_cache_dir)
+    assert entry.read_text(encoding="utf-8").startswith("{")
+
+
+@pytest.mark.parametrize("result", [b"bytes", {"__tuple__": [1]}])
+def test_unrepresentable_result_is_not_stored(parse_cache_dir, result):
+    parse = CountingParser(result)
+
+    assert load_or_parse(parse, b"source", "models") == result
+    assert load_or_parse(parse, b"source", "models") == result
+
+    assert parse.calls == 2
+    assert _entries(parse_cache_dir) == []
+
+
+def test_unreadable_entry_is_a_miss(parse_cache_dir):
+    parse = CountingParser(RESULT)
+    load_or_parse(parse, b"source", "models")
+
+    (entry,) = _entries(parse_cache_dir)
+    entry.write_bytes(b"\x80garbage")
+
+    assert load_or_parse(parse, b"source", "models") == RESULT
+    assert parse.calls == 2
+
+
+def test_parse_errors_are_not_cached(parse_cache_dir):
+    def parse():
+        raise SyntaxError("invalid syntax")
+
+    with pytest.raises(SyntaxError):
+        load_or_parse(parse, b"source", "models")
+
+    assert _entries(parse_cache_dir) == []
+
+
+def test_prune_removes_entries_not_used_since(parse_cache_dir):
+    load_or_parse(CountingParser(RESULT), b"used", "models")
+    load_or_parse(CountingParser(RESULT), b"stale", "models")
+
+    an_hour_ago = time.time() - 3600
+    for entry in _entries(parse_cache_dir):
+        os.utime(entry, (an_hour_ago, an_hour_ago))
+
+    run_start = time.time()
+    # A hit marks the entry as used by the current run
+    load_or_parse(CountingParser(RESULT), b"used", "models")
+
+    assert prune_cache(run_start) == 1
+    assert parse_cache._stats == {"hits": 1, "misses": 2}
+
+    parse = CountingParser(RESULT)
+    load_or_parse(parse, b"used", "models")
+    load_or_parse(parse, b"stale", "models")
+    assert parse.calls == 1
+
+
+def test_prune_without_cache_is_a_no_op():
+    assert prune_cache(time.time()) == 0
+
+
+def test_prune_keeps_entries_of_other_roots(parse_cache_dir, tmp_path):
+    first_root = tmp_path / "addons"
+    other_root = tmp_path / "enterprise"
+    load_or_parse(CountingParser(RESULT), b"first", "models",
+                  source_path=str(first_root / "sale" / "models" / "a.py"))
+    load_or_parse(CountingParser(RESULT), b"other", "models",
+                  source_path=str(other_root / "sale" / "models" / "a.py"))
+    # A sibling directory sharing the root's name prefix is another root
+    load_or_parse(CountingParser(RESULT), b"sibling", "models",
+                  source_path=str(tmp_path / "addons-extra" / "sale" / "models" / "a.py"))
+
+    an_hour_ago = time.time() - 3600
+    for entry in _entries(parse_cache_dir):
+        os.utime(entry, (an_hour_ago, an_hour_ago))
+
+    assert prune_cache(time.time(), first_root) == 1
+
+    parse = CountingParser(RESULT)
+    load_or_parse(parse, b"other", "models")
+    load_or_parse(parse, b"sibling", "models")
+    assert parse.calls == 0
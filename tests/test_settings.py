@@ -0,0 +1,45 @@
+"""
+Tests for settings loading and reloading.
+"""
+
+import pytest
+
+from config.settings import get_settings
+
+
+@pytest.fixture(autouse=True)
+def default_batch_size(monkeypatch):
+    monkeypatch.delenv("BATCH_SIZE", raising=False)
+
+
+def test_settings_are_cached():
+    assert get_settings() is get_settings()
+
+
+def test_reload_builds_fresh_settings():
+    settings = get_settings()
+    settings.batch_size = 7
+
+    get_settings.cache_clear()
+    reloaded = get_settings()
+
+    assert reloaded is not settings
+    assert reloaded.batch_size == 50
+
+
+def test_reload_picks_up_environment_changes(monkeypatch):
+    assert get_settings().batch_size == 50
+
+    monkeypatch.setenv("BATCH_SIZE", "100")
+    # Cached until reloaded
+    assert get_settings().batch_size == 50
+
+    get_settings.cache_clear()
+    assert get_settings().batch_size == 100
+
+
+def test_invalid_environment_is_rejected(monkeypatch):
+    monkeypatch.setenv("BATCH_SIZE", "0")
+
+    with pytest.raises(ValueError, match="BATCH_SIZE"):
+        get_settings()
@@ -3,16 +3,35 @@ Utilities module for Odoo Tracker.
 
 This module provides helper functions for monitoring, caching,
 hashing, and other common operations.
+
+Exports are resolved on first access, so importing one helper (e.g. the
+CLI's setup_logger) does not also load psutil and the hashing backends.
 """
 
-from .monitoring import MemoryMonitor, check_memory_usage
-from .hashing import compute_file_hash, has_file_changed
-from .logger import setup_logger
-
-__all__ = [
-    "MemoryMonitor",
-    "check_memory_usage",
-    "compute_file_hash",
-    "has_file_changed",
-    "setup_logger",
-]
+import importlib
+
+# Exported name -> submodule defining it
+_EXPORTS = {
+    "MemoryMonitor": "monitoring",
+    "check_memory_usage": "monitoring",
+    "compute_file_hash": "hashing",
+    "compute_file_hash_cached": "hashing",
+    "check_file_hash": "hashing",
+    "has_file_changed": "hashing",
+    "load_hash_cache": "hashing",
+    "save_hash_cache": "hashing",
+    "setup_logger": "logger",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    """Import the submodule defining ``name`` on first access."""
+    submodule = _EXPORTS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f".{submodule}", __name__), name)
+    globals()[name] = value
+    return value
@@ -6,37 +6,112 @@ when files have changed, enabling incremental indexing.
 """
 
 import hashlib
+import json
 import logging
+import mmap
+import os
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Tuple, Union
+
+# Cache entry for one file: [mtime_ns, size, hash]
+HashCacheEntry = List[Union[int, str]]
 
 logger = logging.getLogger(__name__)
 
+# Note: xxhash is an optional, much faster non-cryptographic hash; change
+# detection does not need SHA256's guarantees
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+# Hashes are stored as "<algorithm>:<hex digest>", so values computed with
+# different algorithms (e.g. with and without xxhash installed) are never
+# compared with each other
+XXH3 = "xxh3"
+SHA256 = "sha256"
+DEFAULT_HASH_ALGORITHM = XXH3 if XXHASH_AVAILABLE else SHA256
+
+# Hex digest length of an unprefixed xxh3_64 value (SHA256 has 64)
+_XXH3_HEX_LENGTH = 16
+
+
+def hash_algorithm(file_hash: str) -> str:
+    """
+    Get the algorithm a stored file hash was computed with.
+
+    Values stored before hashes were prefixed are recognized by length:
+    16 hex digits for xxh3_64, 64 for SHA256.
+
+    Args:
+        file_hash: Hash as returned by compute_file_hash (or an older,
+            unprefixed value)
+
+    Returns:
+        Algorithm name (XXH3 or SHA256)
+    """
+    algorithm, separator, _ = file_hash.partition(":")
+    if separator:
+        return algorithm
+    return XXH3 if len(file_hash) == _XXH3_HEX_LENGTH else SHA256
+
+
+def normalize_file_hash(file_hash: str) -> str:
+    """
+    Add the algorithm prefix to a hash stored without one.
+
+    Args:
+        file_hash: Prefixed or unprefixed hash
+
+    Returns:
+        Hash in the "<algorithm>:<hex digest>" form
+    """
+    if ":" in file_hash:
+        return file_hash
+    return f"{hash_algorithm(file_hash)}:{file_hash}"
+
 
-def compute_file_hash(file_path: Path) -> str:
+def compute_file_hash(file_path: Path, algorithm: Optional[str] = None) -> str:
     """
-    Compute SHA256 hash of a file's contents.
+    Compute a hash of a file's contents.
 
-    Uses a streaming approach to handle large files efficiently
-    without loading them entirely into memory.
+    xxh3_64 is computed over a memory map of the file, so the OS page
+    cache serves the data without copying it. SHA256 is read in chunks to
+    avoid loading the entire file into memory.
 
     Args:
         file_path: Path to the file to hash
+        algorithm: XXH3 or SHA256 (default: XXH3 when xxhash is installed,
+            else SHA256)
 
     Returns:
-        Hexadecimal hash string
+        Hash string prefixed with its algorithm, e.g. "xxh3:<hex digest>"
 
     Raises:
         FileNotFoundError: If file doesn't exist
         PermissionError: If file can't be read
+        ValueError: If the algorithm is unknown or xxhash is not installed
     """
+    algorithm = algorithm or DEFAULT_HASH_ALGORITHM
+    if algorithm == XXH3 and not XXHASH_AVAILABLE:
+        raise ValueError("xxh3 hashes require the xxhash package")
+    if algorithm not in (XXH3, SHA256):
+        raise ValueError(f"Unknown hash algorithm: {algorithm}")
+
     if not file_path.exists():
         raise FileNotFoundError(f"File not found: {file_path}")
 
-    hash_obj = hashlib.sha256()
-
     try:
         with open(file_path, "rb") as f:
+            if algorithm == XXH3:
+                # Empty files cannot be memory-mapped
+                if os.fstat(f.fileno()).st_size == 0:
+                    return f"{XXH3}:{xxhash.xxh3_64(b'').hexdigest()}"
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    return f"{XXH3}:{xxhash.xxh3_64(mapped).hexdigest()}"
+
+            hash_obj = hashlib.sha256()
             # Read file in chunks to avoid loading entire file into memory
             for chunk in iter(lambda: f.read(8192), b""):
                 hash_obj.update(chunk)
@@ -44,7 +119,136 @@ def compute_file_hash(file_path: Path) -> str:
         logger.error(f"Permission denied reading file: {file_path}")
         raise
 
-    return hash_obj.hexdigest()
+    return f"{SHA256}:{hash_obj.hexdigest()}"
+
+
+def compute_file_hash_cached(
+    file_path: Path,
+    previous: Dict[str, HashCacheEntry],
+    current: Dict[str, HashCacheEntry],
+    algorithm: Optional[str] = None
+) -> str:
+    """
+    Compute a file hash, reusing the cached value when the file is unchanged.
+
+    The file is only read when its modification time or size differs from
+    the entry in ``previous``, or the entry was computed with another
+    algorithm; the resulting entry is recorded in ``current``.
+
+    Args:
+        file_path: Path to the file to hash
+        previous: Cache loaded from a previous run, keyed by file path
+        current: Cache being built for this run, keyed by file path
+        algorithm: Hash algorithm (see compute_file_hash)
+
+    Returns:
+        Hash string prefixed with its algorithm
+
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        PermissionError: If file can't be read
+    """
+    algorithm = algorithm or DEFAULT_HASH_ALGORITHM
+    key = str(file_path)
+    stat = file_path.stat()
+
+    entry = previous.get(key)
+    if (
+        entry is not None
+        and entry[0] == stat.st_mtime_ns
+        and entry[1] == stat.st_size
+        and hash_algorithm(entry[2]) == algorithm
+    ):
+        current[key] = entry
+        return normalize_file_hash(entry[2])
+
+    file_hash = compute_file_hash(file_path, algorithm)
+    current[key] = [stat.st_mtime_ns, stat.st_size, file_hash]
+    return file_hash
+
+
+def check_file_hash(
+    file_path: Path,
+    stored_hash: Optional[str],
+    previous: Dict[str, HashCacheEntry],
+    current: Dict[str, HashCacheEntry]
+) -> Tuple[str, bool]:
+    """
+    Hash a file and compare it with the hash stored when it was indexed.
+
+    The file is hashed with the algorithm of ``stored_hash`` when it is
+    available, so a hash stored by an older version (SHA256) or by an
+    environment without xxhash still matches an unchanged file. A changed
+    file gets a hash with the default algorithm, so stored values move to
+    it as files change.
+
+    Args:
+        file_path: Path to the file to hash
+        stored_hash: Hash stored for the file, or None if it is new
+        previous: Hash cache loaded from a previous run
+        current: Hash cache being built for this run
+
+    Returns:
+        Tuple of (hash to store, whether the file changed)
+    """
+    if stored_hash is None:
+        return compute_file_hash_cached(file_path, previous, current), True
+
+    algorithm = hash_algorithm(stored_hash)
+    if algorithm == XXH3 and not XXHASH_AVAILABLE:
+        # Not comparable here: treat the file as changed
+        return compute_file_hash_cached(file_path, previous, current), True
+
+    file_hash = compute_file_hash_cached(file_path, previous, current, algorithm)
+    if file_hash == normalize_file_hash(stored_hash):
+        return file_hash, False
+
+    if algorithm != DEFAULT_HASH_ALGORITHM:
+        file_hash = compute_file_hash_cached(file_path, previous, current)
+    return file_hash, True
+
+
+def load_hash_cache(cache_path: Path) -> Dict[str, HashCacheEntry]:
+    """
+    Load a file hash cache written by save_hash_cache.
+
+    Args:
+        cache_path: Path to the JSON cache file
+
+    Returns:
+        Dictionary mapping file path to [mtime_ns, size, hash], empty if the
+        cache is missing or unreadable
+    """
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable hash cache {cache_path}: {e}")
+        return {}
+
+
+def save_hash_cache(cache_path: Path, cache: Dict[str, HashCacheEntry]) -> None:
+    """
+    Atomically write a file hash cache to disk.
+
+    The cache is written to a temporary file, fsynced once and renamed over
+    the previous cache, so an interrupted run never leaves a partial file.
+
+    Args:
+        cache_path: Path to the JSON cache file
+        cache: Dictionary mapping file path to [mtime_ns, size, hash]
+    """
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(cache, f, separators=(",", ":"))
+        f.flush()
+        os.fsync(f.fileno())
+
+    os.replace(tmp_path, cache_path)
 
 
 def has_file_changed(file_path: Path, previous_hash: Optional[str]) -> bool:
@@ -61,9 +265,13 @@ def has_file_changed(file_path: Path, previous_hash: Optional[str]) -> bool:
     if previous_hash is None:
         return True
 
+    algorithm = hash_algorithm(previous_hash)
+    if algorithm == XXH3 and not XXHASH_AVAILABLE:
+        return True
+
     try:
-        current_hash = compute_file_hash(file_path)
-        return current_hash != previous_hash
+        current_hash = compute_file_hash(file_path, algorithm)
+        return current_hash != normalize_file_hash(previous_hash)
     except (FileNotFoundError, PermissionError) as e:
         logger.warning(f"Could not check file {file_path}: {e}")
         # Assume changed if we can't verify